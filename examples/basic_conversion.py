@@ -15,10 +15,12 @@ Requirements:
 
 import asyncio
 import sys
+import traceback
 from pathlib import Path
 
 from docling_hybrid import init_config, HybridPipeline
 from docling_hybrid.common.errors import DoclingHybridError
+from docling_hybrid.common.eventloop import install_uvloop
 
 
 async def basic_conversion(pdf_path: Path) -> None:
@@ -63,20 +65,20 @@ async def basic_conversion(pdf_path: Path) -> None:
         print(f"   ✓ Processed: {result.processed_pages}/{result.total_pages} pages")
         print(f"   ✓ Backend: {result.backend_name}")
         print(f"   ✓ Output: {result.output_path}")
-        print(f"   ✓ Content length: {len(result.markdown)} characters")
+        print(f"   ✓ Output size: {result.output_path.stat().st_size} bytes")
 
-        # Display first few lines of output
+        # Display first few lines of output (the full Markdown is on disk)
         print("\n📝 Preview (first 500 characters):")
         print("-" * 60)
-        print(result.markdown[:500])
-        if len(result.markdown) > 500:
+        print(result.preview)
+        if len(result.markdown) > len(result.preview):
             print("...")
         print("-" * 60)
 
         # Show per-page statistics
         print("\n📊 Per-page statistics:")
         for page_result in result.page_results:
-            chars = len(page_result.content)
+            chars = page_result.metadata["markdown_chars"]
             print(f"   Page {page_result.page_num:3d}: {chars:5d} characters")
 
         print(f"\n✅ Success! Markdown saved to: {output_path}")
@@ -91,13 +93,15 @@ async def basic_conversion(pdf_path: Path) -> None:
 
     except Exception as e:
         print(f"\n❌ Unexpected error: {e}")
-        import traceback
         traceback.print_exc()
         sys.exit(1)
 
 
 def main():
     """Main entry point."""
+    # Use uvloop for asyncio.run when installed
+    install_uvloop()
+
     # Check command line arguments
     if len(sys.argv) < 2:
         print("Usage: python examples/basic_conversion.py <pdf_file>")
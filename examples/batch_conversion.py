@@ -25,8 +25,10 @@ Requirements:
 
 import argparse
 import asyncio
+import stat
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Tuple
 
@@ -35,12 +37,19 @@ from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TimeRe
 from rich.table import Table
 
 from docling_hybrid import init_config, HybridPipeline
+from docling_hybrid.cli.batch import _scan_files
+from docling_hybrid.cli.progress_display import CoalescedProgress
 from docling_hybrid.common.errors import DoclingHybridError
+from docling_hybrid.common.eventloop import install_uvloop
 from docling_hybrid.orchestrator import ConversionResult
 
 
 console = Console()
 
+# Command-line paths are stat'ed in parallel above this many arguments
+STAT_POOL_THRESHOLD = 64
+STAT_POOL_WORKERS = 32
+
 
 async def convert_single_pdf(
     pipeline: HybridPipeline,
@@ -94,58 +103,76 @@ async def batch_convert(
         parallel: Number of files to process in parallel
 
     Returns:
-        List of (pdf_path, result or None, error_message or None) tuples
+        List of (pdf_path, result or None, error_message or None) tuples,
+        in the same order as pdf_paths
     """
     console.print(f"\n[bold blue]🚀 Starting batch conversion[/bold blue]")
     console.print(f"   Files: {len(pdf_paths)}")
     console.print(f"   Parallel: {parallel}")
     console.print(f"   Output: {output_dir or 'Same as input files'}\n")
 
-    # Initialize pipeline once for all conversions
-    config = init_config(Path("configs/local.toml"))
-    pipeline = HybridPipeline(config)
-
     # Create output directory if specified
     if output_dir:
         output_dir.mkdir(parents=True, exist_ok=True)
 
-    # Track results
-    results = []
-
-    # Process in batches
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        BarColumn(),
-        TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-        TimeRemainingColumn(),
-        console=console
-    ) as progress:
-        task = progress.add_task(
-            f"Converting {len(pdf_paths)} PDFs...",
-            total=len(pdf_paths)
-        )
+    # One slot per file, filled in by index as files finish
+    results: List[Tuple[Path, ConversionResult | None, str | None]] = [None] * len(pdf_paths)
 
-        # Process files in batches for parallel execution
-        for i in range(0, len(pdf_paths), parallel):
-            batch = pdf_paths[i:i + parallel]
+    # Bound concurrency with a semaphore instead of fixed-size batches, so a
+    # new file starts as soon as any slot frees up rather than waiting for the
+    # slowest file of the current batch.
+    semaphore = asyncio.Semaphore(parallel)
 
-            # Create tasks for this batch
+    # Initialize pipeline once for all conversions. Keeping it open for the
+    # whole batch lets every file share the backend's pooled HTTP connections.
+    config = init_config(Path("configs/local.toml"))
+    async with HybridPipeline(config) as pipeline:
+
+        async def convert_with_semaphore(index: int, pdf_path: Path) -> None:
+            """Convert a single PDF once a parallelism slot is available."""
+            async with semaphore:
+                results[index] = await convert_single_pdf(pipeline, pdf_path, output_dir)
+
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            BarColumn(),
+            TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
+            TimeRemainingColumn(),
+            console=console
+        ) as progress:
+            task = progress.add_task(
+                f"Converting {len(pdf_paths)} PDFs...",
+                total=len(pdf_paths)
+            )
+
+            # Submit all files up front; the semaphore limits how many run at
+            # once. convert_single_pdf catches its own errors, so no task
+            # raises here.
             tasks = [
-                convert_single_pdf(pipeline, pdf_path, output_dir)
-                for pdf_path in batch
+                asyncio.create_task(convert_with_semaphore(index, pdf_path))
+                for index, pdf_path in enumerate(pdf_paths)
             ]
 
-            # Run batch in parallel
-            batch_results = await asyncio.gather(*tasks)
-            results.extend(batch_results)
-
-            # Update progress
-            progress.update(task, advance=len(batch))
+            # Advance progress in completion order. Updates are coalesced so
+            # a burst of fast files doesn't cost one Rich update each.
+            updates = CoalescedProgress(progress, task)
+            for next_done in asyncio.as_completed(tasks):
+                await next_done
+                updates.advance()
+            updates.flush()
 
     return results
 
 
+def _stat_mode(path: Path) -> int:
+    """Return the st_mode of a path, or 0 if it cannot be stat'ed."""
+    try:
+        return path.stat().st_mode
+    except OSError:
+        return 0
+
+
 def collect_pdf_files(
     paths: List[Path],
     recursive: bool = False
@@ -153,6 +180,12 @@ def collect_pdf_files(
     """
     Collect all PDF files from the given paths.
 
+    Each path is stat'ed once. With many paths on the command line the
+    stats run in a thread pool (stat releases the GIL), and files and
+    directories are told apart from the cached result. Directories are
+    walked with the batch command's `os.scandir` walker, which needs no
+    extra stat per entry.
+
     Args:
         paths: List of file or directory paths
         recursive: Whether to search directories recursively
@@ -160,17 +193,22 @@ def collect_pdf_files(
     Returns:
         List of PDF file paths
     """
+    if len(paths) > STAT_POOL_THRESHOLD:
+        with ThreadPoolExecutor(max_workers=STAT_POOL_WORKERS) as executor:
+            modes = list(executor.map(_stat_mode, paths))
+    else:
+        modes = [_stat_mode(path) for path in paths]
+
     pdf_files = []
 
-    for path in paths:
-        if path.is_file() and path.suffix.lower() == ".pdf":
+    for path, mode in zip(paths, modes):
+        if stat.S_ISREG(mode) and path.suffix.lower() == ".pdf":
             pdf_files.append(path)
 
-        elif path.is_dir():
-            if recursive:
-                pdf_files.extend(path.rglob("*.pdf"))
-            else:
-                pdf_files.extend(path.glob("*.pdf"))
+        elif stat.S_ISDIR(mode):
+            pdf_files.extend(
+                Path(p) for p in _scan_files(str(path), "*.pdf", recursive)
+            )
 
     # Remove duplicates and sort
     pdf_files = sorted(set(pdf_files))
@@ -238,6 +276,9 @@ def print_summary(
 
 def main():
     """Main entry point."""
+    # Use uvloop for asyncio.run when installed
+    install_uvloop()
+
     parser = argparse.ArgumentParser(
         description="Convert multiple PDF files to Markdown in batch mode",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -315,8 +356,7 @@ Examples:
         sys.exit(130)
     except Exception as e:
         console.print(f"\n[red]❌ Fatal error: {e}[/red]")
-        import traceback
-        traceback.print_exc()
+        console.print_exception(show_locals=False)
         sys.exit(1)
 
     elapsed = time.time() - start_time
@@ -31,13 +31,16 @@ import argparse
 import asyncio
 import os
 import sys
+import traceback
 from pathlib import Path
 from typing import Any
 
 from docling_hybrid import init_config, get_config, HybridPipeline
 from docling_hybrid.backends import make_backend, list_backends
 from docling_hybrid.backends.base import OcrVlmBackend
+from docling_hybrid.backends.cache import CachingBackend
 from docling_hybrid.common.errors import DoclingHybridError
+from docling_hybrid.common.eventloop import install_uvloop
 from docling_hybrid.common.models import OcrBackendConfig
 
 
@@ -77,8 +80,8 @@ async def example_preconfigured_backend(pdf_path: Path, backend_name: str) -> No
         print(f"   Available: {backends}")
         sys.exit(1)
 
-    # Create backend
-    backend = make_backend(backend_config)
+    # Create backend, caching page results so re-runs skip repeated pages
+    backend = CachingBackend(make_backend(backend_config))
 
     # Create pipeline with this backend
     pipeline = HybridPipeline(config, backend=backend)
@@ -90,7 +93,8 @@ async def example_preconfigured_backend(pdf_path: Path, backend_name: str) -> No
     print(f"\n✅ Success!")
     print(f"   Pages: {result.processed_pages}")
     print(f"   Backend: {result.backend_name}")
-    print(f"   Content length: {len(result.markdown)} chars")
+    print(f"   Output size: {result.output_path.stat().st_size} bytes")
+    print(f"   Cache hits/misses: {result.metadata['cache_hits']}/{result.metadata['cache_misses']}")
 
 
 # =============================================================================
@@ -127,8 +131,8 @@ async def example_custom_config(pdf_path: Path, endpoint: str) -> None:
     print(f"  Model: {custom_config.model}")
     print(f"  Endpoint: {custom_config.base_url}")
 
-    # Create backend
-    backend = make_backend(custom_config)
+    # Create backend, caching page results so re-runs skip repeated pages
+    backend = CachingBackend(make_backend(custom_config))
 
     # Create pipeline
     pipeline = HybridPipeline(config, backend=backend)
@@ -140,6 +144,7 @@ async def example_custom_config(pdf_path: Path, endpoint: str) -> None:
     print(f"\n✅ Success!")
     print(f"   Pages: {result.processed_pages}")
     print(f"   Backend: {result.backend_name}")
+    print(f"   Cache hits/misses: {result.metadata['cache_hits']}/{result.metadata['cache_misses']}")
 
 
 # =============================================================================
@@ -265,6 +270,31 @@ async def example_local_vllm(pdf_path: Path, vllm_endpoint: str) -> None:
 # Example 5: Custom Backend Implementation (Advanced)
 # =============================================================================
 
+# Markdown returned by MockBackend for every page, filled in per call
+MOCK_PAGE_TEMPLATE = """# Mock Page {page_num}
+
+This is a mock conversion result for page {page_num}.
+
+## Document Information
+- Document ID: {doc_id}
+- Image size: {image_size} bytes
+- Backend: {backend}
+
+## Sample Table
+
+| Column 1 | Column 2 | Column 3 |
+|----------|----------|----------|
+| Value 1  | Value 2  | Value 3  |
+| Value 4  | Value 5  | Value 6  |
+
+## Sample Formula
+
+$$E = mc^2$$
+
+This is a mock result and not real OCR output.
+"""
+
+
 class MockBackend(OcrVlmBackend):
     """
     A mock backend for testing (doesn't call any external API).
@@ -290,7 +320,7 @@ class MockBackend(OcrVlmBackend):
 
     async def page_to_markdown(
         self,
-        image_bytes: bytes,
+        image_bytes: bytes | memoryview,
         page_num: int,
         doc_id: str
     ) -> str:
@@ -298,28 +328,12 @@ class MockBackend(OcrVlmBackend):
         print(f"   MockBackend: Converting page {page_num} (doc: {doc_id})")
 
         # Return mock markdown
-        return f"""# Mock Page {page_num}
-
-This is a mock conversion result for page {page_num}.
-
-## Document Information
-- Document ID: {doc_id}
-- Image size: {len(image_bytes)} bytes
-- Backend: {self.name}
-
-## Sample Table
-
-| Column 1 | Column 2 | Column 3 |
-|----------|----------|----------|
-| Value 1  | Value 2  | Value 3  |
-| Value 4  | Value 5  | Value 6  |
-
-## Sample Formula
-
-$$E = mc^2$$
-
-This is a mock result and not real OCR output.
-"""
+        return MOCK_PAGE_TEMPLATE.format_map({
+            "page_num": page_num,
+            "doc_id": doc_id,
+            "image_size": len(image_bytes),
+            "backend": self.name,
+        })
 
     async def table_to_markdown(self, image_bytes: bytes, meta: dict) -> str:
         """Mock table to markdown conversion."""
@@ -371,7 +385,7 @@ async def example_custom_implementation(pdf_path: Path) -> None:
     print(f"   Backend: {result.backend_name}")
     print(f"\n📝 Mock output preview:")
     print("-" * 60)
-    print(result.markdown[:500])
+    print(result.preview)
     print("-" * 60)
 
 
@@ -381,6 +395,9 @@ async def example_custom_implementation(pdf_path: Path) -> None:
 
 def main():
     """Main entry point."""
+    # Use uvloop for asyncio.run when installed
+    install_uvloop()
+
     parser = argparse.ArgumentParser(
         description="Custom backend configuration examples",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -472,7 +489,6 @@ def main():
 
     except Exception as e:
         print(f"\n❌ Unexpected error: {e}")
-        import traceback
         traceback.print_exc()
         sys.exit(1)
 
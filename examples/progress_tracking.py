@@ -20,10 +20,12 @@ Requirements:
 """
 
 import asyncio
+import functools
+import os
 import sys
 import time
 from pathlib import Path
-from typing import TextIO
+from typing import List, TextIO, Tuple
 
 from rich.console import Console
 from rich.live import Live
@@ -33,58 +35,124 @@ from rich.progress import (
     BarColumn,
     TextColumn,
     TimeRemainingColumn,
-    TimeElapsedColumn,
 )
 from rich.table import Table
+from rich.text import Text
 
 from docling_hybrid import init_config, HybridPipeline
+from docling_hybrid.cli.progress_display import CoalescedProgress
+from docling_hybrid.common.config import Config
 from docling_hybrid.common.errors import DoclingHybridError
-from docling_hybrid.renderer import get_page_count
+from docling_hybrid.common.eventloop import install_uvloop
+from docling_hybrid.renderer import RenderedPages, get_page_count, open_pdf
 
 
 console = Console()
 
+# Example headers and the separator printed between examples, styled once
+# rather than parsed from markup on every print
+EXAMPLE_HEADERS = {
+    1: Text.assemble("\n", ("Example 1: Simple Progress Bar", "bold blue"), "\n"),
+    2: Text.assemble("\n", ("Example 2: Detailed Progress with Statistics", "bold blue"), "\n"),
+    3: Text.assemble("\n", ("Example 3: Progress to Log File", "bold blue"), "\n"),
+    4: Text.assemble("\n", ("Example 4: Live Status Display", "bold blue"), "\n"),
+    5: Text.assemble("\n", ("Example 5: Future API (Sprint 2)", "bold blue"), "\n"),
+}
+SEPARATOR = Text("\n" + "=" * 60 + "\n")
+
+
+# Running all examples parses the config once and counts pages once per
+# file; run_all_examples also shares one pipeline across them.
+@functools.lru_cache(maxsize=1)
+def _get_config() -> Config:
+    """Load the example configuration once."""
+    return init_config(Path("configs/local.toml"))
+
+
+@functools.lru_cache(maxsize=None)
+def _get_page_count(pdf_path: Path) -> int:
+    """Count the pages of a PDF once per path."""
+    return get_page_count(pdf_path)
+
 
 # =============================================================================
 # Example 1: Simple Progress Bar
 # =============================================================================
 
-async def example_simple_progress(pdf_path: Path) -> None:
+class PageAdvanceCallback:
+    """Progress callback that advances a coalesced progress bar per page."""
+
+    def __init__(self, updates: CoalescedProgress):
+        self.updates = updates
+
+    def on_conversion_start(self, doc_id: str, total_pages: int) -> None:
+        pass
+
+    def on_page_start(self, page_num: int, total: int) -> None:
+        pass
+
+    def on_page_complete(self, page_num: int, total: int, result) -> None:
+        self.updates.advance()
+
+    def on_page_error(self, page_num: int, error: Exception) -> None:
+        self.updates.advance()
+
+    def on_conversion_complete(self, result) -> None:
+        pass
+
+    def on_conversion_error(self, error: Exception) -> None:
+        pass
+
+
+async def example_simple_progress(
+    pdf_path: Path,
+    pipeline: HybridPipeline | None = None,
+    rendered_pages: RenderedPages | None = None,
+) -> None:
     """
     Simple progress bar showing overall conversion progress.
 
     Args:
         pdf_path: Path to PDF file
+        pipeline: Pipeline to reuse (default: a new one)
+        rendered_pages: Page images rendered earlier (default: render)
     """
-    console.print("\n[bold blue]Example 1: Simple Progress Bar[/bold blue]\n")
+    console.print(EXAMPLE_HEADERS[1])
 
     # Initialize
-    config = init_config(Path("configs/local.toml"))
-    pipeline = HybridPipeline(config)
-
-    # Get page count
-    total_pages = get_page_count(pdf_path)
-    console.print(f"Converting {pdf_path.name} ({total_pages} pages)...\n")
-
-    # Create progress bar
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        BarColumn(),
-        TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-        TimeRemainingColumn(),
-        console=console,
-    ) as progress:
-        task = progress.add_task(
-            f"Converting...",
-            total=total_pages
-        )
+    pipeline = pipeline or HybridPipeline(_get_config())
 
-        # Convert PDF
-        result = await pipeline.convert_pdf(pdf_path)
+    # Open the PDF once; the page count, text layer and rendering all
+    # reuse this handle instead of re-parsing the file
+    with open_pdf(pdf_path) as pdf:
+        total_pages = len(pdf)
+        console.print(f"Converting {pdf.name} ({total_pages} pages)...\n")
 
-        # Complete progress
-        progress.update(task, completed=total_pages)
+        # Create progress bar
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            BarColumn(),
+            TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
+            TimeRemainingColumn(),
+            console=console,
+        ) as progress:
+            task = progress.add_task(
+                f"Converting...",
+                total=total_pages
+            )
+
+            # Advance per completed page, coalesced to ~20 updates/second
+            updates = CoalescedProgress(progress, task)
+            result = await pipeline.convert_pdf(
+                pdf,
+                progress_callback=PageAdvanceCallback(updates),
+                rendered_pages=rendered_pages,
+            )
+            updates.flush()
+
+            # Complete progress
+            progress.update(task, completed=total_pages)
 
     console.print(f"\n✅ Done! Processed {result.processed_pages} pages")
 
@@ -93,51 +161,40 @@ async def example_simple_progress(pdf_path: Path) -> None:
 # Example 2: Detailed Progress with Statistics
 # =============================================================================
 
-async def example_detailed_progress(pdf_path: Path) -> None:
+async def example_detailed_progress(
+    pdf_path: Path,
+    pipeline: HybridPipeline | None = None,
+    file_size: int | None = None,
+    rendered_pages: RenderedPages | None = None,
+) -> None:
     """
     Show detailed progress with per-page statistics.
 
     Args:
         pdf_path: Path to PDF file
+        pipeline: Pipeline to reuse (default: a new one)
+        file_size: Size of the PDF in bytes, if already known
+        rendered_pages: Page images rendered earlier (default: render)
     """
-    console.print("\n[bold blue]Example 2: Detailed Progress with Statistics[/bold blue]\n")
+    console.print(EXAMPLE_HEADERS[2])
 
     # Initialize
-    config = init_config(Path("configs/local.toml"))
-    pipeline = HybridPipeline(config)
+    pipeline = pipeline or HybridPipeline(_get_config())
 
     # Get page count
-    total_pages = get_page_count(pdf_path)
+    total_pages = _get_page_count(pdf_path)
 
     # Track statistics
-    start_time = time.time()
+    start_ns = time.monotonic_ns()
     page_times = []
 
-    # Create progress display
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        BarColumn(),
-        TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-        TextColumn("•"),
-        TimeElapsedColumn(),
-        TextColumn("•"),
-        TimeRemainingColumn(),
-        console=console,
-    ) as progress:
-        task = progress.add_task(
-            f"Converting {pdf_path.name}",
-            total=total_pages
-        )
-
-        # Convert PDF
-        result = await pipeline.convert_pdf(pdf_path)
-
-        # Update progress
-        progress.update(task, completed=total_pages)
+    # The statistics below are the point of this example; the bar would only
+    # ever jump from 0 to 100%, so just say what is happening
+    console.print(f"Converting {pdf_path.name} ({total_pages} pages)...")
+    result = await pipeline.convert_pdf(pdf_path, rendered_pages=rendered_pages)
 
     # Calculate statistics
-    elapsed = time.time() - start_time
+    elapsed = (time.monotonic_ns() - start_ns) / 1e9
     pages_per_sec = result.processed_pages / elapsed if elapsed > 0 else 0
 
     # Display results
@@ -148,13 +205,20 @@ async def example_detailed_progress(pdf_path: Path) -> None:
     table.add_column("Metric", style="cyan")
     table.add_column("Value", style="green")
 
-    table.add_row("Total pages", str(result.total_pages))
-    table.add_row("Processed pages", str(result.processed_pages))
-    table.add_row("Total time", f"{elapsed:.1f}s")
-    table.add_row("Pages per second", f"{pages_per_sec:.2f}")
-    table.add_row("Avg time per page", f"{elapsed/result.processed_pages:.1f}s")
-    table.add_row("Backend", result.backend_name)
-    table.add_row("Output size", f"{len(result.markdown)} chars")
+    processed = result.processed_pages
+    rows = [
+        ("Total pages", str(result.total_pages)),
+        ("Processed pages", str(processed)),
+        ("Total time", f"{elapsed:.1f}s"),
+        ("Pages per second", f"{pages_per_sec:.2f}"),
+        ("Avg time per page", f"{elapsed / processed:.1f}s" if processed else "-"),
+        ("Backend", result.backend_name),
+        ("Output size", f"{result.output_path.stat().st_size} bytes"),
+    ]
+    if file_size is not None:
+        rows.insert(0, ("File size", f"{file_size} bytes"))
+    for metric, value in rows:
+        table.add_row(metric, value)
 
     console.print(table)
 
@@ -163,23 +227,38 @@ async def example_detailed_progress(pdf_path: Path) -> None:
 # Example 3: Progress to Log File
 # =============================================================================
 
+# Buffer size for the progress log; lines are written out in blocks of
+# this size and once more when the log is closed
+LOG_BUFFER_BYTES = 1 << 16
+
+
 class FileProgressWriter:
-    """Write progress updates to a log file."""
+    """Write progress updates to a log file.
+
+    Lines are buffered and written in 64 KiB blocks rather than flushed one
+    at a time; the log is complete once the writer's context exits. The
+    trade-off is that a `tail -f` on the log lags behind, and lines still in
+    the buffer are lost if the process is killed. With `durable=True` the
+    file is also fsync'ed once on close, so a finished log survives a crash
+    of the machine.
+    """
 
-    def __init__(self, log_path: Path):
+    def __init__(self, log_path: Path, durable: bool = False):
         """
         Initialize file progress writer.
 
         Args:
             log_path: Path to log file
+            durable: fsync the log when closing it (default: False)
         """
         self.log_path = log_path
+        self.durable = durable
         self.file: TextIO | None = None
-        self.start_time = time.time()
+        self.start_time_ns = time.monotonic_ns()
 
     def __enter__(self) -> "FileProgressWriter":
         """Open log file."""
-        self.file = open(self.log_path, "w")
+        self.file = open(self.log_path, "w", buffering=LOG_BUFFER_BYTES)
         self.log("Progress log started")
         return self
 
@@ -187,77 +266,110 @@ class FileProgressWriter:
         """Close log file."""
         if self.file:
             self.log("Progress log ended")
+            if self.durable:
+                self.file.flush()
+                os.fsync(self.file.fileno())
             self.file.close()
 
     def log(self, message: str) -> None:
         """Write a log message with timestamp."""
         if self.file:
-            elapsed = time.time() - self.start_time
-            self.file.write(f"[{elapsed:7.2f}s] {message}\n")
-            self.file.flush()
+            self.file.write(f"{self._timestamp()} {message}\n")
+
+    def _timestamp(self) -> str:
+        """Format the time since the writer was created as a log prefix."""
+        elapsed_ns = time.monotonic_ns() - self.start_time_ns
+        return f"[{elapsed_ns / 1e9:7.2f}s]"
 
     def log_conversion_start(self, pdf_path: Path, total_pages: int) -> None:
         """Log conversion start."""
         self.log(f"Starting conversion: {pdf_path.name}")
         self.log(f"Total pages: {total_pages}")
 
+    @staticmethod
+    def page_complete_message(page_num: int, total: int, chars: int) -> str:
+        """Format a page completion message."""
+        progress_pct = (page_num / total) * 100
+        return f"Page {page_num}/{total} complete ({progress_pct:.1f}%) - {chars} chars"
+
     def log_page_complete(self, page_num: int, total: int, chars: int) -> None:
         """Log page completion."""
-        progress_pct = (page_num / total) * 100
-        self.log(f"Page {page_num}/{total} complete ({progress_pct:.1f}%) - {chars} chars")
+        self.log(self.page_complete_message(page_num, total, chars))
+
+    def log_pages_complete(self, pages: List[Tuple[int, int]], total: int) -> None:
+        """Log several completed pages with one timestamp and a single write.
+
+        Args:
+            pages: (page_num, chars) for each page to log
+            total: Total pages in the document
+        """
+        if self.file and pages:
+            prefix = f"{self._timestamp()} Page "
+            self.file.write("".join(
+                f"{prefix}{page_num}/{total} complete "
+                f"({page_num / total * 100:.1f}%) - {chars} chars\n"
+                for page_num, chars in pages
+            ))
 
     def log_conversion_complete(self, pages: int, total_time: float) -> None:
         """Log conversion completion."""
         self.log(f"Conversion complete: {pages} pages in {total_time:.1f}s")
 
 
-async def example_file_progress(pdf_path: Path, log_path: Path) -> None:
+async def example_file_progress(
+    pdf_path: Path,
+    log_path: Path,
+    pipeline: HybridPipeline | None = None,
+    rendered_pages: RenderedPages | None = None,
+) -> None:
     """
     Write progress updates to a log file.
 
     Args:
         pdf_path: Path to PDF file
         log_path: Path to log file
+        pipeline: Pipeline to reuse (default: a new one)
+        rendered_pages: Page images rendered earlier (default: render)
     """
-    console.print("\n[bold blue]Example 3: Progress to Log File[/bold blue]\n")
+    console.print(EXAMPLE_HEADERS[3])
     console.print(f"Log file: {log_path}\n")
 
     # Initialize
-    config = init_config(Path("configs/local.toml"))
-    pipeline = HybridPipeline(config)
+    pipeline = pipeline or HybridPipeline(_get_config())
 
     # Get page count
-    total_pages = get_page_count(pdf_path)
+    total_pages = _get_page_count(pdf_path)
 
     # Open log file
     with FileProgressWriter(log_path) as logger:
         logger.log_conversion_start(pdf_path, total_pages)
 
-        # Show progress in console too
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            BarColumn(),
-            console=console,
-        ) as progress:
-            task = progress.add_task("Converting...", total=total_pages)
-
-            # Convert PDF
-            start_time = time.time()
-            result = await pipeline.convert_pdf(pdf_path)
-            elapsed = time.time() - start_time
-
-            # Log each page result
-            for page_result in result.page_results:
-                logger.log_page_complete(
-                    page_result.page_num,
-                    total_pages,
-                    len(page_result.content)
-                )
-
-            # Complete
-            progress.update(task, completed=total_pages)
-            logger.log_conversion_complete(result.processed_pages, elapsed)
+        # No per-page progress reaches the console here, so a bar would
+        # only jump from 0 to 100%; say what is happening instead
+        console.print(f"Converting {pdf_path.name} ({total_pages} pages)...")
+
+        # Convert PDF
+        start_ns = time.monotonic_ns()
+        result = await pipeline.convert_pdf(pdf_path, rendered_pages=rendered_pages)
+        elapsed = (time.monotonic_ns() - start_ns) / 1e9
+
+        # Log about every 5% of pages, plus the last one, rather than
+        # a line per page. The results are all in memory already, so
+        # the lines are written in one go.
+        log_every = max(1, total_pages // 20)
+        logger.log_pages_complete(
+            [
+                (page_result.page_num, page_result.metadata["markdown_chars"])
+                for page_result in result.page_results
+                if page_result.page_num % log_every == 0
+                or page_result.page_num == total_pages
+            ],
+            total_pages,
+        )
+
+        # Complete
+        logger.log_conversion_complete(result.processed_pages, elapsed)
+        console.print("[green]✓ Complete[/green]")
 
     console.print(f"\n✅ Done! Check log file: {log_path}")
 
@@ -266,21 +378,26 @@ async def example_file_progress(pdf_path: Path, log_path: Path) -> None:
 # Example 4: Live Status Display
 # =============================================================================
 
-async def example_live_status(pdf_path: Path) -> None:
+async def example_live_status(
+    pdf_path: Path,
+    pipeline: HybridPipeline | None = None,
+    rendered_pages: RenderedPages | None = None,
+) -> None:
     """
     Show a live status display that updates in real-time.
 
     Args:
         pdf_path: Path to PDF file
+        pipeline: Pipeline to reuse (default: a new one)
+        rendered_pages: Page images rendered earlier (default: render)
     """
-    console.print("\n[bold blue]Example 4: Live Status Display[/bold blue]\n")
+    console.print(EXAMPLE_HEADERS[4])
 
     # Initialize
-    config = init_config(Path("configs/local.toml"))
-    pipeline = HybridPipeline(config)
+    pipeline = pipeline or HybridPipeline(_get_config())
 
     # Get page count
-    total_pages = get_page_count(pdf_path)
+    total_pages = _get_page_count(pdf_path)
 
     def create_status_table(
         current_page: int,
@@ -307,25 +424,29 @@ async def example_live_status(pdf_path: Path) -> None:
         return table
 
     # Start conversion with live display
-    start_time = time.time()
+    start_ns = time.monotonic_ns()
 
+    # The table only changes on state transitions, so redraw explicitly on
+    # each update instead of running Rich's auto-refresh thread
     with Live(
         create_status_table(0, total_pages, 0, "Starting..."),
         console=console,
-        refresh_per_second=4
+        auto_refresh=False,
     ) as live:
         # Simulate progress updates (in real Sprint 2, this will use ProgressCallback)
         live.update(
-            create_status_table(0, total_pages, 0, "Converting...")
+            create_status_table(0, total_pages, 0, "Converting..."),
+            refresh=True,
         )
 
         # Convert PDF
-        result = await pipeline.convert_pdf(pdf_path)
+        result = await pipeline.convert_pdf(pdf_path, rendered_pages=rendered_pages)
 
         # Final update
-        elapsed = time.time() - start_time
+        elapsed = (time.monotonic_ns() - start_ns) / 1e9
         live.update(
-            create_status_table(total_pages, total_pages, elapsed, "Complete")
+            create_status_table(total_pages, total_pages, elapsed, "Complete"),
+            refresh=True,
         )
 
     console.print(f"\n✅ Done! Processed {result.processed_pages} pages")
@@ -335,15 +456,8 @@ async def example_live_status(pdf_path: Path) -> None:
 # Example 5: Future API (Sprint 2 Progress Callbacks)
 # =============================================================================
 
-def show_future_api_example() -> None:
-    """
-    Show what the future progress callback API will look like (Sprint 2).
-
-    This is documentation only - the actual implementation is not yet available.
-    """
-    console.print("\n[bold blue]Example 5: Future API (Sprint 2)[/bold blue]\n")
-
-    example_code = '''
+# Code shown by example 5
+FUTURE_API_EXAMPLE = '''
 # This API will be available in Sprint 2 after Dev-03 completes progress callbacks
 
 from docling_hybrid.orchestrator.progress import ProgressCallback
@@ -386,8 +500,16 @@ result = await pipeline.convert_pdf(
 )
 '''
 
+
+def show_future_api_example() -> None:
+    """
+    Show what the future progress callback API will look like (Sprint 2).
+
+    This is documentation only - the actual implementation is not yet available.
+    """
+    console.print(EXAMPLE_HEADERS[5])
     console.print("[yellow]Future API (Sprint 2):[/yellow]")
-    console.print(example_code)
+    console.print(FUTURE_API_EXAMPLE)
     console.print("\n[cyan]This API is not yet implemented. Use Examples 1-4 for current progress tracking.[/cyan]")
 
 
@@ -395,28 +517,78 @@ result = await pipeline.convert_pdf(
 # Main
 # =============================================================================
 
+async def run_all_examples(
+    pdf_path: Path,
+    log_path: Path,
+    file_size: int | None = None,
+) -> None:
+    """
+    Run examples 1-5 in order on one event loop.
+
+    The examples share one pipeline, so the backend and its HTTP connections
+    are set up once, and the PDF is rendered once up front rather than by
+    every example. They run one after another rather than concurrently:
+    each writes the same output file, and Rich allows only one live display
+    at a time.
+
+    Args:
+        pdf_path: Path to PDF file
+        log_path: Path to log file for example 3
+        file_size: Size of the PDF in bytes, if already known
+    """
+    console.print("[bold]Running all examples...[/bold]")
+
+    async with HybridPipeline(_get_config()) as pipeline:
+        pages = await pipeline.render_pages(pdf_path)
+
+        await example_simple_progress(pdf_path, pipeline, pages)
+        console.print(SEPARATOR)
+
+        await example_detailed_progress(pdf_path, pipeline, file_size, pages)
+        console.print(SEPARATOR)
+
+        await example_file_progress(pdf_path, log_path, pipeline, pages)
+        console.print(SEPARATOR)
+
+        await example_live_status(pdf_path, pipeline, pages)
+        console.print(SEPARATOR)
+
+    show_future_api_example()
+
+
+USAGE_HELP = "\n".join([
+    "[red]Usage: python examples/progress_tracking.py <pdf_file> \\[example_num][/red]",
+    "\nExamples:",
+    "  1. Simple progress bar",
+    "  2. Detailed progress with statistics",
+    "  3. Progress to log file",
+    "  4. Live status display",
+    "  5. Future API documentation",
+    "\nRun all:",
+    "  python examples/progress_tracking.py <pdf_file>",
+    "\nRun specific example:",
+    "  python examples/progress_tracking.py <pdf_file> 2",
+])
+
+
 def main():
     """Main entry point."""
+    # Use uvloop for asyncio.run when installed
+    install_uvloop()
+
     if len(sys.argv) < 2:
-        console.print("[red]Usage: python examples/progress_tracking.py <pdf_file> [example_num][/red]")
-        console.print("\nExamples:")
-        console.print("  1. Simple progress bar")
-        console.print("  2. Detailed progress with statistics")
-        console.print("  3. Progress to log file")
-        console.print("  4. Live status display")
-        console.print("  5. Future API documentation")
-        console.print("\nRun all:")
-        console.print("  python examples/progress_tracking.py <pdf_file>")
-        console.print("\nRun specific example:")
-        console.print("  python examples/progress_tracking.py <pdf_file> 2")
+        console.print(USAGE_HELP)
         sys.exit(1)
 
+    # Check the file exists with a single stat, keeping its size for the
+    # statistics table, and resolve the path once for all examples
     pdf_path = Path(sys.argv[1])
-
-    # Check if file exists
-    if not pdf_path.exists():
+    try:
+        file_size = pdf_path.stat().st_size
+    except FileNotFoundError:
         console.print(f"[red]❌ Error: File not found: {pdf_path}[/red]")
         sys.exit(1)
+    pdf_path = pdf_path.resolve()
 
     # Get example number if provided
     example_num = int(sys.argv[2]) if len(sys.argv) > 2 else None
@@ -425,7 +597,7 @@ def main():
         if example_num == 1:
             asyncio.run(example_simple_progress(pdf_path))
         elif example_num == 2:
-            asyncio.run(example_detailed_progress(pdf_path))
+            asyncio.run(example_detailed_progress(pdf_path, file_size=file_size))
         elif example_num == 3:
             log_path = Path("conversion_progress.log")
             asyncio.run(example_file_progress(pdf_path, log_path))
@@ -435,22 +607,8 @@ def main():
             show_future_api_example()
         else:
             # Run all examples
-            console.print("[bold]Running all examples...[/bold]")
-
-            asyncio.run(example_simple_progress(pdf_path))
-            console.print("\n" + "="*60 + "\n")
-
-            asyncio.run(example_detailed_progress(pdf_path))
-            console.print("\n" + "="*60 + "\n")
-
             log_path = Path("conversion_progress.log")
-            asyncio.run(example_file_progress(pdf_path, log_path))
-            console.print("\n" + "="*60 + "\n")
-
-            asyncio.run(example_live_status(pdf_path))
-            console.print("\n" + "="*60 + "\n")
-
-            show_future_api_example()
+            asyncio.run(run_all_examples(pdf_path, log_path, file_size))
 
     except DoclingHybridError as e:
         console.print(f"\n[red]❌ Error: {e}[/red]")
@@ -462,8 +620,7 @@ def main():
 
     except Exception as e:
         console.print(f"\n[red]❌ Unexpected error: {e}[/red]")
-        import traceback
-        traceback.print_exc()
+        console.print_exception(show_locals=False)
         sys.exit(1)
 
 
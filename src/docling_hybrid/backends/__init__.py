@@ -5,8 +5,10 @@ This module provides the backend abstraction layer for OCR/VLM operations.
 Architecture:
     OcrVlmBackend (ABC)
     ├── OpenRouterNemotronBackend (implemented)
-    ├── DeepseekOcrVllmBackend (stub)
-    └── DeepseekOcrMlxBackend (stub)
+    ├── DeepSeekVLLMBackend (implemented, via make_backend("deepseek-vllm"))
+    ├── DeepSeekMLXBackend (implemented, via make_backend("deepseek-mlx"))
+    ├── DeepseekOcrVllmBackend (legacy stub, not used by make_backend)
+    └── DeepseekOcrMlxBackend (legacy stub, not used by make_backend)
 
 Usage:
     from docling_hybrid.backends import make_backend
@@ -24,7 +26,12 @@ Usage:
 """
 
 from docling_hybrid.backends.base import OcrVlmBackend
-from docling_hybrid.backends.factory import list_backends, make_backend, register_backend
+from docling_hybrid.backends.factory import (
+    list_backends,
+    make_backend,
+    register_backend,
+    resolve_backend_name,
+)
 from docling_hybrid.backends.openrouter_nemotron import OpenRouterNemotronBackend
 
 # Stubs are imported but raise NotImplementedError when used
@@ -38,6 +45,7 @@ __all__ = [
     "make_backend",
     "list_backends",
     "register_backend",
+    "resolve_backend_name",
     # Implementations
     "OpenRouterNemotronBackend",
     # Stubs
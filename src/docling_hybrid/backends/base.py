@@ -6,6 +6,8 @@ The interface is designed to support:
 1. Page-level OCR (minimal core)
 2. Table extraction (extended scope)
 3. Formula extraction (extended scope)
+4. Multi-page OCR in one request (optional, see
+   `supports_document_processing`)
 
 All methods are async to support concurrent processing.
 
@@ -24,10 +26,12 @@ Usage:
             pass
 """
 
+import asyncio
 from abc import ABC, abstractmethod
 from typing import Any
 
 from docling_hybrid.common.models import OcrBackendConfig
+from docling_hybrid.common.retry import SharedRateLimiter
 
 
 class OcrVlmBackend(ABC):
@@ -40,9 +44,14 @@ class OcrVlmBackend(ABC):
     Attributes:
         config: Backend configuration (model, URL, API key, etc.)
         name: Backend name (from config)
+        supports_document_processing: Whether `pages_to_markdown` sends
+            several pages in a single request (default: False)
+        rate_limiter: Backoff gate shared with other users of the backend,
+            set by the pipeline (default: None)
     
     Methods:
         page_to_markdown: Convert full page image to Markdown
+        pages_to_markdown: Convert several page images to Markdown
         table_to_markdown: Convert table image to Markdown table
         formula_to_latex: Convert formula image to LaTeX
     
@@ -54,6 +63,14 @@ class OcrVlmBackend(ABC):
         ...     doc_id="doc-123"
         ... )
     """
+
+    # Backends that override pages_to_markdown with a real multi-image
+    # request set this so the pipeline batches pages for them
+    supports_document_processing: bool = False
+
+    # Shared 429/503 backoff gate; HTTP backends wait on it before each
+    # request and trip it when throttled
+    rate_limiter: SharedRateLimiter | None = None
     
     def __init__(self, config: OcrBackendConfig) -> None:
         """Initialize the backend with configuration.
@@ -74,7 +91,7 @@ class OcrVlmBackend(ABC):
     @abstractmethod
     async def page_to_markdown(
         self,
-        image_bytes: bytes,
+        image_bytes: bytes | memoryview,
         page_num: int,
         doc_id: str,
     ) -> str:
@@ -85,7 +102,8 @@ class OcrVlmBackend(ABC):
         as GitHub-flavored Markdown.
         
         Args:
-            image_bytes: PNG image bytes of the rendered page
+            image_bytes: PNG image bytes of the rendered page (or a memoryview
+                over a pooled buffer)
             page_num: Page number (1-indexed) for context
             doc_id: Document identifier for logging/tracking
         
@@ -116,6 +134,54 @@ class OcrVlmBackend(ABC):
         """
         pass
     
+    async def pages_to_markdown(
+        self,
+        images: list[bytes | memoryview],
+        page_nums: list[int],
+        doc_id: str,
+    ) -> list[str]:
+        """Convert several page images to Markdown.
+
+        Backends whose model accepts multiple images per request override
+        this (and set `supports_document_processing`) to send all pages in
+        one request, amortizing per-request overhead and prompt prefill.
+        The default implementation calls `page_to_markdown` for all pages
+        concurrently; the number of requests actually in flight is bounded
+        by `rate_limiter` when one is set (shared across documents), and
+        otherwise by the HTTP connection pool. If a page fails, the
+        remaining ones are cancelled.
+
+        Args:
+            images: Image bytes of the rendered pages
+            page_nums: Page numbers (1-indexed), one per image
+            doc_id: Document identifier for logging/tracking
+
+        Returns:
+            Markdown for each page, in the order of `images`
+
+        Raises:
+            BackendError: If OCR/VLM processing fails for any page
+
+        Example:
+            >>> pages = await backend.pages_to_markdown(
+            ...     [page1_bytes, page2_bytes], [1, 2], "doc-123"
+            ... )
+            >>> len(pages)
+            2
+        """
+        try:
+            async with asyncio.TaskGroup() as group:
+                tasks = [
+                    group.create_task(
+                        self.page_to_markdown(image_bytes, page_num, doc_id)
+                    )
+                    for image_bytes, page_num in zip(images, page_nums)
+                ]
+        except BaseExceptionGroup as errors:
+            # Surface the first failure, as a single call would
+            raise errors.exceptions[0] from None
+        return [task.result() for task in tasks]
+
     @abstractmethod
     async def table_to_markdown(
         self,
@@ -0,0 +1,397 @@
+"""Content-addressed cache for OCR results.
+
+Re-running a conversion (retries, batch re-conversions, duplicate PDFs in a
+directory tree) renders byte-identical page images and would otherwise pay
+for a full VLM call per page again. `CachingBackend` wraps any backend and
+stores page, table and formula results on disk, keyed by a hash of the image
+plus the task, the backend, its prompts and the generation settings that
+affect the output.
+
+Key Features:
+- Works with any OcrVlmBackend (including FallbackChain-style wrappers)
+- Persistent across runs (one file per entry under the cache directory),
+  with disk reads and writes kept off the event loop
+- Identical images requested concurrently (repeated boilerplate pages of one
+  document) share a single inner call
+- Hit/miss counters for reporting, in total and per document
+
+Usage:
+    from docling_hybrid.backends import make_backend
+    from docling_hybrid.backends.cache import CachingBackend
+
+    backend = CachingBackend(make_backend(backend_config))
+    async with backend:
+        markdown = await backend.page_to_markdown(image_bytes, 1, "doc-123")
+    print(backend.hits, backend.misses)
+"""
+
+import asyncio
+import hashlib
+import os
+import sys
+import tempfile
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+from typing import Any
+
+from docling_hybrid.backends.base import OcrVlmBackend
+from docling_hybrid.common.logging import get_logger
+from docling_hybrid.common.retry import SharedRateLimiter
+
+try:
+    from blake3 import blake3 as _hasher
+except ImportError:
+    _hasher = hashlib.blake2b
+
+logger = get_logger(__name__)
+
+# Default on-disk location for cached page results
+DEFAULT_CACHE_DIR = Path("~/.cache/docling_hybrid/pages").expanduser()
+
+
+def _prompt_digest(backend: OcrVlmBackend) -> str:
+    """Hash the prompts of a backend.
+
+    Backends define their prompts as module-level `*_PROMPT` strings, so
+    the digest covers those of the backend's module; editing a prompt then
+    misses the cache instead of returning output generated for the old one.
+
+    Args:
+        backend: Backend whose prompts to hash
+
+    Returns:
+        First 16 hex characters of the digest
+    """
+    module = sys.modules.get(type(backend).__module__)
+    prompts = sorted(
+        (name, value)
+        for name, value in vars(module).items()
+        if name.endswith("_PROMPT") and isinstance(value, str)
+    ) if module is not None else []
+    hasher = hashlib.sha256()
+    for name, value in prompts:
+        hasher.update(f"{name}={value}\0".encode("utf-8"))
+    return hasher.hexdigest()[:16]
+
+
+class CachingBackend(OcrVlmBackend):
+    """Backend wrapper that caches OCR results on disk.
+
+    Cache keys combine a hash of the image with the task (page, table or
+    formula) and the name, prompts, model, temperature and max_tokens of the
+    wrapped backend, so changing any of those misses the cache instead of
+    returning stale output. A request whose image is already being converted
+    waits for that call instead of starting another one.
+
+    Attributes:
+        inner: Wrapped backend that performs the actual OCR
+        cache_dir: Directory holding cached results
+        hits: Number of requests served from the cache
+        misses: Number of requests forwarded to the inner backend
+
+    Example:
+        >>> backend = CachingBackend(make_backend(config))
+        >>> md = await backend.page_to_markdown(image_bytes, 1, "doc-123")
+        >>> md = await backend.page_to_markdown(image_bytes, 1, "doc-456")
+        >>> backend.hits, backend.misses
+        (1, 1)
+    """
+
+    def __init__(
+        self,
+        inner: OcrVlmBackend,
+        cache_dir: Path | None = None,
+    ) -> None:
+        """Initialize the caching wrapper.
+
+        Args:
+            inner: Backend to wrap
+            cache_dir: Cache directory (default: ~/.cache/docling_hybrid/pages)
+        """
+        super().__init__(inner.config)
+        self.name = inner.name
+        self.inner = inner
+        self.cache_dir = cache_dir or DEFAULT_CACHE_DIR
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.hits = 0
+        self.misses = 0
+
+        # Hits and misses by doc_id, for documents converted concurrently
+        self._doc_counts: dict[str, list[int]] = {}
+
+        # Key part shared by every entry of this backend
+        self._settings = (
+            f"{inner.name}|{_prompt_digest(inner)}|{self.config.model}"
+            f"|{self.config.temperature}|{self.config.max_tokens}"
+        )
+
+        # Inner calls in progress, by cache key
+        self._inflight: dict[str, asyncio.Future[str]] = {}
+
+    @property
+    def supports_document_processing(self) -> bool:  # type: ignore[override]
+        """Whether the inner backend sends several pages per request."""
+        return self.inner.supports_document_processing
+
+    @property
+    def rate_limiter(self) -> SharedRateLimiter | None:  # type: ignore[override]
+        """Rate limit gate of the inner backend."""
+        return self.inner.rate_limiter
+
+    @rate_limiter.setter
+    def rate_limiter(self, limiter: SharedRateLimiter | None) -> None:
+        self.inner.rate_limiter = limiter
+
+    def cache_key(self, image_bytes: bytes | memoryview, task: str = "page") -> str:
+        """Build the cache key for an image.
+
+        Args:
+            image_bytes: PNG image bytes of the page or crop
+            task: "page", "table" or "formula"
+
+        Returns:
+            Key of the form "<image hash>|<backend>|<prompt digest>|<model>
+            |<temperature>|<max_tokens>", followed by "|<task>" for tasks
+            other than "page"
+        """
+        key = f"{_hasher(image_bytes).hexdigest()}|{self._settings}"
+        return key if task == "page" else f"{key}|{task}"
+
+    def _count(self, doc_id: str | None, hits: int = 0, misses: int = 0) -> None:
+        """Add to the hit/miss counters, in total and for the document."""
+        self.hits += hits
+        self.misses += misses
+        if doc_id is not None:
+            counts = self._doc_counts.setdefault(doc_id, [0, 0])
+            counts[0] += hits
+            counts[1] += misses
+
+    def pop_doc_counts(self, doc_id: str) -> tuple[int, int]:
+        """Return and forget the hits and misses of one document.
+
+        Unlike differences of `hits` and `misses`, these are not mixed up
+        with other documents converted at the same time.
+
+        Args:
+            doc_id: Document identifier passed to the backend calls
+
+        Returns:
+            (hits, misses) recorded for the document
+        """
+        hits, misses = self._doc_counts.pop(doc_id, (0, 0))
+        return hits, misses
+
+    def _entry_path(self, key: str) -> Path:
+        """Map a cache key to its file, sharded by the first hash bytes."""
+        name = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return self.cache_dir / name[:2] / f"{name}.md"
+
+    def _read(self, key: str) -> str | None:
+        """Read a cached entry, or None if absent (blocking; run in a thread)."""
+        try:
+            return self._entry_path(key).read_text(encoding="utf-8")
+        except FileNotFoundError:
+            return None
+
+    def _read_many(self, keys: list[str]) -> list[str | None]:
+        """Read several cached entries in one thread hop."""
+        return [self._read(key) for key in keys]
+
+    def _write(self, key: str, markdown: str) -> None:
+        """Write an entry atomically so concurrent runs never see partial data.
+
+        Blocking; run in a thread.
+        """
+        path = self._entry_path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(markdown)
+            os.replace(tmp, path)
+        except OSError:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+
+    async def _cached_call(
+        self,
+        key: str,
+        task: str,
+        call: Callable[[], Awaitable[str]],
+        **log_context: Any,
+    ) -> str:
+        """Serve a result from cache, a pending identical call, or `call`.
+
+        The lookup is registered as in flight before the disk read, so
+        identical requests arriving while the file is read or the inner
+        call runs wait for it instead of reading or calling again.
+
+        Args:
+            key: Cache key from `cache_key`
+            task: Task name used in log events
+            call: Starts the inner backend call on a miss
+            **log_context: Fields added to log events; a `doc_id` among
+                them also attributes the request to that document
+
+        Returns:
+            Cached or freshly computed result
+
+        Raises:
+            BackendError: If the inner backend fails on a cache miss
+        """
+        doc_id = log_context.get("doc_id")
+        while True:
+            pending = self._inflight.get(key)
+            if pending is None:
+                break
+            try:
+                markdown = await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                if pending.cancelled():
+                    # The call we waited on was cancelled, not us; retry
+                    continue
+                raise
+            self._count(doc_id, hits=1)
+            logger.debug(f"{task}_cache_shared", **log_context)
+            return markdown
+
+        future: asyncio.Future[str] = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            cached = await asyncio.to_thread(self._read, key)
+            if cached is not None:
+                self._count(doc_id, hits=1)
+                logger.debug(f"{task}_cache_hit", **log_context)
+                future.set_result(cached)
+                return cached
+
+            self._count(doc_id, misses=1)
+            try:
+                markdown = await call()
+            except Exception as e:
+                future.set_exception(e)
+                # Waiters re-raise it; without waiters it must not be logged
+                future.exception()
+                raise
+            future.set_result(markdown)
+
+            # Requests arriving during the write share the finished future
+            try:
+                await asyncio.to_thread(self._write, key, markdown)
+            except OSError as e:
+                # A cache write failure must not fail the conversion
+                logger.warning(f"{task}_cache_write_failed", error=str(e), **log_context)
+            return markdown
+        except BaseException:
+            if not future.done():
+                future.cancel()
+            raise
+        finally:
+            del self._inflight[key]
+
+    async def page_to_markdown(
+        self,
+        image_bytes: bytes | memoryview,
+        page_num: int,
+        doc_id: str,
+    ) -> str:
+        """Convert a page to Markdown, serving repeated images from cache.
+
+        Args:
+            image_bytes: PNG image bytes of the rendered page
+            page_num: Page number (1-indexed)
+            doc_id: Document identifier
+
+        Returns:
+            Markdown content of the page
+
+        Raises:
+            BackendError: If the inner backend fails on a cache miss
+        """
+        return await self._cached_call(
+            self.cache_key(image_bytes),
+            "page",
+            lambda: self.inner.page_to_markdown(image_bytes, page_num, doc_id),
+            page_num=page_num,
+            doc_id=doc_id,
+        )
+
+    async def pages_to_markdown(
+        self,
+        images: list[bytes | memoryview],
+        page_nums: list[int],
+        doc_id: str,
+    ) -> list[str]:
+        """Convert several pages, forwarding only cache misses to the inner backend.
+
+        Args:
+            images: Image bytes of the rendered pages
+            page_nums: Page numbers (1-indexed), one per image
+            doc_id: Document identifier
+
+        Returns:
+            Markdown for each page, in the order of `images`
+
+        Raises:
+            BackendError: If the inner backend fails on the cache misses
+        """
+        keys = [self.cache_key(image) for image in images]
+        results = await asyncio.to_thread(self._read_many, keys)
+
+        missing = [i for i, cached in enumerate(results) if cached is None]
+        self._count(doc_id, hits=len(images) - len(missing), misses=len(missing))
+
+        if missing:
+            pages = await self.inner.pages_to_markdown(
+                [images[i] for i in missing],
+                [page_nums[i] for i in missing],
+                doc_id,
+            )
+            for i, markdown in zip(missing, pages):
+                results[i] = markdown
+                try:
+                    await asyncio.to_thread(self._write, keys[i], markdown)
+                except OSError as e:
+                    logger.warning(
+                        "page_cache_write_failed", page_num=page_nums[i], error=str(e)
+                    )
+
+        return results  # type: ignore[return-value]
+
+    async def table_to_markdown(
+        self,
+        image_bytes: bytes,
+        meta: dict[str, Any],
+    ) -> str:
+        """Convert a table crop to Markdown, serving repeated images from cache."""
+        return await self._cached_call(
+            self.cache_key(image_bytes, "table"),
+            "table",
+            lambda: self.inner.table_to_markdown(image_bytes, meta),
+            **meta,
+        )
+
+    async def formula_to_latex(
+        self,
+        image_bytes: bytes,
+        meta: dict[str, Any],
+    ) -> str:
+        """Convert a formula crop to LaTeX, serving repeated images from cache."""
+        return await self._cached_call(
+            self.cache_key(image_bytes, "formula"),
+            "formula",
+            lambda: self.inner.formula_to_latex(image_bytes, meta),
+            **meta,
+        )
+
+    async def health_check(self) -> bool:
+        """Check health of the inner backend."""
+        return await self.inner.health_check()
+
+    async def close(self) -> None:
+        """Close the inner backend."""
+        await self.inner.close()
+
+    def __repr__(self) -> str:
+        """String representation."""
+        return f"{self.__class__.__name__}(inner={self.inner!r}, cache_dir={str(self.cache_dir)!r})"
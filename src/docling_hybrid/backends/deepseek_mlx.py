@@ -0,0 +1,394 @@
+"""DeepSeek MLX backend implementation.
+
+This module provides a backend that runs a DeepSeek vision-language model
+in-process on Apple Silicon via MLX and the `mlx_vlm` Python API, with no
+server in between.
+
+The backend:
+- Loads the model once, on first use, quantizes full-precision weights to
+  `quantize_bits` (4 by default; decoding is bound by memory bandwidth), and
+  evaluates the parameters right away so the first page does not pay for
+  MLX's lazy materialization
+- Runs generation on a single dedicated thread, keeping the event loop free
+  and model calls serialized (the model is not safe for concurrent use)
+- Decodes page images in the default executor, so the next page is decoded
+  while the current one is generating, shrinking anything larger than
+  `vision_max_side` during decoding
+- Reuses the DeepSeek prompts of the vLLM backend
+
+Prerequisites:
+- macOS with Apple Silicon
+- `pip install docling-hybrid-ocr[mlx]` (mlx and mlx-vlm)
+- An MLX build of the model, e.g. a pre-quantized `mlx-community` repo
+  (quantizing on load works too, but needs memory for the full weights)
+
+Usage:
+    from docling_hybrid.backends import make_backend
+
+    config = OcrBackendConfig(
+        name="deepseek-mlx",
+        model="mlx-community/deepseek-vl2-small-4bit",
+        base_url="http://localhost",  # Required by the config, not used
+    )
+
+    async with make_backend(config) as backend:
+        markdown = await backend.page_to_markdown(image_bytes, page_num=1, doc_id="doc-123")
+"""
+
+import asyncio
+import io
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from PIL import Image
+
+from docling_hybrid.backends.base import OcrVlmBackend
+from docling_hybrid.backends.deepseek_vllm import (
+    FORMULA_DELIMITERS_RE,
+    FORMULA_TO_LATEX_PROMPT,
+    PAGE_TO_MARKDOWN_PROMPT,
+    TABLE_TO_MARKDOWN_PROMPT,
+)
+from docling_hybrid.common.errors import BackendError, ConfigurationError
+from docling_hybrid.common.logging import get_logger
+from docling_hybrid.common.models import OcrBackendConfig
+
+try:
+    import mlx.core as mx
+    import mlx.nn as nn
+    import mlx_vlm
+    from mlx_vlm.prompt_utils import apply_chat_template
+except ImportError:
+    mx = None
+    nn = None
+    mlx_vlm = None
+    apply_chat_template = None
+
+logger = get_logger(__name__)
+
+# Weights per quantization scale, as used by mlx-community conversions
+QUANTIZE_GROUP_SIZE = 64
+
+# Submodules left in full precision, as mlx_vlm's convert does: the vision
+# encoder and projector are small and lose accuracy when quantized
+UNQUANTIZED_MODULES = frozenset({"vision", "vision_model", "vision_tower", "projector"})
+
+
+def _should_quantize(path: str, module: Any) -> bool:
+    """Decide whether `nn.quantize` converts a layer.
+
+    Mirrors the class predicate of mlx_vlm's convert: only layers that can
+    be quantized, outside the vision modules, and whose input dimension is
+    a multiple of the group size (otherwise quantization fails).
+
+    Args:
+        path: Dotted path of the layer in the model
+        module: The layer
+
+    Returns:
+        True if the layer should be quantized
+    """
+    if not hasattr(module, "to_quantized"):
+        return False
+    if UNQUANTIZED_MODULES.intersection(path.split(".")):
+        return False
+    return bool(module.weight.shape[-1] % QUANTIZE_GROUP_SIZE == 0)
+
+
+class DeepSeekMLXBackend(OcrVlmBackend):
+    """DeepSeek backend running locally on Apple Silicon via MLX.
+
+    The model and processor are loaded lazily so that creating the backend
+    (e.g. from the factory or CLI) stays cheap and works without MLX
+    installed; a `ConfigurationError` is raised on first use instead.
+
+    Attributes:
+        config: Backend configuration
+        name: "deepseek-mlx"
+
+    Example:
+        >>> config = OcrBackendConfig(
+        ...     name="deepseek-mlx",
+        ...     model="mlx-community/deepseek-vl2-small-4bit",
+        ...     base_url="http://localhost",
+        ... )
+        >>> backend = DeepSeekMLXBackend(config)
+        >>> md = await backend.page_to_markdown(image_bytes, 1, "doc-123")
+    """
+
+    def __init__(self, config: OcrBackendConfig) -> None:
+        """Initialize the DeepSeek MLX backend.
+
+        Args:
+            config: Backend configuration
+        """
+        super().__init__(config)
+
+        # Model state (loaded on first use)
+        self._model: Any = None
+        self._processor: Any = None
+        self._model_config: Any = None
+        self._load_lock = asyncio.Lock()
+
+        # Single thread for loading and generation (created lazily)
+        self._executor: ThreadPoolExecutor | None = None
+
+        logger.info(
+            "backend_initialized",
+            backend=self.name,
+            model=config.model,
+        )
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Get or create the thread that runs all MLX calls."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="mlx"
+            )
+        return self._executor
+
+    def _load_model(self) -> None:
+        """Load and quantize the model and force its weights into memory.
+
+        Runs on the MLX thread. Layers that are already quantized are left
+        alone by `nn.quantize`, and `_should_quantize` keeps the vision
+        modules and layers of incompatible shape in full precision. MLX
+        arrays are lazy, so without the explicit
+        `mx.eval` the weights (and their quantization) would only be
+        computed during the first generation.
+        """
+        model, processor = mlx_vlm.load(self.config.model)
+        if self.config.quantize_bits is not None:
+            nn.quantize(
+                model,
+                group_size=QUANTIZE_GROUP_SIZE,
+                bits=self.config.quantize_bits,
+                class_predicate=_should_quantize,
+            )
+        mx.eval(model.parameters())
+        self._model_config = getattr(model, "config", None)
+        self._model, self._processor = model, processor
+
+    async def _ensure_model(self) -> None:
+        """Load the model on first use.
+
+        Raises:
+            ConfigurationError: If mlx or mlx-vlm is not installed
+        """
+        if self._model is not None:
+            return
+        if mlx_vlm is None:
+            raise ConfigurationError(
+                "The deepseek-mlx backend requires mlx and mlx-vlm",
+                details={
+                    "backend": self.name,
+                    "hint": "pip install docling-hybrid-ocr[mlx] (macOS on Apple Silicon)",
+                },
+            )
+
+        async with self._load_lock:
+            if self._model is None:
+                logger.info("mlx_model_loading", backend=self.name, model=self.config.model)
+                loop = asyncio.get_running_loop()
+                await loop.run_in_executor(self._get_executor(), self._load_model)
+                logger.info("mlx_model_loaded", backend=self.name, model=self.config.model)
+
+    @staticmethod
+    def _decode_image(
+        image_bytes: bytes | memoryview,
+        max_side: int | None = None,
+    ) -> Image.Image:
+        """Decode PNG or JPEG bytes to an RGB image; called in an executor.
+
+        Pages rendered by the pipeline already fit `max_side`. Larger images
+        (e.g. passed in directly) are shrunk here: for JPEG, `draft` lets
+        the decoder scale down by a power of two while decoding, so the
+        full-resolution image is never materialized.
+
+        Args:
+            image_bytes: PNG or JPEG image bytes
+            max_side: Optional cap on the longest side in pixels
+
+        Returns:
+            Decoded RGB image
+        """
+        encoded = Image.open(io.BytesIO(image_bytes))
+        if max_side is not None:
+            encoded.draft("RGB", (max_side, max_side))
+        image: Image.Image = encoded.convert("RGB")
+        if max_side is not None and max(image.size) > max_side:
+            image.thumbnail((max_side, max_side), Image.Resampling.BILINEAR)
+        return image
+
+    def _generate(self, prompt: str, image: Image.Image) -> str:
+        """Run generation for one decoded image; called on the MLX thread.
+
+        Args:
+            prompt: Instruction prompt
+            image: Decoded RGB image
+
+        Returns:
+            Generated text
+        """
+        formatted_prompt = apply_chat_template(
+            self._processor, self._model_config, prompt, num_images=1
+        )
+        output = mlx_vlm.generate(
+            self._model,
+            self._processor,
+            formatted_prompt,
+            image=[image],
+            max_tokens=self.config.max_tokens,
+            temperature=self.config.temperature,
+            verbose=False,
+        )
+        # Newer mlx-vlm versions return a result object, older ones a string
+        return str(getattr(output, "text", output))
+
+    async def _run(
+        self,
+        prompt: str,
+        image_bytes: bytes | memoryview,
+        context: dict[str, Any],
+    ) -> str:
+        """Generate text for one image without blocking the event loop.
+
+        Args:
+            prompt: Instruction prompt
+            image_bytes: PNG or JPEG image bytes
+            context: Logging context (doc_id, page_num, etc.)
+
+        Returns:
+            Generated text
+
+        Raises:
+            ConfigurationError: If mlx or mlx-vlm is not installed
+            BackendError: If generation fails
+        """
+        await self._ensure_model()
+
+        # Decoding is CPU work independent of the model, so it runs in the
+        # default executor rather than queueing behind generation
+        loop = asyncio.get_running_loop()
+        try:
+            image = await loop.run_in_executor(
+                None, self._decode_image, image_bytes, self.config.vision_max_side
+            )
+            return await loop.run_in_executor(
+                self._get_executor(), self._generate, prompt, image
+            )
+        except Exception as e:
+            logger.error("mlx_generation_failed", backend=self.name, error=str(e), **context)
+            raise BackendError(
+                f"MLX generation failed: {e}",
+                backend_name=self.name,
+                details=dict(context),
+            ) from e
+
+    async def close(self) -> None:
+        """Release the model and stop the MLX thread."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+        self._model = self._processor = self._model_config = None
+
+    async def page_to_markdown(
+        self,
+        image_bytes: bytes | memoryview,
+        page_num: int,
+        doc_id: str,
+    ) -> str:
+        """Convert a full page image to Markdown.
+
+        Args:
+            image_bytes: PNG image bytes of the rendered page
+            page_num: Page number (1-indexed)
+            doc_id: Document identifier
+
+        Returns:
+            Markdown string representing the page content
+
+        Raises:
+            BackendError: If OCR processing fails
+        """
+        logger.info(
+            "page_ocr_started",
+            backend=self.name,
+            doc_id=doc_id,
+            page_num=page_num,
+            image_size_kb=len(image_bytes) // 1024,
+        )
+
+        content = await self._run(
+            PAGE_TO_MARKDOWN_PROMPT,
+            image_bytes,
+            context={"doc_id": doc_id, "page_num": page_num},
+        )
+
+        logger.info(
+            "page_ocr_completed",
+            backend=self.name,
+            doc_id=doc_id,
+            page_num=page_num,
+            markdown_length=len(content),
+        )
+
+        return content
+
+    async def table_to_markdown(
+        self,
+        image_bytes: bytes,
+        meta: dict[str, Any],
+    ) -> str:
+        """Convert a table image to Markdown table syntax.
+
+        Args:
+            image_bytes: PNG image bytes of the cropped table
+            meta: Metadata (doc_id, page_num, etc.)
+
+        Returns:
+            Markdown table string
+        """
+        logger.info("table_ocr_started", backend=self.name, **meta)
+
+        content = await self._run(TABLE_TO_MARKDOWN_PROMPT, image_bytes, context=meta)
+
+        logger.info(
+            "table_ocr_completed",
+            backend=self.name,
+            table_length=len(content),
+            **meta,
+        )
+
+        return content
+
+    async def formula_to_latex(
+        self,
+        image_bytes: bytes,
+        meta: dict[str, Any],
+    ) -> str:
+        """Convert a formula image to LaTeX.
+
+        Args:
+            image_bytes: PNG image bytes of the cropped formula
+            meta: Metadata (doc_id, page_num, etc.)
+
+        Returns:
+            LaTeX string (without delimiters)
+        """
+        logger.info("formula_ocr_started", backend=self.name, **meta)
+
+        content = await self._run(FORMULA_TO_LATEX_PROMPT, image_bytes, context=meta)
+
+        # Clean up any accidental delimiters
+        match = FORMULA_DELIMITERS_RE.match(content)
+        content = match.group(2).strip() if match else content.strip()
+
+        logger.info(
+            "formula_ocr_completed",
+            backend=self.name,
+            latex_length=len(content),
+            **meta,
+        )
+
+        return content
@@ -100,7 +100,7 @@ class DeepseekOcrMlxBackend(OcrVlmBackend):
     
     async def page_to_markdown(
         self,
-        image_bytes: bytes,
+        image_bytes: bytes | memoryview,
         page_num: int,
         doc_id: str,
     ) -> str:
@@ -6,7 +6,9 @@ using DeepSeek-VL model via a local vLLM server with OpenAI-compatible API.
 The backend:
 - Connects to local vLLM server (typically http://localhost:8000)
 - Uses OpenAI-compatible chat completions endpoint
-- Encodes images as base64 data URLs
+- Encodes images as base64 data URLs, spliced into the request body as
+  bytes (off the event loop for large images)
+- Spreads requests over replicas, steering away from ones that just failed
 - Handles response parsing (string or list formats)
 - Provides specialized prompts for page, table, and formula extraction
 
@@ -24,7 +26,8 @@ Usage:
 """
 
 import asyncio
-import base64
+import re
+import time
 from typing import Any
 
 import aiohttp
@@ -36,12 +39,26 @@ from docling_hybrid.common.errors import (
     BackendTimeoutError,
     ConfigurationError,
 )
+from docling_hybrid.common.http import (
+    create_client_session,
+    image_data_url,
+    image_url_slot,
+    json_dumps_with_images_async,
+    json_loads,
+    read_error_body,
+)
 from docling_hybrid.common.logging import get_logger
 from docling_hybrid.common.models import OcrBackendConfig
-from docling_hybrid.common.retry import retry_with_rate_limit
+from docling_hybrid.common.retry import retry_with_rate_limit, should_retry_on_status
 
 logger = get_logger(__name__)
 
+# Timeout for the /v1/models health probe, which does not touch the model
+HEALTH_CHECK_TIMEOUT_S = 3.0
+
+# How long an endpoint that refused a connection or returned a 5xx is skipped
+ENDPOINT_COOLDOWN_S = 30.0
+
 
 # ============================================================================
 # Custom Exceptions
@@ -66,6 +83,35 @@ class RateLimitError(BackendResponseError):
         self.retry_after = retry_after
 
 
+# Exceptions retried by _post_chat (4xx responses are filtered out below)
+RETRYABLE_EXCEPTIONS = (
+    RateLimitError,
+    BackendResponseError,
+    BackendConnectionError,
+    BackendTimeoutError,
+)
+
+
+def _extract_retry_after(exc: Exception) -> float | None:
+    """Extract Retry-After delay from RateLimitError."""
+    if isinstance(exc, RateLimitError):
+        return exc.retry_after
+    return None
+
+
+def _is_retryable_error(exc: Exception) -> bool:
+    """Check if error should be retried."""
+    # Don't retry 4xx client errors (except 429 which is RateLimitError)
+    if isinstance(exc, BackendResponseError):
+        # Check if marked as non-retryable
+        if not getattr(exc, "_retryable", True):
+            return False
+        # Retry transient statuses (408, 429, 5xx gateway errors)
+        if exc.status_code is not None:
+            return should_retry_on_status(exc.status_code)
+    return True
+
+
 # ============================================================================
 # Prompts
 # ============================================================================
@@ -118,6 +164,9 @@ RULES:
 
 Output ONLY the LaTeX expression."""
 
+# A formula wrapped in matching $ or $$ delimiters, with surrounding whitespace
+FORMULA_DELIMITERS_RE = re.compile(r"\A\s*(\${1,2})(.*?)\1\s*\Z", re.DOTALL)
+
 
 class DeepSeekVLLMBackend(OcrVlmBackend):
     """OCR/VLM backend using DeepSeek-VL via local vLLM server.
@@ -131,6 +180,7 @@ class DeepSeekVLLMBackend(OcrVlmBackend):
     - Structured logging for debugging
     - Support for page, table, and formula extraction
     - Health check for server connectivity
+    - Least-busy dispatch across vLLM replicas (`replica_urls`)
 
     Configuration:
         The backend requires a running vLLM server. Start the server with:
@@ -187,6 +237,22 @@ class DeepSeekVLLMBackend(OcrVlmBackend):
         # HTTP client (created lazily)
         self._session: aiohttp.ClientSession | None = None
 
+        # Retry policy arguments that do not depend on the config
+        self._retry_kwargs: dict[str, Any] = {
+            "retryable_exceptions": RETRYABLE_EXCEPTIONS,
+            "rate_limit_exception_type": RateLimitError,
+            "extract_retry_after": _extract_retry_after,
+            "is_retryable": _is_retryable_error,
+            "jitter": True,
+        }
+
+        # Requests in flight per endpoint; base_url first so it wins ties
+        self._in_flight: dict[str, int] = dict.fromkeys(
+            [config.base_url, *config.replica_urls], 0
+        )
+        # Monotonic time until which a failing endpoint is skipped
+        self._cooldown_until: dict[str, float] = {}
+
         # Timeouts (vLLM can be slower for vision models)
         self._timeout = aiohttp.ClientTimeout(total=300)  # 5 minutes
 
@@ -195,12 +261,54 @@ class DeepSeekVLLMBackend(OcrVlmBackend):
             backend=self.name,
             model=config.model,
             base_url=config.base_url,
+            replicas=len(config.replica_urls),
         )
 
+    def _pick_url(self, tried: list[str] | None = None) -> str:
+        """Pick the endpoint with the fewest requests in flight.
+
+        Requests are assigned when they are sent, so a replica that
+        finishes early takes the next request instead of a fixed share.
+        Endpoints cooling down after a failure are skipped unless every
+        endpoint is, and a retry prefers endpoints it has not tried yet.
+
+        Args:
+            tried: Endpoints already used by earlier attempts of this request
+
+        Returns:
+            Endpoint URL to send the request to
+        """
+        now = time.monotonic()
+        candidates = [
+            url for url in self._in_flight
+            if self._cooldown_until.get(url, 0.0) <= now
+        ] or list(self._in_flight)
+        tried = tried or []
+        return min(candidates, key=lambda url: (url in tried, self._in_flight[url]))
+
+    def _mark_failed(self, url: str) -> None:
+        """Skip an endpoint for `ENDPOINT_COOLDOWN_S` after a failure.
+
+        Args:
+            url: Endpoint that refused a connection or returned a 5xx
+        """
+        self._cooldown_until[url] = time.monotonic() + ENDPOINT_COOLDOWN_S
+        if len(self._in_flight) > 1:
+            logger.warning(
+                "endpoint_cooling_down",
+                backend=self.name,
+                url=url,
+                cooldown_s=ENDPOINT_COOLDOWN_S,
+            )
+
     async def _get_session(self) -> aiohttp.ClientSession:
-        """Get or create HTTP session."""
+        """Get or create HTTP session.
+
+        The session (and its pool of keep-alive connections) is reused for
+        every request until the backend is closed.
+        """
         if self._session is None or self._session.closed:
-            self._session = aiohttp.ClientSession(timeout=self._timeout)
+            self._session = create_client_session(total_timeout_s=self._timeout.total)
         return self._session
 
     async def close(self) -> None:
@@ -209,33 +317,39 @@ class DeepSeekVLLMBackend(OcrVlmBackend):
             await self._session.close()
             self._session = None
 
-    def _encode_image(self, image_bytes: bytes) -> str:
+    def _encode_image(self, image_bytes: bytes | memoryview) -> str:
         """Encode image bytes to base64 data URL.
 
         Args:
-            image_bytes: PNG image bytes
+            image_bytes: PNG or JPEG image bytes
 
         Returns:
             Base64 data URL for use in API request
         """
-        b64 = base64.b64encode(image_bytes).decode("utf-8")
-        return f"data:image/png;base64,{b64}"
+        return image_data_url(image_bytes)
 
     def _build_messages(
         self,
         prompt: str,
-        image_bytes: bytes,
+        image_bytes: bytes | memoryview,
+        image_url: str | None = None,
     ) -> list[dict[str, Any]]:
         """Build OpenAI-style messages array with image.
 
+        The prompt text comes before the image so that requests share a
+        token prefix the server's prefix cache can reuse.
+
         Args:
             prompt: System/user prompt
             image_bytes: PNG image bytes
+            image_url: URL to use instead of encoding image_bytes, e.g. an
+                `image_url_slot` filled in when the body is serialized
 
         Returns:
             Messages array for chat completion API
         """
-        image_url = self._encode_image(image_bytes)
+        if image_url is None:
+            image_url = self._encode_image(image_bytes)
 
         return [
             {
@@ -257,16 +371,19 @@ class DeepSeekVLLMBackend(OcrVlmBackend):
 
     async def _post_chat_inner(
         self,
-        messages: list[dict[str, Any]],
+        body: bytes | bytearray,
         context: dict[str, Any],
+        tried: list[str] | None = None,
     ) -> str:
         """Inner method that performs the actual HTTP request.
 
         This method is wrapped by _post_chat which adds retry logic.
 
         Args:
-            messages: OpenAI-style messages array
+            body: Serialized chat completion request
             context: Logging context (doc_id, page_num, etc.)
+            tried: Endpoints used by earlier attempts; the endpoint picked
+                for this attempt is appended
 
         Returns:
             Text content from the response
@@ -277,20 +394,23 @@ class DeepSeekVLLMBackend(OcrVlmBackend):
             BackendResponseError: Invalid response (4xx, non-retryable 5xx)
             RateLimitError: Rate limit exceeded (429)
         """
-        payload = {
-            "model": self.config.model,
-            "messages": messages,
-            "temperature": self.config.temperature,
-            "max_tokens": self.config.max_tokens,
-        }
-
         session = await self._get_session()
 
+        # Hold back while another request's 429/503 backoff is in effect,
+        # or while the adaptive in-flight limit is reached
+        rate_limiter = self.rate_limiter
+        if rate_limiter is not None:
+            await rate_limiter.acquire()
+
+        url = self._pick_url(tried)
+        if tried is not None:
+            tried.append(url)
+        self._in_flight[url] += 1
         try:
             async with session.post(
-                self.config.base_url,
+                url,
                 headers=self.headers,
-                json=payload,
+                data=body,
             ) as response:
                 # Check for rate limiting (429)
                 if response.status == 429:
@@ -307,34 +427,41 @@ class DeepSeekVLLMBackend(OcrVlmBackend):
                                 **context,
                             )
 
-                    body = await response.text()
+                    if self.rate_limiter is not None:
+                        self.rate_limiter.trip(retry_after)
+
+                    error_body = await read_error_body(response)
                     raise RateLimitError(
                         f"API rate limit exceeded (429)",
                         backend_name=self.name,
                         retry_after=retry_after,
                         status_code=429,
-                        response_body=body[:500],  # Truncate for logging
+                        response_body=error_body,
                     )
 
                 # Check for server errors (5xx) - these are retryable
                 if 500 <= response.status < 600:
-                    body = await response.text()
+                    if response.status == 503 and self.rate_limiter is not None:
+                        self.rate_limiter.trip()
+                    self._mark_failed(url)
+
+                    error_body = await read_error_body(response)
                     raise BackendResponseError(
                         f"API server error {response.status}",
                         backend_name=self.name,
                         status_code=response.status,
-                        response_body=body[:500],
+                        response_body=error_body,
                     )
 
                 # Check for other client errors (4xx) - these are NOT retryable
                 if response.status >= 400 and response.status < 500:
-                    body = await response.text()
+                    error_body = await read_error_body(response)
                     # Use a different exception type for non-retryable errors
                     error = BackendResponseError(
                         f"API client error {response.status}",
                         backend_name=self.name,
                         status_code=response.status,
-                        response_body=body[:500],
+                        response_body=error_body,
                     )
                     # Mark as non-retryable
                     error._retryable = False
@@ -342,17 +469,17 @@ class DeepSeekVLLMBackend(OcrVlmBackend):
 
                 # Check for other non-200 statuses
                 if response.status != 200:
-                    body = await response.text()
+                    error_body = await read_error_body(response)
                     raise BackendResponseError(
                         f"API returned unexpected status {response.status}",
                         backend_name=self.name,
                         status_code=response.status,
-                        response_body=body[:500],
+                        response_body=error_body,
                     )
 
                 # Parse JSON
                 try:
-                    data = await response.json()
+                    data = await response.json(loads=json_loads)
                 except Exception as e:
                     raise BackendResponseError(
                         f"Failed to parse JSON response: {e}",
@@ -362,11 +489,16 @@ class DeepSeekVLLMBackend(OcrVlmBackend):
                 # Extract content
                 content = self._extract_content(data)
 
+                if self.rate_limiter is not None:
+                    self.rate_limiter.record_success()
+                self._cooldown_until.pop(url, None)
+
                 return content
 
         except aiohttp.ClientConnectorError as e:
+            self._mark_failed(url)
             raise BackendConnectionError(
-                f"Cannot connect to {self.config.base_url}",
+                f"Cannot connect to {url}",
                 backend_name=self.name,
                 details={"error": str(e)},
             ) from e
@@ -376,11 +508,16 @@ class DeepSeekVLLMBackend(OcrVlmBackend):
                 backend_name=self.name,
                 details=context,
             ) from e
+        finally:
+            self._in_flight[url] -= 1
+            if rate_limiter is not None:
+                rate_limiter.release()
 
     async def _post_chat(
         self,
         messages: list[dict[str, Any]],
         context: dict[str, Any] | None = None,
+        images: list[bytes | memoryview] | None = None,
     ) -> str:
         """Send chat completion request with automatic retry logic.
 
@@ -392,9 +529,15 @@ class DeepSeekVLLMBackend(OcrVlmBackend):
 
         Client errors (4xx except 429) are NOT retried.
 
+        The request body is serialized once and reused across retries, and
+        each retry goes to an endpoint this request has not tried yet when
+        replicas are configured.
+
         Args:
             messages: OpenAI-style messages array
             context: Logging context (doc_id, page_num, etc.)
+            images: Images whose data URLs fill the `image_url_slot`
+                placeholders in `messages`, in slot order
 
         Returns:
             Text content from the response
@@ -404,6 +547,14 @@ class DeepSeekVLLMBackend(OcrVlmBackend):
         """
         context = context or {}
 
+        payload = {
+            "model": self.config.model,
+            "messages": messages,
+            "temperature": self.config.temperature,
+            "max_tokens": self.config.max_tokens,
+        }
+        body = await json_dumps_with_images_async(payload, images or [])
+
         logger.debug(
             "api_request_started",
             backend=self.name,
@@ -412,45 +563,16 @@ class DeepSeekVLLMBackend(OcrVlmBackend):
             **context,
         )
 
-        def extract_retry_after(exc: Exception) -> float | None:
-            """Extract Retry-After delay from RateLimitError."""
-            if isinstance(exc, RateLimitError):
-                return exc.retry_after
-            return None
-
-        def is_retryable_error(exc: Exception) -> bool:
-            """Check if error should be retried."""
-            # Don't retry 4xx client errors (except 429 which is RateLimitError)
-            if isinstance(exc, BackendResponseError):
-                # Check if marked as non-retryable
-                if hasattr(exc, '_retryable') and not exc._retryable:
-                    return False
-                # Retry 5xx errors
-                if hasattr(exc, 'status_code'):
-                    return exc.status_code >= 500
-            return True
-
-        # Filter retryable exceptions
-        retryable_exceptions = tuple(
-            exc_type for exc_type in (
-                RateLimitError,
-                BackendResponseError,
-                BackendConnectionError,
-                BackendTimeoutError,
-            )
-        )
-
         # Wrap the inner call with retry logic
+        tried: list[str] = []
         try:
             content = await retry_with_rate_limit(
-                lambda: self._post_chat_inner(messages, context),
+                lambda: self._post_chat_inner(body, context, tried),
                 max_retries=self.config.max_retries,
                 initial_delay=self.config.retry_initial_delay,
                 exponential_base=self.config.retry_exponential_base,
                 max_delay=self.config.retry_max_delay,
-                retryable_exceptions=retryable_exceptions,
-                rate_limit_exception_type=RateLimitError,
-                extract_retry_after=extract_retry_after,
+                **self._retry_kwargs,
                 context={
                     "backend": self.name,
                     "model": self.config.model,
@@ -548,53 +670,103 @@ class DeepSeekVLLMBackend(OcrVlmBackend):
                 response_body=str(data)[:500],
             ) from e
 
+    def _models_url(self, url: str) -> str | None:
+        """Derive the `/v1/models` URL from a chat completions URL.
+
+        Args:
+            url: Chat completions endpoint (base_url or a replica)
+
+        Returns:
+            Models endpoint URL, or None if the URL has no "/v1/" segment
+        """
+        if "/v1/" not in url:
+            return None
+        return url.rsplit("/v1/", 1)[0] + "/v1/models"
+
     async def health_check(self) -> bool:
-        """Check if the vLLM server is healthy and responsive.
+        """Check if the vLLM servers are healthy and responsive.
+
+        Probes base_url and every replica. Endpoints that fail the probe are
+        put in cooldown so requests avoid them; the backend is healthy as
+        long as one endpoint answers.
+
+        Returns:
+            True if at least one endpoint is healthy, False otherwise
+        """
+        urls = list(self._in_flight)
+        results = await asyncio.gather(*(self._check_endpoint(url) for url in urls))
+        for url, healthy in zip(urls, results):
+            if healthy:
+                self._cooldown_until.pop(url, None)
+            else:
+                self._mark_failed(url)
+        return any(results)
+
+    async def _check_endpoint(self, url: str) -> bool:
+        """Check a single vLLM endpoint.
+
+        Lists the served models with `GET /v1/models`, which answers without
+        running the model. Servers without that endpoint (404) are probed
+        with a one-token chat completion instead.
 
-        Sends a minimal request to verify the server is running and accessible.
+        Args:
+            url: Chat completions endpoint to probe
 
         Returns:
-            True if server is healthy, False otherwise
+            True if the endpoint is healthy, False otherwise
         """
         try:
             session = await self._get_session()
 
-            # Simple health check: send a minimal request
-            # vLLM OpenAI-compatible API doesn't have a /health endpoint,
-            # so we use a minimal completion request
-            payload = {
-                "model": self.config.model,
-                "messages": [{"role": "user", "content": "test"}],
-                "max_tokens": 1,
-            }
-
-            async with session.post(
-                self.config.base_url,
-                headers=self.headers,
-                json=payload,
-                timeout=aiohttp.ClientTimeout(total=10),  # Short timeout for health check
-            ) as response:
-                # Accept 200 as healthy
-                # Even 4xx might be OK (e.g., model loading)
-                if response.status < 500:
-                    logger.debug(
-                        "health_check_passed",
-                        backend=self.name,
-                        status=response.status,
-                    )
-                    return True
-                else:
-                    logger.warning(
-                        "health_check_failed",
-                        backend=self.name,
-                        status=response.status,
-                    )
-                    return False
+            status = None
+            models_url = self._models_url(url)
+            if models_url is not None:
+                async with session.get(
+                    models_url,
+                    headers=self.headers,
+                    timeout=aiohttp.ClientTimeout(total=HEALTH_CHECK_TIMEOUT_S),
+                ) as response:
+                    status = response.status
+
+            if status is None or status == 404:
+                payload = {
+                    "model": self.config.model,
+                    "messages": [{"role": "user", "content": "test"}],
+                    "max_tokens": 1,
+                }
+
+                async with session.post(
+                    url,
+                    headers=self.headers,
+                    json=payload,
+                    timeout=aiohttp.ClientTimeout(total=10),  # Short timeout for health check
+                ) as response:
+                    status = response.status
+
+            # Accept 200 as healthy
+            # Even 4xx might be OK (e.g., model loading)
+            if status < 500:
+                logger.debug(
+                    "health_check_passed",
+                    backend=self.name,
+                    url=url,
+                    status=status,
+                )
+                return True
+            else:
+                logger.warning(
+                    "health_check_failed",
+                    backend=self.name,
+                    url=url,
+                    status=status,
+                )
+                return False
 
         except (aiohttp.ClientError, asyncio.TimeoutError) as e:
             logger.warning(
                 "health_check_error",
                 backend=self.name,
+                url=url,
                 error=str(e),
                 error_type=type(e).__name__,
             )
@@ -603,6 +775,7 @@ class DeepSeekVLLMBackend(OcrVlmBackend):
             logger.error(
                 "health_check_unexpected_error",
                 backend=self.name,
+                url=url,
                 error=str(e),
                 error_type=type(e).__name__,
             )
@@ -610,7 +783,7 @@ class DeepSeekVLLMBackend(OcrVlmBackend):
 
     async def page_to_markdown(
         self,
-        image_bytes: bytes,
+        image_bytes: bytes | memoryview,
         page_num: int,
         doc_id: str,
     ) -> str:
@@ -635,11 +808,16 @@ class DeepSeekVLLMBackend(OcrVlmBackend):
             image_size_kb=len(image_bytes) // 1024,
         )
 
-        messages = self._build_messages(PAGE_TO_MARKDOWN_PROMPT, image_bytes)
+        messages = self._build_messages(
+            PAGE_TO_MARKDOWN_PROMPT,
+            image_bytes,
+            image_url=image_url_slot(0),
+        )
 
         content = await self._post_chat(
             messages,
             context={"doc_id": doc_id, "page_num": page_num},
+            images=[image_bytes],
         )
 
         logger.info(
@@ -672,9 +850,13 @@ class DeepSeekVLLMBackend(OcrVlmBackend):
             **meta,
         )
 
-        messages = self._build_messages(TABLE_TO_MARKDOWN_PROMPT, image_bytes)
+        messages = self._build_messages(
+            TABLE_TO_MARKDOWN_PROMPT,
+            image_bytes,
+            image_url=image_url_slot(0),
+        )
 
-        content = await self._post_chat(messages, context=meta)
+        content = await self._post_chat(messages, context=meta, images=[image_bytes])
 
         logger.info(
             "table_ocr_completed",
@@ -705,16 +887,17 @@ class DeepSeekVLLMBackend(OcrVlmBackend):
             **meta,
         )
 
-        messages = self._build_messages(FORMULA_TO_LATEX_PROMPT, image_bytes)
+        messages = self._build_messages(
+            FORMULA_TO_LATEX_PROMPT,
+            image_bytes,
+            image_url=image_url_slot(0),
+        )
 
-        content = await self._post_chat(messages, context=meta)
+        content = await self._post_chat(messages, context=meta, images=[image_bytes])
 
         # Clean up any accidental delimiters
-        content = content.strip()
-        if content.startswith("$$") and content.endswith("$$"):
-            content = content[2:-2].strip()
-        elif content.startswith("$") and content.endswith("$"):
-            content = content[1:-1].strip()
+        match = FORMULA_DELIMITERS_RE.match(content)
+        content = match.group(2).strip() if match else content.strip()
 
         logger.info(
             "formula_ocr_completed",
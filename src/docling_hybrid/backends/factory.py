@@ -2,7 +2,9 @@
 
 This module provides the single entry point for creating backend instances.
 The factory maps backend names to their implementations and handles
-configuration validation.
+configuration validation. The special name "auto" picks the local DeepSeek
+backend for the machine: MLX on Apple Silicon when mlx-vlm is installed,
+vLLM otherwise.
 
 Usage:
     from docling_hybrid.backends import make_backend
@@ -20,25 +22,89 @@ Usage:
     from docling_hybrid.common.config import get_config
     config = get_config()
     backend = make_backend(config.backends.get_backend_config())
+
+    # Pick MLX or vLLM for this machine
+    name = resolve_backend_name("auto")  # "deepseek-mlx" on an M-series Mac
 """
 
+import importlib
+import importlib.util
+import platform
+import sys
+
 from docling_hybrid.backends.base import OcrVlmBackend
-from docling_hybrid.backends.deepseek_mlx_stub import DeepseekOcrMlxBackend
-from docling_hybrid.backends.deepseek_vllm import DeepSeekVLLMBackend
-from docling_hybrid.backends.openrouter_nemotron import OpenRouterNemotronBackend
 from docling_hybrid.common.errors import ConfigurationError
 from docling_hybrid.common.logging import get_logger
 from docling_hybrid.common.models import OcrBackendConfig
 
 logger = get_logger(__name__)
 
-# Registry of backend names to implementation classes
-BACKEND_REGISTRY: dict[str, type[OcrVlmBackend]] = {
-    "nemotron-openrouter": OpenRouterNemotronBackend,
-    "deepseek-vllm": DeepSeekVLLMBackend,
-    "deepseek-mlx": DeepseekOcrMlxBackend,
+# Registry of backend names to implementation classes. Built-in backends
+# are listed as (module, class name) and imported when first created, so
+# importing the factory does not load every backend's dependencies (MLX in
+# particular); the class then replaces the entry.
+BACKEND_REGISTRY: dict[str, type[OcrVlmBackend] | tuple[str, str]] = {
+    "nemotron-openrouter": (
+        "docling_hybrid.backends.openrouter_nemotron",
+        "OpenRouterNemotronBackend",
+    ),
+    "deepseek-vllm": ("docling_hybrid.backends.deepseek_vllm", "DeepSeekVLLMBackend"),
+    "deepseek-mlx": ("docling_hybrid.backends.deepseek_mlx", "DeepSeekMLXBackend"),
 }
 
+# Name resolved by resolve_backend_name to a backend for the current machine
+AUTO_BACKEND = "auto"
+
+
+def _mlx_available() -> bool:
+    """Whether this is Apple Silicon with mlx and mlx-vlm installed."""
+    return (
+        sys.platform == "darwin"
+        and platform.machine() == "arm64"
+        and importlib.util.find_spec("mlx") is not None
+        and importlib.util.find_spec("mlx_vlm") is not None
+    )
+
+
+def _backend_class(name: str) -> type[OcrVlmBackend]:
+    """Get the class registered under a name, importing it on first use.
+
+    Args:
+        name: Registered (lowercase) backend name
+
+    Returns:
+        Backend implementation class
+    """
+    entry = BACKEND_REGISTRY[name]
+    if isinstance(entry, tuple):
+        module_path, class_name = entry
+        entry = getattr(importlib.import_module(module_path), class_name)
+        BACKEND_REGISTRY[name] = entry
+    return entry
+
+
+def resolve_backend_name(name: str) -> str:
+    """Resolve "auto" to the local DeepSeek backend for this machine.
+
+    Args:
+        name: Backend name, possibly "auto"
+
+    Returns:
+        "deepseek-mlx" for "auto" on Apple Silicon with mlx-vlm installed,
+        "deepseek-vllm" for "auto" elsewhere, and any other name unchanged
+
+    Example:
+        >>> resolve_backend_name("auto")  # on Linux
+        'deepseek-vllm'
+        >>> resolve_backend_name("nemotron-openrouter")
+        'nemotron-openrouter'
+    """
+    if name.lower() != AUTO_BACKEND:
+        return name
+    resolved = "deepseek-mlx" if _mlx_available() else "deepseek-vllm"
+    logger.debug("backend_auto_selected", backend=resolved, machine=platform.machine())
+    return resolved
+
 
 def make_backend(config: OcrBackendConfig) -> OcrVlmBackend:
     """Create an OCR/VLM backend instance from configuration.
@@ -49,7 +115,7 @@ def make_backend(config: OcrBackendConfig) -> OcrVlmBackend:
     
     Args:
         config: Backend configuration containing:
-            - name: Backend identifier (must be in BACKEND_REGISTRY)
+            - name: Backend identifier (in BACKEND_REGISTRY, or "auto")
             - model: Model ID for the provider
             - base_url: API endpoint URL
             - Other provider-specific settings
@@ -62,8 +128,10 @@ def make_backend(config: OcrBackendConfig) -> OcrVlmBackend:
     
     Available Backends:
         - "nemotron-openrouter": OpenRouter API with Nemotron model (✓ implemented)
-        - "deepseek-vllm": DeepSeek-OCR via vLLM (stub)
-        - "deepseek-mlx": DeepSeek-OCR via MLX (stub)
+        - "deepseek-vllm": DeepSeek via a vLLM server (✓ implemented)
+        - "deepseek-mlx": DeepSeek via MLX on Apple Silicon (✓ implemented)
+        - "auto": "deepseek-mlx" when available, else "deepseek-vllm"; the
+          created backend carries the resolved name
     
     Examples:
         >>> config = OcrBackendConfig(
@@ -91,7 +159,10 @@ def make_backend(config: OcrBackendConfig) -> OcrVlmBackend:
         This ensures proper cleanup of HTTP sessions and other resources.
     """
     # Normalize name to lowercase for case-insensitive matching
-    name = config.name.lower()
+    requested = config.name.lower()
+    name = resolve_backend_name(requested)
+    if name != requested:
+        config = config.model_copy(update={"name": name})
     
     # Look up backend class
     if name not in BACKEND_REGISTRY:
@@ -105,7 +176,7 @@ def make_backend(config: OcrBackendConfig) -> OcrVlmBackend:
             }
         )
     
-    backend_class = BACKEND_REGISTRY[name]
+    backend_class = _backend_class(name)
     
     logger.info(
         "creating_backend",
@@ -31,7 +31,8 @@ Usage:
 """
 
 import asyncio
-from typing import Any, Callable
+import random
+from typing import Any
 
 from docling_hybrid.backends.base import OcrVlmBackend
 from docling_hybrid.common.errors import (
@@ -44,6 +45,16 @@ from docling_hybrid.common.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Client errors that would fail the same way on any backend (including
+# auth errors, 401/403); rate limits (429) do trigger fallback
+NO_FALLBACK_STATUS_CODES = frozenset(range(400, 500)) - {429}
+
+# Delay between attempts on the same backend: a random delay of up to
+# base * 2**attempt seconds, capped, so pages failing together do not
+# retry together
+RETRY_BASE_DELAY_S = 0.25
+RETRY_MAX_DELAY_S = 5.0
+
 
 class FallbackChain:
     """Manages backend fallback logic for resilient OCR processing.
@@ -112,6 +123,16 @@ class FallbackChain:
         # All backends in order
         self.all_backends = [primary] + self.fallbacks
 
+        # Backends get_healthy_backend can choose from, with whether each has
+        # a health check: backends after the first one without a health check
+        # (assumed healthy) can never be chosen
+        self._health_candidates: list[tuple[OcrVlmBackend, bool]] = []
+        for backend in self.all_backends:
+            has_health_check = hasattr(backend, 'health_check')
+            self._health_candidates.append((backend, has_health_check))
+            if not has_health_check:
+                break
+
         logger.info(
             "fallback_chain_initialized",
             primary_backend=primary.name,
@@ -138,21 +159,11 @@ class FallbackChain:
             )
             return False
 
-        # Special handling for BackendResponseError
+        # Client errors are not fixed by another backend; server errors,
+        # rate limits and responses without a status code are
         if isinstance(error, BackendResponseError):
             status_code = getattr(error, 'status_code', None)
-
-            # Don't fallback on auth errors (401, 403)
-            if status_code in (401, 403):
-                logger.debug(
-                    "auth_error_no_fallback",
-                    status_code=status_code,
-                    error=str(error),
-                )
-                return False
-
-            # Don't fallback on other 4xx errors (except 429 rate limit)
-            if status_code and 400 <= status_code < 500 and status_code != 429:
+            if status_code in NO_FALLBACK_STATUS_CODES:
                 logger.debug(
                     "client_error_no_fallback",
                     status_code=status_code,
@@ -160,32 +171,42 @@ class FallbackChain:
                 )
                 return False
 
-            # Fallback on 5xx server errors and rate limits
-            if status_code and (status_code >= 500 or status_code == 429):
-                logger.debug(
-                    "server_error_triggers_fallback",
-                    status_code=status_code,
-                    error=str(error),
-                )
-                return True
-
-        # Fallback on connection and timeout errors
+        # Fallback on connection, timeout and server errors
         return True
 
+    @staticmethod
+    def _retry_delay(error: Exception, attempt: int) -> float:
+        """Delay before retrying a backend after a failed attempt.
+
+        Args:
+            error: Exception from the failed attempt
+            attempt: Zero-based number of the failed attempt
+
+        Returns:
+            The server's Retry-After delay for rate limit errors that carry
+            one, otherwise a jittered exponential backoff; both capped at
+            `RETRY_MAX_DELAY_S` so a long Retry-After cannot stall the page
+            before the chain moves on to the next backend
+        """
+        retry_after = getattr(error, "retry_after", None)
+        if retry_after is not None:
+            return min(float(retry_after), RETRY_MAX_DELAY_S)
+        return random.uniform(0, min(RETRY_MAX_DELAY_S, RETRY_BASE_DELAY_S * 2**attempt))
+
     async def execute_with_fallback(
         self,
-        operation: Callable,
+        method_name: str,
         *args: Any,
-        **kwargs: Any,
+        context: dict[str, Any] | None = None,
     ) -> Any:
-        """Execute an operation with automatic fallback.
+        """Execute a backend method with automatic fallback.
 
         Tries each backend in order until one succeeds or all fail.
 
         Args:
-            operation: Async operation to execute (e.g., backend.page_to_markdown)
-            *args: Positional arguments for operation
-            **kwargs: Keyword arguments for operation
+            method_name: Backend method to call (e.g., "page_to_markdown")
+            *args: Positional arguments for the method
+            context: Logging context; not passed to the backends
 
         Returns:
             Result from successful backend
@@ -194,7 +215,7 @@ class FallbackChain:
             BackendError: If all backends fail
         """
         last_error: Exception | None = None
-        context = kwargs.get('context', {})
+        context = context or {}
 
         for backend_index, backend in enumerate(self.all_backends):
             is_primary = backend_index == 0
@@ -210,11 +231,10 @@ class FallbackChain:
             )
 
             # Try this backend with retries
+            method = getattr(backend, method_name)
             for attempt in range(self.max_attempts_per_backend):
                 try:
-                    # Execute operation with this backend
-                    # Replace 'self' in operation with current backend
-                    result = await operation(backend, *args, **kwargs)
+                    result = await method(*args)
 
                     # Success!
                     if not is_primary:
@@ -251,8 +271,7 @@ class FallbackChain:
                             error_type=type(e).__name__,
                             **context,
                         )
-                        # Small delay before retry
-                        await asyncio.sleep(0.5 * (attempt + 1))
+                        await asyncio.sleep(self._retry_delay(e, attempt))
                         continue
 
                     # All attempts for this backend failed
@@ -303,7 +322,10 @@ class FallbackChain:
     async def get_healthy_backend(self) -> OcrVlmBackend | None:
         """Get the first healthy backend in the chain.
 
-        Checks health of all backends and returns the first healthy one.
+        Health checks run concurrently, but results are taken in chain
+        order, so a healthy primary is still preferred over a fallback
+        that answers sooner. Checks still running once a backend is
+        chosen are cancelled.
 
         Returns:
             First healthy backend, or None if all unhealthy
@@ -313,38 +335,51 @@ class FallbackChain:
             total_backends=len(self.all_backends),
         )
 
-        for backend in self.all_backends:
-            # Check if backend has health_check method
-            if not hasattr(backend, 'health_check'):
-                logger.debug(
-                    "backend_no_health_check",
-                    backend_name=backend.name,
-                )
-                # Assume healthy if no health check
-                return backend
-
-            try:
-                is_healthy = await backend.health_check()
-
-                if is_healthy:
-                    logger.info(
-                        "healthy_backend_found",
+        checks: list[tuple[OcrVlmBackend, asyncio.Task[bool] | None]] = [
+            (
+                backend,
+                asyncio.create_task(backend.health_check()) if has_health_check else None,
+            )
+            for backend, has_health_check in self._health_candidates
+        ]
+
+        try:
+            for backend, check in checks:
+                if check is None:
+                    logger.debug(
+                        "backend_no_health_check",
                         backend_name=backend.name,
                     )
+                    # Assume healthy if no health check
                     return backend
-                else:
+
+                try:
+                    is_healthy = await check
+
+                    if is_healthy:
+                        logger.info(
+                            "healthy_backend_found",
+                            backend_name=backend.name,
+                        )
+                        return backend
+                    else:
+                        logger.warning(
+                            "backend_unhealthy",
+                            backend_name=backend.name,
+                        )
+
+                except Exception as e:
                     logger.warning(
-                        "backend_unhealthy",
+                        "health_check_error",
                         backend_name=backend.name,
+                        error=str(e),
+                        error_type=type(e).__name__,
                     )
-
-            except Exception as e:
-                logger.warning(
-                    "health_check_error",
-                    backend_name=backend.name,
-                    error=str(e),
-                    error_type=type(e).__name__,
-                )
+        finally:
+            pending = [check for _, check in checks if check is not None]
+            for check in pending:
+                check.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
 
         logger.error(
             "no_healthy_backends",
@@ -359,7 +394,7 @@ class FallbackChain:
 
     async def page_to_markdown(
         self,
-        image_bytes: bytes,
+        image_bytes: bytes | memoryview,
         page_num: int,
         doc_id: str,
     ) -> str:
@@ -376,11 +411,8 @@ class FallbackChain:
         Raises:
             BackendError: If all backends fail
         """
-        async def operation(backend: OcrVlmBackend, *args, **kwargs):
-            return await backend.page_to_markdown(*args, **kwargs)
-
         return await self.execute_with_fallback(
-            operation,
+            "page_to_markdown",
             image_bytes,
             page_num,
             doc_id,
@@ -404,11 +436,8 @@ class FallbackChain:
         Raises:
             BackendError: If all backends fail
         """
-        async def operation(backend: OcrVlmBackend, *args, **kwargs):
-            return await backend.table_to_markdown(*args, **kwargs)
-
         return await self.execute_with_fallback(
-            operation,
+            "table_to_markdown",
             image_bytes,
             meta,
             context={**meta, "operation": "table_to_markdown"},
@@ -431,11 +460,8 @@ class FallbackChain:
         Raises:
             BackendError: If all backends fail
         """
-        async def operation(backend: OcrVlmBackend, *args, **kwargs):
-            return await backend.formula_to_latex(*args, **kwargs)
-
         return await self.execute_with_fallback(
-            operation,
+            "formula_to_latex",
             image_bytes,
             meta,
             context={**meta, "operation": "formula_to_latex"},
@@ -8,6 +8,7 @@ The backend:
 - Builds OpenAI-style chat completion requests
 - Handles response parsing (string or list formats)
 - Provides specialized prompts for page, table, and formula extraction
+- Sends several pages in one request via `pages_to_markdown`
 
 Usage:
     from docling_hybrid.backends import make_backend
@@ -24,8 +25,8 @@ Usage:
 """
 
 import asyncio
-import base64
 import os
+import re
 from typing import Any
 
 import aiohttp
@@ -37,9 +38,17 @@ from docling_hybrid.common.errors import (
     BackendTimeoutError,
     ConfigurationError,
 )
+from docling_hybrid.common.http import (
+    create_client_session,
+    image_data_url,
+    image_url_slot,
+    json_dumps_with_images_async,
+    json_loads,
+    read_error_body,
+)
 from docling_hybrid.common.logging import get_logger
 from docling_hybrid.common.models import OcrBackendConfig
-from docling_hybrid.common.retry import retry_with_rate_limit
+from docling_hybrid.common.retry import retry_with_rate_limit, should_retry_on_status
 
 logger = get_logger(__name__)
 
@@ -67,6 +76,35 @@ class RateLimitError(BackendResponseError):
         self.retry_after = retry_after
 
 
+# Exceptions retried by _post_chat (4xx responses are filtered out below)
+RETRYABLE_EXCEPTIONS = (
+    RateLimitError,
+    BackendResponseError,
+    BackendConnectionError,
+    BackendTimeoutError,
+)
+
+
+def _extract_retry_after(exc: Exception) -> float | None:
+    """Extract Retry-After delay from RateLimitError."""
+    if isinstance(exc, RateLimitError):
+        return exc.retry_after
+    return None
+
+
+def _is_retryable_error(exc: Exception) -> bool:
+    """Check if error should be retried."""
+    # Don't retry 4xx client errors (except 429 which is RateLimitError)
+    if isinstance(exc, BackendResponseError):
+        # Check if marked as non-retryable
+        if not getattr(exc, "_retryable", True):
+            return False
+        # Retry transient statuses (408, 429, 5xx gateway errors)
+        if exc.status_code is not None:
+            return should_retry_on_status(exc.status_code)
+    return True
+
+
 # ============================================================================
 # Prompts
 # ============================================================================
@@ -91,6 +129,32 @@ RULES:
 
 Output ONLY the Markdown content. No preamble, no explanations."""
 
+PAGES_TO_MARKDOWN_PROMPT = """You are a document OCR system. The {count} images are pages {pages} of one document, in that order. Convert each page to GitHub-flavored Markdown.
+
+Start each page with a line containing only "## PAGE <number>" (for example "## PAGE {first}"), followed by that page's content. Output every page, even blank ones.
+
+RULES:
+1. Extract ALL text exactly as it appears - do not paraphrase or summarize
+2. Preserve document structure:
+   - Use # ## ### for headings based on visual hierarchy
+   - Use - or * for bullet lists
+   - Use 1. 2. 3. for numbered lists
+   - Use | syntax for tables
+   - Use $...$ for inline math, $$...$$ for block math
+3. For figures/images/charts: insert placeholder <FIGURE> (do not describe)
+4. For formulas: transcribe as LaTeX
+5. Do NOT:
+   - Add commentary or explanations
+   - Describe what you see
+   - Invent or hallucinate content
+   - Skip any text
+   - Merge content from different pages
+
+Output ONLY the Markdown content with the page markers. No preamble, no explanations."""
+
+# Page marker line emitted by the model in multi-page responses
+PAGE_MARKER_RE = re.compile(r"^## PAGE (\d+)[ \t]*$", re.MULTILINE)
+
 TABLE_TO_MARKDOWN_PROMPT = """You are a table OCR system. The image contains a single table.
 
 Convert it to a Markdown table using | pipe syntax.
@@ -119,6 +183,9 @@ RULES:
 
 Output ONLY the LaTeX expression."""
 
+# A formula wrapped in matching $ or $$ delimiters, with surrounding whitespace
+FORMULA_DELIMITERS_RE = re.compile(r"\A\s*(\${1,2})(.*?)\1\s*\Z", re.DOTALL)
+
 
 class OpenRouterNemotronBackend(OcrVlmBackend):
     """OCR/VLM backend using OpenRouter API with Nemotron model.
@@ -131,6 +198,7 @@ class OpenRouterNemotronBackend(OcrVlmBackend):
     - Automatic retry on transient failures
     - Structured logging for debugging
     - Support for page, table, and formula extraction
+    - Multi-page requests (several page images in one message)
     
     Configuration:
         The backend requires an API key, which can be provided via:
@@ -152,6 +220,8 @@ class OpenRouterNemotronBackend(OcrVlmBackend):
         >>> backend = OpenRouterNemotronBackend(config)
         >>> md = await backend.page_to_markdown(image_bytes, 1, "doc-123")
     """
+
+    supports_document_processing = True
     
     def __init__(self, config: OcrBackendConfig) -> None:
         """Initialize the OpenRouter Nemotron backend.
@@ -195,6 +265,15 @@ class OpenRouterNemotronBackend(OcrVlmBackend):
         # HTTP client (created lazily)
         self._session: aiohttp.ClientSession | None = None
         
+        # Retry policy arguments that do not depend on the config
+        self._retry_kwargs: dict[str, Any] = {
+            "retryable_exceptions": RETRYABLE_EXCEPTIONS,
+            "rate_limit_exception_type": RateLimitError,
+            "extract_retry_after": _extract_retry_after,
+            "is_retryable": _is_retryable_error,
+            "jitter": True,
+        }
+        
         # Timeouts (could be made configurable)
         self._timeout = aiohttp.ClientTimeout(total=180)  # 3 minutes
         
@@ -206,9 +285,13 @@ class OpenRouterNemotronBackend(OcrVlmBackend):
         )
     
     async def _get_session(self) -> aiohttp.ClientSession:
-        """Get or create HTTP session."""
+        """Get or create HTTP session.
+
+        The session (and its pool of keep-alive connections) is reused for
+        every request until the backend is closed.
+        """
         if self._session is None or self._session.closed:
-            self._session = aiohttp.ClientSession(timeout=self._timeout)
+            self._session = create_client_session(total_timeout_s=self._timeout.total)
         return self._session
     
     async def close(self) -> None:
@@ -217,33 +300,36 @@ class OpenRouterNemotronBackend(OcrVlmBackend):
             await self._session.close()
             self._session = None
     
-    def _encode_image(self, image_bytes: bytes) -> str:
+    def _encode_image(self, image_bytes: bytes | memoryview) -> str:
         """Encode image bytes to base64 data URL.
         
         Args:
-            image_bytes: PNG image bytes
+            image_bytes: PNG or JPEG image bytes
             
         Returns:
             Base64 data URL for use in API request
         """
-        b64 = base64.b64encode(image_bytes).decode("utf-8")
-        return f"data:image/png;base64,{b64}"
+        return image_data_url(image_bytes)
     
     def _build_messages(
         self,
         prompt: str,
-        image_bytes: bytes,
+        image_bytes: bytes | memoryview,
+        image_url: str | None = None,
     ) -> list[dict[str, Any]]:
         """Build OpenAI-style messages array with image.
         
         Args:
             prompt: System/user prompt
             image_bytes: PNG image bytes
+            image_url: URL to use instead of encoding image_bytes, e.g. an
+                `image_url_slot` filled in when the body is serialized
             
         Returns:
             Messages array for chat completion API
         """
-        image_url = self._encode_image(image_bytes)
+        if image_url is None:
+            image_url = self._encode_image(image_bytes)
         
         return [
             {
@@ -263,9 +349,55 @@ class OpenRouterNemotronBackend(OcrVlmBackend):
             }
         ]
     
+    def _build_multi_image_messages(
+        self,
+        prompt: str,
+        images: list[bytes | memoryview],
+    ) -> list[dict[str, Any]]:
+        """Build an OpenAI-style messages array with several images.
+        
+        The images are referenced by `image_url_slot` placeholders; pass
+        the same images to `_post_chat` to fill them in.
+        
+        Args:
+            prompt: System/user prompt
+            images: Image bytes, in the order the prompt refers to them
+            
+        Returns:
+            Messages array for chat completion API
+        """
+        content: list[dict[str, Any]] = [{"type": "text", "text": prompt}]
+        content.extend(
+            {"type": "image_url", "image_url": {"url": image_url_slot(index)}}
+            for index in range(len(images))
+        )
+        return [{"role": "user", "content": content}]
+
+    @staticmethod
+    def _split_pages(content: str, page_nums: list[int]) -> list[str] | None:
+        """Split a multi-page response on its "## PAGE n" markers.
+        
+        Args:
+            content: Model response
+            page_nums: Page numbers that were requested
+            
+        Returns:
+            Markdown per requested page, or None if the markers do not
+            match the requested pages exactly
+        """
+        markers = list(PAGE_MARKER_RE.finditer(content))
+        pages: dict[int, str] = {}
+        for i, marker in enumerate(markers):
+            end = markers[i + 1].start() if i + 1 < len(markers) else len(content)
+            pages[int(marker.group(1))] = content[marker.end():end].strip()
+        
+        if len(markers) != len(page_nums) or set(pages) != set(page_nums):
+            return None
+        return [pages[page_num] for page_num in page_nums]
+    
     async def _post_chat_inner(
         self,
-        messages: list[dict[str, Any]],
+        body: bytes | bytearray,
         context: dict[str, Any],
     ) -> str:
         """Inner method that performs the actual HTTP request.
@@ -273,7 +405,7 @@ class OpenRouterNemotronBackend(OcrVlmBackend):
         This method is wrapped by _post_chat which adds retry logic.
 
         Args:
-            messages: OpenAI-style messages array
+            body: Serialized chat completion request
             context: Logging context (doc_id, page_num, etc.)
 
         Returns:
@@ -285,20 +417,19 @@ class OpenRouterNemotronBackend(OcrVlmBackend):
             BackendResponseError: Invalid response (4xx, non-retryable 5xx)
             RateLimitError: Rate limit exceeded (429)
         """
-        payload = {
-            "model": self.config.model,
-            "messages": messages,
-            "temperature": self.config.temperature,
-            "max_tokens": self.config.max_tokens,
-        }
-
         session = await self._get_session()
 
+        # Hold back while another request's 429/503 backoff is in effect,
+        # or while the adaptive in-flight limit is reached
+        rate_limiter = self.rate_limiter
+        if rate_limiter is not None:
+            await rate_limiter.acquire()
+
         try:
             async with session.post(
                 self.config.base_url,
                 headers=self.headers,
-                json=payload,
+                data=body,
             ) as response:
                 # Check for rate limiting (429)
                 if response.status == 429:
@@ -315,35 +446,41 @@ class OpenRouterNemotronBackend(OcrVlmBackend):
                                 **context,
                             )
 
-                    body = await response.text()
+                    if self.rate_limiter is not None:
+                        self.rate_limiter.trip(retry_after)
+
+                    error_body = await read_error_body(response)
                     raise RateLimitError(
                         f"API rate limit exceeded (429)",
                         backend_name=self.name,
                         retry_after=retry_after,
                         status_code=429,
-                        response_body=body[:500],  # Truncate for logging
+                        response_body=error_body,
                     )
 
                 # Check for server errors (5xx) - these are retryable
                 if 500 <= response.status < 600:
-                    body = await response.text()
+                    if response.status == 503 and self.rate_limiter is not None:
+                        self.rate_limiter.trip()
+
+                    error_body = await read_error_body(response)
                     raise BackendResponseError(
                         f"API server error {response.status}",
                         backend_name=self.name,
                         status_code=response.status,
-                        response_body=body[:500],
+                        response_body=error_body,
                     )
 
                 # Check for other client errors (4xx) - these are NOT retryable
                 # We do NOT catch BackendResponseError in retry for 4xx
                 if response.status >= 400 and response.status < 500:
-                    body = await response.text()
+                    error_body = await read_error_body(response)
                     # Use a different exception type for non-retryable errors
                     error = BackendResponseError(
                         f"API client error {response.status}",
                         backend_name=self.name,
                         status_code=response.status,
-                        response_body=body[:500],
+                        response_body=error_body,
                     )
                     # Mark as non-retryable
                     error._retryable = False
@@ -351,17 +488,17 @@ class OpenRouterNemotronBackend(OcrVlmBackend):
 
                 # Check for other non-200 statuses
                 if response.status != 200:
-                    body = await response.text()
+                    error_body = await read_error_body(response)
                     raise BackendResponseError(
                         f"API returned unexpected status {response.status}",
                         backend_name=self.name,
                         status_code=response.status,
-                        response_body=body[:500],
+                        response_body=error_body,
                     )
 
                 # Parse JSON
                 try:
-                    data = await response.json()
+                    data = await response.json(loads=json_loads)
                 except Exception as e:
                     raise BackendResponseError(
                         f"Failed to parse JSON response: {e}",
@@ -371,6 +508,9 @@ class OpenRouterNemotronBackend(OcrVlmBackend):
                 # Extract content
                 content = self._extract_content(data)
 
+                if self.rate_limiter is not None:
+                    self.rate_limiter.record_success()
+
                 return content
 
         except aiohttp.ClientConnectorError as e:
@@ -385,11 +525,15 @@ class OpenRouterNemotronBackend(OcrVlmBackend):
                 backend_name=self.name,
                 details=context,
             ) from e
+        finally:
+            if rate_limiter is not None:
+                rate_limiter.release()
 
     async def _post_chat(
         self,
         messages: list[dict[str, Any]],
         context: dict[str, Any] | None = None,
+        images: list[bytes | memoryview] | None = None,
     ) -> str:
         """Send chat completion request with automatic retry logic.
 
@@ -401,9 +545,13 @@ class OpenRouterNemotronBackend(OcrVlmBackend):
 
         Client errors (4xx except 429) are NOT retried.
 
+        The request body is serialized once and reused across retries.
+
         Args:
             messages: OpenAI-style messages array
             context: Logging context (doc_id, page_num, etc.)
+            images: Images whose data URLs fill the `image_url_slot`
+                placeholders in `messages`, in slot order
 
         Returns:
             Text content from the response
@@ -413,6 +561,14 @@ class OpenRouterNemotronBackend(OcrVlmBackend):
         """
         context = context or {}
 
+        payload = {
+            "model": self.config.model,
+            "messages": messages,
+            "temperature": self.config.temperature,
+            "max_tokens": self.config.max_tokens,
+        }
+        body = await json_dumps_with_images_async(payload, images or [])
+
         logger.debug(
             "api_request_started",
             backend=self.name,
@@ -421,45 +577,15 @@ class OpenRouterNemotronBackend(OcrVlmBackend):
             **context,
         )
 
-        def extract_retry_after(exc: Exception) -> float | None:
-            """Extract Retry-After delay from RateLimitError."""
-            if isinstance(exc, RateLimitError):
-                return exc.retry_after
-            return None
-
-        def is_retryable_error(exc: Exception) -> bool:
-            """Check if error should be retried."""
-            # Don't retry 4xx client errors (except 429 which is RateLimitError)
-            if isinstance(exc, BackendResponseError):
-                # Check if marked as non-retryable
-                if hasattr(exc, '_retryable') and not exc._retryable:
-                    return False
-                # Retry 5xx errors
-                if hasattr(exc, 'status_code'):
-                    return exc.status_code >= 500
-            return True
-
-        # Filter retryable exceptions
-        retryable_exceptions = tuple(
-            exc_type for exc_type in (
-                RateLimitError,
-                BackendResponseError,
-                BackendConnectionError,
-                BackendTimeoutError,
-            )
-        )
-
         # Wrap the inner call with retry logic
         try:
             content = await retry_with_rate_limit(
-                lambda: self._post_chat_inner(messages, context),
+                lambda: self._post_chat_inner(body, context),
                 max_retries=self.config.max_retries,
                 initial_delay=self.config.retry_initial_delay,
                 exponential_base=self.config.retry_exponential_base,
                 max_delay=self.config.retry_max_delay,
-                retryable_exceptions=retryable_exceptions,
-                rate_limit_exception_type=RateLimitError,
-                extract_retry_after=extract_retry_after,
+                **self._retry_kwargs,
                 context={
                     "backend": self.name,
                     "model": self.config.model,
@@ -618,7 +744,7 @@ class OpenRouterNemotronBackend(OcrVlmBackend):
 
     async def page_to_markdown(
         self,
-        image_bytes: bytes,
+        image_bytes: bytes | memoryview,
         page_num: int,
         doc_id: str,
     ) -> str:
@@ -643,11 +769,16 @@ class OpenRouterNemotronBackend(OcrVlmBackend):
             image_size_kb=len(image_bytes) // 1024,
         )
         
-        messages = self._build_messages(PAGE_TO_MARKDOWN_PROMPT, image_bytes)
+        messages = self._build_messages(
+            PAGE_TO_MARKDOWN_PROMPT,
+            image_bytes,
+            image_url=image_url_slot(0),
+        )
         
         content = await self._post_chat(
             messages,
             context={"doc_id": doc_id, "page_num": page_num},
+            images=[image_bytes],
         )
         
         logger.info(
@@ -660,6 +791,73 @@ class OpenRouterNemotronBackend(OcrVlmBackend):
         
         return content
     
+    async def pages_to_markdown(
+        self,
+        images: list[bytes | memoryview],
+        page_nums: list[int],
+        doc_id: str,
+    ) -> list[str]:
+        """Convert several page images to Markdown in a single request.
+        
+        The model is asked to prefix each page with a "## PAGE n" line. If
+        the response does not contain exactly one marker per requested
+        page, the pages are converted one request at a time instead.
+        
+        Args:
+            images: Image bytes of the rendered pages
+            page_nums: Page numbers (1-indexed), one per image
+            doc_id: Document identifier
+            
+        Returns:
+            Markdown for each page, in the order of `images`
+            
+        Raises:
+            BackendError: If OCR processing fails
+        """
+        if len(images) == 1:
+            return [await self.page_to_markdown(images[0], page_nums[0], doc_id)]
+        
+        logger.info(
+            "pages_ocr_started",
+            backend=self.name,
+            doc_id=doc_id,
+            page_nums=page_nums,
+            image_size_kb=sum(len(image) for image in images) // 1024,
+        )
+        
+        prompt = PAGES_TO_MARKDOWN_PROMPT.format(
+            count=len(images),
+            pages=", ".join(str(page_num) for page_num in page_nums),
+            first=page_nums[0],
+        )
+        messages = self._build_multi_image_messages(prompt, images)
+        
+        content = await self._post_chat(
+            messages,
+            context={"doc_id": doc_id, "page_nums": page_nums},
+            images=images,
+        )
+        
+        pages = self._split_pages(content, page_nums)
+        if pages is None:
+            logger.warning(
+                "pages_ocr_markers_mismatch",
+                backend=self.name,
+                doc_id=doc_id,
+                page_nums=page_nums,
+            )
+            return await super().pages_to_markdown(images, page_nums, doc_id)
+        
+        logger.info(
+            "pages_ocr_completed",
+            backend=self.name,
+            doc_id=doc_id,
+            page_nums=page_nums,
+            markdown_length=len(content),
+        )
+        
+        return pages
+    
     async def table_to_markdown(
         self,
         image_bytes: bytes,
@@ -680,9 +878,13 @@ class OpenRouterNemotronBackend(OcrVlmBackend):
             **meta,
         )
         
-        messages = self._build_messages(TABLE_TO_MARKDOWN_PROMPT, image_bytes)
+        messages = self._build_messages(
+            TABLE_TO_MARKDOWN_PROMPT,
+            image_bytes,
+            image_url=image_url_slot(0),
+        )
         
-        content = await self._post_chat(messages, context=meta)
+        content = await self._post_chat(messages, context=meta, images=[image_bytes])
         
         logger.info(
             "table_ocr_completed",
@@ -713,16 +915,17 @@ class OpenRouterNemotronBackend(OcrVlmBackend):
             **meta,
         )
         
-        messages = self._build_messages(FORMULA_TO_LATEX_PROMPT, image_bytes)
+        messages = self._build_messages(
+            FORMULA_TO_LATEX_PROMPT,
+            image_bytes,
+            image_url=image_url_slot(0),
+        )
         
-        content = await self._post_chat(messages, context=meta)
+        content = await self._post_chat(messages, context=meta, images=[image_bytes])
         
         # Clean up any accidental delimiters
-        content = content.strip()
-        if content.startswith("$$") and content.endswith("$$"):
-            content = content[2:-2].strip()
-        elif content.startswith("$") and content.endswith("$"):
-            content = content[1:-1].strip()
+        match = FORMULA_DELIMITERS_RE.match(content)
+        content = match.group(2).strip() if match else content.strip()
         
         logger.info(
             "formula_ocr_completed",
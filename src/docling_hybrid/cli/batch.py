@@ -6,6 +6,7 @@ This module provides batch PDF conversion functionality with:
 - Progress tracking for multiple files
 - Summary report generation
 - Graceful error handling per file
+- Optional deduplication of identical PDFs (by content hash)
 
 Usage:
     # Convert all PDFs in a directory
@@ -16,20 +17,44 @@ Usage:
 
     # Control parallelism
     docling-hybrid-ocr convert-batch ./pdfs/ --parallel 8
+
+    # Convert every file, even byte-identical copies
+    docling-hybrid-ocr convert-batch ./pdfs/ --no-dedup
 """
 
 import asyncio
+import fnmatch
+import hashlib
+import json
+import os
+import shutil
+from collections.abc import Iterator
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import List
 
+from docling_hybrid.backends import resolve_backend_name
 from docling_hybrid.common.config import Config
 from docling_hybrid.common.errors import DoclingHybridError
 from docling_hybrid.common.logging import get_logger
+from docling_hybrid.common.models import OcrBackendConfig
 from docling_hybrid.orchestrator import ConversionOptions, ConversionResult, HybridPipeline
 
+try:
+    from blake3 import blake3 as _hasher
+except ImportError:
+    _hasher = hashlib.blake2b
+
 logger = get_logger(__name__)
 
+# Bytes read at a time while hashing a file
+FINGERPRINT_CHUNK = 1024 * 1024
+
+# Sidecar in the output directory mapping fingerprints (of the PDF and the
+# settings it was converted with) to converted outputs, so identical PDFs
+# are also reused across runs
+DEDUP_INDEX_NAME = ".dedup_index.json"
+
 
 @dataclass
 class BatchFileResult:
@@ -38,13 +63,16 @@ class BatchFileResult:
     Attributes:
         source_path: Path to source PDF
         success: Whether conversion succeeded
-        result: ConversionResult if successful
+        result: ConversionResult if successful (None for duplicates)
         error: Error message if failed
+        duplicate_of: Path whose output was copied, if this file was a
+            duplicate and was not converted itself
     """
     source_path: Path
     success: bool
     result: ConversionResult | None = None
     error: str | None = None
+    duplicate_of: Path | None = None
 
 
 @dataclass
@@ -72,6 +100,32 @@ class BatchResult:
         return (self.successful / self.total_files) * 100
 
 
+def _scan_files(directory: str, pattern: str, recursive: bool) -> Iterator[str]:
+    """Yield paths of files under a directory whose names match a pattern.
+
+    Uses `os.scandir`, whose entries carry the file type from the directory
+    listing, so no extra `stat()` call or `Path` object is needed per entry.
+    Symlinked directories are not descended into, which also avoids cycles.
+
+    Args:
+        directory: Directory to scan
+        pattern: Glob pattern matched against file names
+        recursive: Whether to descend into subdirectories
+
+    Yields:
+        Paths (as strings) of matching files
+    """
+    pending = [directory]
+    while pending:
+        with os.scandir(pending.pop()) as entries:
+            for entry in entries:
+                if entry.is_file():
+                    if fnmatch.fnmatch(entry.name, pattern):
+                        yield entry.path
+                elif recursive and entry.is_dir(follow_symlinks=False):
+                    pending.append(entry.path)
+
+
 def find_pdf_files(
     input_dir: Path,
     pattern: str = "*.pdf",
@@ -96,14 +150,10 @@ def find_pdf_files(
     if not input_dir.is_dir():
         raise ValueError(f"Input path is not a directory: {input_dir}")
 
-    # Use rglob for recursive, glob for non-recursive
-    glob_func = input_dir.rglob if recursive else input_dir.glob
-
-    # Find all matching files
-    pdf_files = [p for p in glob_func(pattern) if p.is_file()]
-
-    # Sort by name for consistent ordering
-    pdf_files.sort()
+    # Find all matching files, sorted by name for consistent ordering
+    pdf_files = sorted(
+        Path(p) for p in _scan_files(str(input_dir), pattern, recursive)
+    )
 
     logger.info(
         "pdf_files_found",
@@ -116,6 +166,163 @@ def find_pdf_files(
     return pdf_files
 
 
+def file_fingerprint(path: Path) -> str:
+    """Compute a content fingerprint of a file.
+
+    The whole file is hashed: PDFs generated from one template can have the
+    same size and differ only in the middle. blake3 (when installed) hashes
+    at several GB/s, so this stays cheap next to converting the file.
+
+    Args:
+        path: File to fingerprint
+
+    Returns:
+        Hex digest identifying the file content
+    """
+    hasher = _hasher()
+    with open(path, "rb") as f:
+        while chunk := f.read(FINGERPRINT_CHUNK):
+            hasher.update(chunk)
+    return str(hasher.hexdigest())
+
+
+def conversion_fingerprint(
+    options: ConversionOptions, backend_config: OcrBackendConfig, dpi: int
+) -> str:
+    """Compute a fingerprint of the settings that shape a file's output.
+
+    Args:
+        options: Conversion options
+        backend_config: Resolved config of the backend the file is converted
+            with; its model, generation and page image settings are covered
+        dpi: Effective render resolution (`options.dpi` or the config default)
+
+    Returns:
+        Hex digest of the settings
+    """
+    settings = options.model_dump(mode="json")
+    settings.update(
+        backend=backend_config.model_dump(
+            mode="json",
+            include={
+                "name",
+                "model",
+                "temperature",
+                "max_tokens",
+                "vision_max_side",
+                "image_format",
+                "quantize_bits",
+            },
+        ),
+        dpi=dpi,
+    )
+    return hashlib.sha256(json.dumps(settings, sort_keys=True).encode("utf-8")).hexdigest()[:16]
+
+
+def group_duplicates(
+    paths: List[Path],
+) -> tuple[dict[str, List[Path]], dict[Path, str]]:
+    """Group files by content fingerprint.
+
+    Args:
+        paths: Files to group
+
+    Returns:
+        Mapping of fingerprint to the files sharing it, in input order (the
+        first file of each group is the one to convert), and the error for
+        each file that could not be read
+    """
+    groups: dict[str, List[Path]] = {}
+    unreadable: dict[Path, str] = {}
+    for path in paths:
+        try:
+            fingerprint = file_fingerprint(path)
+        except OSError as e:
+            logger.error("batch_file_unreadable", pdf=str(path), error=str(e))
+            unreadable[path] = f"{type(e).__name__}: {e}"
+            continue
+        groups.setdefault(fingerprint, []).append(path)
+    return groups, unreadable
+
+
+def _load_dedup_index(output_dir: Path) -> dict[str, dict[str, str]]:
+    """Load the fingerprint -> {"output", "digest"} index, if present.
+
+    Entries in another format (e.g. written by an older version) are
+    dropped, so the files they describe are converted again.
+    """
+    try:
+        index = json.loads((output_dir / DEDUP_INDEX_NAME).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(index, dict):
+        return {}
+    return {
+        key: entry
+        for key, entry in index.items()
+        if isinstance(entry, dict) and {"output", "digest"} <= entry.keys()
+    }
+
+
+def _recorded_output(output_dir: Path, entry: dict[str, str] | None) -> Path | None:
+    """Get a recorded output if it still holds what was recorded.
+
+    Args:
+        output_dir: Output directory
+        entry: Index entry for the file, if any
+
+    Returns:
+        Path of the output, or None if it is missing or has been changed
+        since (e.g. overwritten by a different PDF with the same name)
+    """
+    if entry is None:
+        return None
+    output = output_dir / entry["output"]
+    try:
+        if file_fingerprint(output) == entry["digest"]:
+            return output
+    except OSError:
+        pass
+    return None
+
+
+def _save_dedup_index(output_dir: Path, index: dict[str, dict[str, str]]) -> None:
+    """Write the dedup index; failures only cost cross-run reuse."""
+    try:
+        (output_dir / DEDUP_INDEX_NAME).write_text(
+            json.dumps(index, indent=2, sort_keys=True), encoding="utf-8"
+        )
+    except OSError as e:
+        logger.warning("dedup_index_write_failed", error=str(e))
+
+
+def _copy_output(source_output: Path, pdf_path: Path, output_dir: Path) -> BatchFileResult:
+    """Reuse an existing output for a duplicate PDF.
+
+    Args:
+        source_output: Output Markdown of the identical, converted PDF
+        pdf_path: Duplicate PDF
+        output_dir: Output directory
+
+    Returns:
+        BatchFileResult for the duplicate
+    """
+    output_path = output_dir / f"{pdf_path.stem}.md"
+    try:
+        if output_path != source_output:
+            shutil.copyfile(source_output, output_path)
+    except OSError as e:
+        logger.error("batch_duplicate_copy_failed", pdf=str(pdf_path), error=str(e))
+        return BatchFileResult(source_path=pdf_path, success=False, error=str(e))
+
+    logger.info("batch_file_duplicate", pdf=str(pdf_path), output=str(output_path))
+    return BatchFileResult(
+        source_path=pdf_path,
+        success=True,
+        duplicate_of=source_output,
+    )
+
+
 async def convert_single_file(
     pdf_path: Path,
     output_dir: Path,
@@ -192,15 +399,25 @@ async def convert_batch(
     config: Config,
     parallel: int = 4,
     options: ConversionOptions | None = None,
+    deduplicate: bool = False,
 ) -> BatchResult:
     """Convert multiple PDFs in parallel.
 
+    With `deduplicate`, byte-identical PDFs (by `file_fingerprint`) are
+    converted once and the output is copied for the others. Fingerprints
+    of converted files are recorded in the output directory, together with
+    the conversion settings and a digest of the output, so identical PDFs
+    seen by a later run with the same backend config and options are copied
+    too, as long as the recorded output is unchanged. Files that cannot be
+    read for hashing are reported as failed without stopping the batch.
+
     Args:
         input_paths: List of PDF paths to convert
         output_dir: Output directory for converted files
         config: Application configuration
         parallel: Maximum number of files to process in parallel
         options: Conversion options for each file
+        deduplicate: Convert identical files only once (default: False)
 
     Returns:
         BatchResult with summary and per-file results
@@ -231,24 +448,96 @@ async def convert_batch(
 
     start_time = time.time()
 
+    results_by_path: dict[Path, BatchFileResult] = {}
+
+    # Group identical files; each group is converted once. Hashing reads
+    # every file in full, so it runs off the event loop.
+    if deduplicate:
+        grouped, unreadable = await asyncio.to_thread(group_duplicates, input_paths)
+        groups = list(grouped.items())
+        for path, error in unreadable.items():
+            results_by_path[path] = BatchFileResult(
+                source_path=path, success=False, error=error
+            )
+        backend_config = config.backends.get_backend_config(
+            resolve_backend_name(options.backend_name or config.backends.default)
+        )
+        settings = conversion_fingerprint(
+            options,
+            backend_config=backend_config,
+            dpi=options.dpi or config.resources.page_render_dpi,
+        )
+        index = _load_dedup_index(output_dir)
+    else:
+        groups = [(str(i), [path]) for i, path in enumerate(input_paths)]
+
     # Create pipeline (shared across all files for efficiency)
-    async with HybridPipeline(config) as pipeline:
+    async with HybridPipeline(config, concurrent_documents=parallel) as pipeline:
         # Create semaphore to limit parallelism
         semaphore = asyncio.Semaphore(parallel)
 
-        async def convert_with_semaphore(pdf_path: Path) -> BatchFileResult:
-            """Convert a file with semaphore control."""
+        async def convert_with_semaphore(fingerprint: str, paths: List[Path]) -> None:
+            """Convert the first file of a group with semaphore control."""
+            canonical, duplicates = paths[0], paths[1:]
+
+            previous = None
+            if deduplicate:
+                previous = await asyncio.to_thread(
+                    _recorded_output, output_dir, index.get(f"{fingerprint}|{settings}")
+                )
+            if previous is not None:
+                # Converted by an earlier run
+                source_output = previous
+                for path in paths:
+                    results_by_path[path] = await asyncio.to_thread(
+                        _copy_output, source_output, path, output_dir
+                    )
+                return
+
             async with semaphore:
-                return await convert_single_file(
-                    pdf_path=pdf_path,
+                file_result = await convert_single_file(
+                    pdf_path=canonical,
                     output_dir=output_dir,
                     pipeline=pipeline,
                     options=options,
                 )
+            results_by_path[canonical] = file_result
+
+            if not deduplicate:
+                return
+
+            source_output = output_dir / f"{canonical.stem}.md"
+            for path in duplicates:
+                if file_result.success:
+                    results_by_path[path] = await asyncio.to_thread(
+                        _copy_output, source_output, path, output_dir
+                    )
+                else:
+                    results_by_path[path] = BatchFileResult(
+                        source_path=path,
+                        success=False,
+                        error=file_result.error,
+                        duplicate_of=canonical,
+                    )
+            if file_result.success:
+                try:
+                    index[f"{fingerprint}|{settings}"] = {
+                        "output": source_output.name,
+                        "digest": await asyncio.to_thread(file_fingerprint, source_output),
+                    }
+                except OSError as e:
+                    logger.warning("dedup_index_entry_skipped", pdf=str(canonical), error=str(e))
+
+        # Process all groups concurrently (with semaphore limit)
+        await asyncio.gather(
+            *(convert_with_semaphore(fp, paths) for fp, paths in groups)
+        )
 
-        # Process all files concurrently (with semaphore limit)
-        tasks = [convert_with_semaphore(pdf) for pdf in input_paths]
-        file_results = await asyncio.gather(*tasks, return_exceptions=False)
+    if deduplicate:
+        _save_dedup_index(output_dir, index)
+
+    # Report results in input order
+    file_results = [results_by_path[path] for path in input_paths]
 
     # Calculate summary statistics
     successful = sum(1 for r in file_results if r.success)
@@ -268,6 +557,7 @@ async def convert_batch(
         total_files=result.total_files,
         successful=result.successful,
         failed=result.failed,
+        duplicates=sum(1 for r in file_results if r.duplicate_of is not None),
         elapsed_seconds=result.elapsed_seconds,
     )
 
@@ -309,5 +599,10 @@ def format_batch_summary(result: BatchResult) -> str:
             if file_result.success and file_result.result:
                 pages = file_result.result.processed_pages
                 lines.append(f"  ✓ {file_result.source_path.name} ({pages} pages)")
+            elif file_result.success and file_result.duplicate_of:
+                lines.append(
+                    f"  ✓ {file_result.source_path.name} "
+                    f"(duplicate of {file_result.duplicate_of.name})"
+                )
 
     return "\n".join(lines)
@@ -31,6 +31,7 @@ from docling_hybrid.common.errors import (
     RenderingError,
     ValidationError,
 )
+from docling_hybrid.common.eventloop import install_uvloop
 from docling_hybrid.common.logging import setup_logging
 from docling_hybrid.orchestrator import ConversionOptions, HybridPipeline
 
@@ -196,7 +197,7 @@ def main(
     ),
 ) -> None:
     """Docling Hybrid OCR - Convert PDFs to Markdown using VLM backends."""
-    pass
+    install_uvloop()
 
 
 @app.command()
@@ -254,6 +255,11 @@ def convert(
         "--no-separators",
         help="Don't add page separator comments",
     ),
+    force_ocr: bool = typer.Option(
+        False,
+        "--force-ocr",
+        help="OCR every page, even born-digital pages with a text layer",
+    ),
     verbose: bool = typer.Option(
         False,
         "--verbose",
@@ -265,6 +271,8 @@ def convert(
     
     Uses the configured VLM backend to perform OCR on each page
     and concatenates the results into a single Markdown file.
+    Born-digital pages with an extractable text layer skip OCR
+    unless --force-ocr is given.
     
     Examples:
     
@@ -280,6 +288,9 @@ def convert(
         # Process only first 5 pages
         docling-hybrid-ocr convert document.pdf --max-pages 5
         
+        # OCR every page, ignoring embedded text layers
+        docling-hybrid-ocr convert document.pdf --force-ocr
+        
         # Use custom config
         docling-hybrid-ocr convert document.pdf --config configs/local.toml
     """
@@ -299,6 +310,7 @@ def convert(
             add_page_separators=not no_page_separators,
             max_pages=max_pages,
             start_page=start_page,
+            force_ocr=force_ocr,
         )
 
         # Show what we're doing
@@ -444,7 +456,7 @@ def backends() -> None:
     backend_info = {
         "nemotron-openrouter": ("✓ Implemented", "OpenRouter API with Nemotron-nano-12b-v2-vl"),
         "deepseek-vllm": ("○ Stub", "DeepSeek-OCR via vLLM (CUDA Linux)"),
-        "deepseek-mlx": ("○ Stub", "DeepSeek-OCR via MLX (macOS)"),
+        "deepseek-mlx": ("✓ Implemented", "DeepSeek via MLX (macOS, Apple Silicon)"),
     }
     
     for name in available:
@@ -454,6 +466,10 @@ def backends() -> None:
     console.print(table)
     console.print()
     console.print("[dim]Use --backend <name> with the convert command to select a backend.[/dim]")
+    console.print(
+        "[dim]--backend auto picks deepseek-mlx on Apple Silicon (with mlx-vlm "
+        "installed) and deepseek-vllm elsewhere.[/dim]"
+    )
 
 
 @app.command()
@@ -546,6 +562,16 @@ def convert_batch_command(
         help="Maximum pages to process per file (default: all)",
         min=1,
     ),
+    force_ocr: bool = typer.Option(
+        False,
+        "--force-ocr",
+        help="OCR every page, even born-digital pages with a text layer",
+    ),
+    dedup: bool = typer.Option(
+        True,
+        "--dedup/--no-dedup",
+        help="Convert byte-identical PDFs once and copy the output",
+    ),
     verbose: bool = typer.Option(
         False,
         "--verbose",
@@ -571,6 +597,9 @@ def convert_batch_command(
 
         # Limit pages per file
         docling-hybrid-ocr convert-batch ./pdfs/ --max-pages 5
+
+        # Convert every file, even identical copies
+        docling-hybrid-ocr convert-batch ./pdfs/ --no-dedup
     """
     try:
         # Initialize configuration
@@ -602,6 +631,7 @@ def convert_batch_command(
             backend_name=backend,
             dpi=dpi,
             max_pages=max_pages,
+            force_ocr=force_ocr,
         )
 
         # Show what we're doing
@@ -620,6 +650,7 @@ def convert_batch_command(
                     config=config,
                     parallel=parallel,
                     options=options,
+                    deduplicate=dedup,
                 )
                 return result
 
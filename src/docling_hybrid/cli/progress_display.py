@@ -4,6 +4,7 @@ This module provides Rich-based progress displays for:
 - Individual file conversion with page-level progress
 - Batch processing with file-level progress
 - Real-time updates with ETA estimates
+- Coalesced updates for high-frequency progress events
 
 Usage:
     from rich.console import Console
@@ -17,6 +18,7 @@ Usage:
             progress.complete_file(i, success=True)
 """
 
+import time
 from pathlib import Path
 from typing import Dict
 
@@ -35,6 +37,69 @@ from rich.table import Table
 from rich.text import Text
 
 
+# Minimum interval between forwarded progress updates (~20 Hz)
+DEFAULT_UPDATE_INTERVAL_S = 0.05
+
+
+class CoalescedProgress:
+    """Rate-limited `advance` updates for a Rich progress task.
+
+    Every `Progress.update` takes Rich's lock and records a speed sample.
+    When thousands of short files (or pages) complete, that per-event cost
+    adds up on the event loop. This wrapper accumulates advances and
+    forwards them at most once per `interval_s`; `flush()` forwards any
+    remainder.
+
+    Attributes:
+        progress: Rich Progress instance
+        task_id: Task to advance
+        interval_s: Minimum seconds between forwarded updates
+
+    Example:
+        >>> updater = CoalescedProgress(progress, task)
+        >>> for _ in results:
+        ...     updater.advance()
+        >>> updater.flush()
+    """
+
+    def __init__(
+        self,
+        progress: Progress,
+        task_id: TaskID,
+        interval_s: float = DEFAULT_UPDATE_INTERVAL_S,
+    ) -> None:
+        """Initialize the updater.
+
+        Args:
+            progress: Rich Progress instance
+            task_id: Task to advance
+            interval_s: Minimum seconds between forwarded updates (default: 0.05)
+        """
+        self.progress = progress
+        self.task_id = task_id
+        self.interval_s = interval_s
+        self._pending = 0.0
+        self._last_update = float("-inf")
+
+    def advance(self, amount: float = 1) -> None:
+        """Record progress, forwarding it if the interval has elapsed.
+
+        Args:
+            amount: Amount to advance the task by (default: 1)
+        """
+        self._pending += amount
+        now = time.monotonic()
+        if now - self._last_update >= self.interval_s:
+            self._last_update = now
+            self.flush()
+
+    def flush(self) -> None:
+        """Forward any accumulated progress immediately."""
+        if self._pending:
+            self.progress.update(self.task_id, advance=self._pending)
+            self._pending = 0.0
+
+
 class BatchProgressDisplay:
     """Progress display for batch processing multiple files.
 
@@ -82,6 +147,7 @@ class BatchProgressDisplay:
             "Processing batch",
             total=total_files,
         )
+        self._batch_updates = CoalescedProgress(self.progress, self.batch_task)
 
     def __enter__(self) -> "BatchProgressDisplay":
         """Enter context manager."""
@@ -90,6 +156,7 @@ class BatchProgressDisplay:
 
     def __exit__(self, exc_type, exc_val, exc_tb) -> None:
         """Exit context manager."""
+        self._batch_updates.flush()
         self.progress.__exit__(exc_type, exc_val, exc_tb)
 
     def start_file(self, file_index: int, pdf_path: Path, total_pages: int | None = None) -> None:
@@ -134,8 +201,8 @@ class BatchProgressDisplay:
             success: Whether conversion succeeded
             error: Error message if failed
         """
-        # Update batch progress
-        self.progress.update(self.batch_task, advance=1)
+        # Update batch progress (coalesced; flushed on exit)
+        self._batch_updates.advance()
 
         # Complete file task if it exists
         if file_index in self.file_tasks:
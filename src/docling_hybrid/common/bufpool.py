@@ -0,0 +1,176 @@
+"""Reusable byte buffers for rendered page images.
+
+Rendering a page produces a multi-megabyte PNG. Allocating a fresh `bytes`
+object for every page (times every page in flight, times every file in a
+batch) puts steady pressure on the allocator. This module keeps a small pool
+of `bytearray` buffers, bucketed by size, that the renderer encodes into and
+the pipeline hands back once the backend has consumed the image.
+
+Buffers are only allocated when a page is actually rendered and the matching
+bucket is empty, so an idle pool costs nothing.
+
+Usage:
+    from docling_hybrid.common.bufpool import BufferPool
+
+    pool = BufferPool()
+    image = render_page_to_png_bytes(pdf_path, 0, dpi=200, pool=pool)
+    try:
+        markdown = await backend.page_to_markdown(image, 1, doc_id)
+    finally:
+        pool.release(image)
+"""
+
+import io
+import threading
+from collections import deque
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from _typeshed import ReadableBuffer
+
+# Bucket sizes in bytes. Requests above the largest bucket get an exact-size
+# buffer that is not retained by the pool.
+BUCKET_SIZES: tuple[int, ...] = (1 << 20, 4 << 20, 16 << 20)
+
+
+class BufferPool:
+    """Pool of reusable `bytearray` buffers bucketed by size.
+
+    Attributes:
+        max_per_bucket: Maximum number of idle buffers retained per bucket
+
+    Example:
+        >>> pool = BufferPool()
+        >>> buf = pool.acquire(300_000)
+        >>> len(buf)
+        1048576
+        >>> pool.release(buf)
+        >>> pool.acquire(10) is buf
+        True
+    """
+
+    def __init__(self, max_per_bucket: int = 8) -> None:
+        """Initialize an empty pool.
+
+        Args:
+            max_per_bucket: Maximum idle buffers kept per bucket (default: 8)
+        """
+        self.max_per_bucket = max_per_bucket
+        self._buckets: dict[int, deque[bytearray]] = {
+            size: deque() for size in BUCKET_SIZES
+        }
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def bucket_size(size: int) -> int:
+        """Round a requested size up to its bucket size.
+
+        Args:
+            size: Requested buffer size in bytes
+
+        Returns:
+            Bucket size, or `size` itself if larger than every bucket
+        """
+        for bucket in BUCKET_SIZES:
+            if size <= bucket:
+                return bucket
+        return size
+
+    def acquire(self, size: int) -> bytearray:
+        """Get a buffer of at least `size` bytes.
+
+        Args:
+            size: Minimum buffer size in bytes
+
+        Returns:
+            A pooled buffer if one is idle, otherwise a newly allocated one
+        """
+        bucket = self.bucket_size(size)
+        with self._lock:
+            idle = self._buckets.get(bucket)
+            if idle:
+                return idle.pop()
+        return bytearray(bucket)
+
+    def release(self, buf: bytearray | memoryview | bytes) -> None:
+        """Return a buffer (or a view over one) to the pool.
+
+        Views are released before their underlying buffer is pooled. Plain
+        `bytes` and buffers that do not match a bucket size are ignored, so
+        callers can release whatever they were handed without checking.
+
+        Args:
+            buf: Buffer previously returned by `acquire`, or a view over it
+        """
+        owner: object = buf
+        if isinstance(buf, memoryview):
+            owner = buf.obj
+            buf.release()
+        if not isinstance(owner, bytearray):
+            return
+        with self._lock:
+            idle = self._buckets.get(len(owner))
+            if idle is not None and len(idle) < self.max_per_bucket:
+                idle.append(owner)
+
+
+class PooledBufferWriter(io.RawIOBase):
+    """Writable file object that encodes into pooled buffers.
+
+    Lets PIL (or anything else expecting a file) write directly into a
+    buffer from a `BufferPool`. If the output outgrows the current buffer,
+    a larger one is acquired and the smaller one is returned to the pool.
+
+    Example:
+        >>> writer = PooledBufferWriter(pool)
+        >>> pil_image.save(writer, format="PNG")
+        >>> view = writer.getbuffer()  # memoryview over the pooled buffer
+    """
+
+    def __init__(self, pool: BufferPool, size_hint: int = BUCKET_SIZES[0]) -> None:
+        """Initialize the writer.
+
+        Args:
+            pool: Pool to take buffers from
+            size_hint: Expected output size in bytes
+        """
+        super().__init__()
+        self._pool = pool
+        self._buf = pool.acquire(size_hint)
+        self._len = 0
+
+    def writable(self) -> bool:
+        """Writer is always writable."""
+        return True
+
+    def write(self, data: "ReadableBuffer") -> int:
+        """Append data to the buffer, growing it if needed.
+
+        Args:
+            data: Bytes-like object to append
+
+        Returns:
+            Number of bytes written
+        """
+        data = memoryview(data).cast("B")
+        n = len(data)
+        end = self._len + n
+        if end > len(self._buf):
+            bigger = self._pool.acquire(max(end, len(self._buf) * 2))
+            bigger[: self._len] = self._buf[: self._len]
+            self._pool.release(self._buf)
+            self._buf = bigger
+        self._buf[self._len:end] = data
+        self._len = end
+        return n
+
+    def getbuffer(self) -> memoryview:
+        """Get a view over the bytes written so far.
+
+        The view keeps the underlying pooled buffer alive; hand it to
+        `BufferPool.release` once it is no longer needed.
+
+        Returns:
+            Read-only memoryview of the written bytes
+        """
+        return memoryview(self._buf)[: self._len].toreadonly()
@@ -75,6 +75,21 @@ class ResourcesConfig(BaseModel):
     page_render_dpi: int = Field(default=200, ge=72, le=600)
     http_timeout_s: int = Field(default=120, ge=10, le=600)
     http_retry_attempts: int = Field(default=3, ge=1, le=10)
+    # Processes for page rendering; 0 renders on a background thread instead
+    render_processes: int = Field(default=0, ge=0, le=64)
+    # Concurrent backend calls per document; None falls back to max_workers
+    max_page_concurrency: int | None = Field(default=None, ge=1, le=256)
+    # Pages sent per backend request, for backends that accept several
+    # images per request; 1 sends every page on its own
+    pages_per_request: int = Field(default=1, ge=1, le=16)
+    # Cap on backend requests started per second (e.g. a provider quota);
+    # None sends requests as fast as the concurrency limits allow
+    max_requests_per_second: float | None = Field(default=None, gt=0)
+
+    @property
+    def page_concurrency(self) -> int:
+        """Effective number of pages sent to the backend concurrently."""
+        return self.max_page_concurrency or self.max_workers
 
 
 class BackendsConfig(BaseModel):
@@ -292,6 +307,10 @@ def load_config(config_path: Path | None = None) -> Config:
         "DOCLING_HYBRID_MAX_WORKERS": ("resources", "max_workers"),
         "DOCLING_HYBRID_MAX_MEMORY_MB": ("resources", "max_memory_mb"),
         "DOCLING_HYBRID_PAGE_RENDER_DPI": ("resources", "page_render_dpi"),
+        "DOCLING_HYBRID_RENDER_PROCESSES": ("resources", "render_processes"),
+        "DOCLING_HYBRID_MAX_PAGE_CONCURRENCY": ("resources", "max_page_concurrency"),
+        "DOCLING_HYBRID_PAGES_PER_REQUEST": ("resources", "pages_per_request"),
+        "DOCLING_HYBRID_MAX_REQUESTS_PER_SECOND": ("resources", "max_requests_per_second"),
         "DOCLING_HYBRID_DEFAULT_BACKEND": ("backends", "default"),
     }
     
@@ -310,9 +329,19 @@ def load_config(config_path: Path | None = None) -> Config:
                     )
             else:
                 # Convert to int if needed
-                if field in ("max_workers", "max_memory_mb", "page_render_dpi"):
-                    value = int(value)
-                config_dict[section][field] = value
+                if field in (
+                    "max_workers",
+                    "max_memory_mb",
+                    "page_render_dpi",
+                    "render_processes",
+                    "max_page_concurrency",
+                    "pages_per_request",
+                ):
+                    config_dict[section][field] = int(value)
+                elif field == "max_requests_per_second":
+                    config_dict[section][field] = float(value)
+                else:
+                    config_dict[section][field] = value
     
     # Validate and return
     try:
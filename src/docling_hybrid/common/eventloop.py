@@ -0,0 +1,59 @@
+"""Event loop selection for command-line entry points.
+
+The pipeline spends much of its time scheduling many small tasks (one per
+page, bounded by semaphores, across files in a batch). `uvloop` runs that
+scheduling considerably faster than the default asyncio loop, which is
+most visible with a local backend where pages finish quickly. It is an
+optional dependency (`pip install docling-hybrid-ocr[speedups]`); on
+Windows its port `winloop` is used instead. Without either, or with
+DOCLING_HYBRID_DISABLE_UVLOOP=1 set (e.g. to rule the loop out while
+debugging), the default loop is used.
+
+Usage:
+    from docling_hybrid.common.eventloop import install_uvloop
+
+    install_uvloop()
+    asyncio.run(main())
+"""
+
+import asyncio
+import os
+
+from docling_hybrid.common.logging import get_logger
+
+try:
+    import uvloop
+except ImportError:
+    try:
+        # Windows port with the same API
+        import winloop as uvloop
+    except ImportError:
+        uvloop = None
+
+logger = get_logger(__name__)
+
+# Set to 1 to keep the default asyncio loop even when uvloop is installed
+DISABLE_ENV_VAR = "DOCLING_HYBRID_DISABLE_UVLOOP"
+
+
+def install_uvloop() -> bool:
+    """Make later `asyncio.run` calls use uvloop (winloop on Windows), if installed.
+
+    Call once at program start, before any event loop is created. Library
+    code should not call this; the choice of loop belongs to the
+    application.
+
+    Returns:
+        True if uvloop was installed, False if the default loop is kept
+        (not installed, or disabled with DOCLING_HYBRID_DISABLE_UVLOOP=1)
+
+    Example:
+        >>> if install_uvloop():
+        ...     print("using uvloop")
+    """
+    if uvloop is None or os.environ.get(DISABLE_ENV_VAR) == "1":
+        return False
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    logger.debug("uvloop_installed")
+    return True
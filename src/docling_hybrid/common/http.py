@@ -0,0 +1,275 @@
+"""Shared HTTP client settings for VLM backends.
+
+Backends keep one `aiohttp.ClientSession` for their whole lifetime so that
+pages (and files, when a pipeline is reused across a batch) share pooled
+keep-alive connections instead of paying a TCP + TLS handshake per request.
+This module builds that session with connection limits sized for concurrent
+page processing, and provides the JSON encoder/decoder used for request and
+response bodies: chat requests carry megabytes of base64 image data, so
+`orjson` is used when installed (several times faster than `json`, and it
+produces bytes directly), with the standard library as fallback.
+`image_data_url` builds the `data:` URL for an image by joining the prefix
+and the base64 text, which copies the payload twice.
+`json_dumps_with_images` avoids that for request bodies: the payload is
+serialized with short placeholders where the image URLs go and the base64
+bytes are spliced in, so the images never become Python strings and the
+JSON encoder never scans them. Base64 encoding uses `pybase64` (SIMD) when
+installed, and `binascii` otherwise. `read_error_body` reads only the start
+of an error response, which is all that error messages keep.
+
+Usage:
+    from docling_hybrid.common.http import create_client_session
+
+    session = create_client_session(total_timeout_s=180)
+    async with session.post(url, json=payload) as response:
+        ...
+    await session.close()
+
+    body = json_dumps(payload)  # bytes, ready for session.post(data=body)
+    url = image_data_url(png_bytes)  # "data:image/png;base64,..."
+
+    message = {"type": "image_url", "image_url": {"url": image_url_slot(0)}}
+    body = await json_dumps_with_images_async(payload, [png_bytes])
+"""
+
+import asyncio
+import binascii
+import json
+from typing import Any
+
+import aiohttp
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import pybase64
+except ImportError:
+    pybase64 = None
+
+# Connection pool limits (across all hosts, and per host)
+DEFAULT_MAX_CONNECTIONS = 64
+DEFAULT_MAX_CONNECTIONS_PER_HOST = 32
+
+# Idle keep-alive connections are kept this long before being closed
+DEFAULT_KEEPALIVE_S = 60.0
+
+# Connection establishment timeout, separate from the total request timeout
+DEFAULT_CONNECT_TIMEOUT_S = 10.0
+
+# data: URL prefixes for the image formats the renderer produces
+PNG_DATA_URL_PREFIX = b"data:image/png;base64,"
+JPEG_DATA_URL_PREFIX = b"data:image/jpeg;base64,"
+JPEG_MAGIC = b"\xff\xd8\xff"
+
+# Request bodies with at least this many image bytes are built in the
+# default executor rather than on the event loop
+OFFLOAD_ENCODE_BYTES = 256 * 1024
+
+# Bytes of an error response body kept for error messages
+ERROR_BODY_BYTES = 500
+
+
+def create_client_session(
+    total_timeout_s: float | None,
+    connect_timeout_s: float = DEFAULT_CONNECT_TIMEOUT_S,
+    max_connections: int = DEFAULT_MAX_CONNECTIONS,
+    max_connections_per_host: int = DEFAULT_MAX_CONNECTIONS_PER_HOST,
+) -> aiohttp.ClientSession:
+    """Create a connection-pooled client session.
+
+    Must be called from within a running event loop.
+
+    Args:
+        total_timeout_s: Total timeout per request in seconds (None for
+            no limit)
+        connect_timeout_s: Timeout for establishing a connection (default: 10)
+        max_connections: Maximum open connections overall (default: 64)
+        max_connections_per_host: Maximum open connections per host (default: 32)
+
+    Returns:
+        New aiohttp ClientSession; the caller is responsible for closing it
+
+    Example:
+        >>> session = create_client_session(total_timeout_s=300)
+        >>> session.connector.limit
+        64
+    """
+    connector = aiohttp.TCPConnector(
+        limit=max_connections,
+        limit_per_host=max_connections_per_host,
+        keepalive_timeout=DEFAULT_KEEPALIVE_S,
+        ttl_dns_cache=300,
+    )
+    timeout = aiohttp.ClientTimeout(
+        total=total_timeout_s,
+        sock_connect=connect_timeout_s,
+    )
+    return aiohttp.ClientSession(connector=connector, timeout=timeout)
+
+
+def json_dumps(obj: Any) -> bytes:
+    """Serialize an object to a UTF-8 JSON request body.
+
+    Args:
+        obj: JSON-serializable object
+
+    Returns:
+        Encoded JSON bytes
+    """
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def json_loads(data: str | bytes) -> Any:
+    """Parse a JSON response body.
+
+    Args:
+        data: JSON text or UTF-8 bytes
+
+    Returns:
+        Parsed object
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def image_data_url(image_bytes: bytes | memoryview) -> str:
+    """Encode PNG or JPEG bytes as a base64 `data:` URL.
+
+    Memoryviews (e.g. from the render buffer pool) are encoded without
+    first being copied to bytes. The base64 text is still copied twice
+    (decoded to str, then joined with the prefix); request bodies avoid
+    both copies by splicing the encoded bytes in with
+    `json_dumps_with_images`.
+
+    Args:
+        image_bytes: PNG or JPEG image bytes
+
+    Returns:
+        Data URL, e.g. "data:image/png;base64,iVBOR..."
+
+    Example:
+        >>> image_data_url(b"\\x89PNG")
+        'data:image/png;base64,iVBORw=='
+    """
+    view = memoryview(image_bytes)
+    return _data_url_prefix(view).decode("ascii") + _b64encode(view).decode("ascii")
+
+
+def _data_url_prefix(view: memoryview) -> bytes:
+    """Pick the data URL prefix matching the image format."""
+    return JPEG_DATA_URL_PREFIX if view[:3] == JPEG_MAGIC else PNG_DATA_URL_PREFIX
+
+
+def _b64encode(view: memoryview) -> bytes:
+    """Base64-encode image bytes without a trailing newline."""
+    if pybase64 is not None:
+        encoded: bytes = pybase64.b64encode(view)
+        return encoded
+    return binascii.b2a_base64(view, newline=False)
+
+
+def image_url_slot(index: int) -> str:
+    """Placeholder for the data URL of an image in a request payload.
+
+    Args:
+        index: Position of the image in the list passed to
+            `json_dumps_with_images`
+
+    Returns:
+        Placeholder string to use as the image URL
+    """
+    return f"<docling-hybrid:image:{index}>"
+
+
+def json_dumps_with_images(
+    obj: Any,
+    images: list[bytes | memoryview],
+) -> bytes | bytearray:
+    """Serialize a request body, splicing in image data URLs.
+
+    `obj` holds `image_url_slot(i)` wherever the data URL of `images[i]`
+    belongs, in order. Base64 text never needs JSON escaping, so it is
+    written straight into the output next to the serialized payload.
+
+    Args:
+        obj: JSON-serializable payload containing one slot per image
+        images: PNG or JPEG image bytes, in slot order
+
+    Returns:
+        Encoded JSON, identical to serializing `obj` with the data URLs
+        in place of the slots
+
+    Raises:
+        ValueError: If a slot is missing from the serialized payload
+
+    Example:
+        >>> payload = {"url": image_url_slot(0)}
+        >>> json_dumps_with_images(payload, [b"\\x89PNG"])
+        bytearray(b'{"url":"data:image/png;base64,iVBORw=="}')
+    """
+    body = json_dumps(obj)
+    if not images:
+        return body
+
+    chunks = memoryview(body)
+    out = bytearray()
+    pos = 0
+    for index, image_bytes in enumerate(images):
+        slot = image_url_slot(index).encode("ascii")
+        start = body.index(slot, pos)
+        view = memoryview(image_bytes)
+        out += chunks[pos:start]
+        out += _data_url_prefix(view)
+        out += _b64encode(view)
+        pos = start + len(slot)
+    out += chunks[pos:]
+    return out
+
+
+async def json_dumps_with_images_async(
+    obj: Any,
+    images: list[bytes | memoryview],
+) -> bytes | bytearray:
+    """`json_dumps_with_images` that keeps large images off the event loop.
+
+    Bodies with fewer than `OFFLOAD_ENCODE_BYTES` image bytes are built
+    inline, where a thread hop would cost more than the encoding.
+
+    Args:
+        obj: JSON-serializable payload containing one slot per image
+        images: PNG or JPEG image bytes; must stay valid until this returns
+
+    Returns:
+        Encoded JSON, as from `json_dumps_with_images`
+    """
+    if sum(len(image_bytes) for image_bytes in images) < OFFLOAD_ENCODE_BYTES:
+        return json_dumps_with_images(obj, images)
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, json_dumps_with_images, obj, images)
+
+
+async def read_error_body(
+    response: aiohttp.ClientResponse,
+    limit: int = ERROR_BODY_BYTES,
+) -> str:
+    """Read the start of an error response body.
+
+    Proxies can answer with megabytes of HTML; only the first `limit` bytes
+    are read, and the rest is discarded with the connection.
+
+    Args:
+        response: Response with an error status
+        limit: Maximum number of bytes to read (default: 500)
+
+    Returns:
+        Decoded body prefix; invalid UTF-8 (e.g. a cut-off character) is
+        replaced rather than raising
+    """
+    raw = await response.content.read(limit)
+    return raw.decode("utf-8", errors="replace")
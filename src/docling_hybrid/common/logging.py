@@ -2,7 +2,9 @@
 
 This module provides structured logging using structlog.
 Logs can be output as human-readable text (for development)
-or JSON (for production/aggregation).
+or JSON (for production/aggregation). JSON lines are serialized with
+`orjson` when installed, which is several times faster than `json` for the
+per-page events logged during conversion.
 
 Usage:
     from docling_hybrid.common.logging import setup_logging, get_logger
@@ -16,15 +18,37 @@ Usage:
     logger.error("backend_failed", error="timeout", backend="nemotron")
 """
 
+import json
 import logging
 import sys
-from typing import Literal
+from typing import Any, Literal
 
 import structlog
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
 LogFormat = Literal["text", "json"]
 
 
+def _orjson_dumps(obj: Any, default: Any = None, **kwargs: Any) -> str:
+    """Serialize a log event with orjson for `JSONRenderer`.
+
+    The standard logging handlers write text, so the bytes are decoded.
+    Non-string keys (e.g. page numbers) are stringified like `json.dumps`
+    does; anything else orjson rejects falls back to `json.dumps`.
+    """
+    try:
+        data: bytes = orjson.dumps(
+            obj, default=default, option=orjson.OPT_NON_STR_KEYS
+        )
+    except TypeError:
+        return json.dumps(obj, default=default, **kwargs)
+    return data.decode("utf-8")
+
+
 def setup_logging(
     level: str = "INFO",
     format: LogFormat = "text",
@@ -54,8 +78,10 @@ def setup_logging(
     # Convert level string to logging constant
     numeric_level = getattr(logging, level.upper(), logging.INFO)
     
-    # Shared processors for all configurations
+    # Shared processors for all configurations. Events below the level are
+    # dropped first, before any timestamping or rendering work is done.
     shared_processors = [
+        structlog.stdlib.filter_by_level,
         structlog.stdlib.add_log_level,
         structlog.stdlib.add_logger_name,
         structlog.contextvars.merge_contextvars,
@@ -69,7 +95,9 @@ def setup_logging(
         # JSON output for production
         processors = shared_processors + [
             structlog.processors.format_exc_info,
-            structlog.processors.JSONRenderer(),
+            structlog.processors.JSONRenderer(
+                serializer=_orjson_dumps if orjson is not None else json.dumps
+            ),
         ]
     else:
         # Human-readable output for development
@@ -21,7 +21,7 @@ Usage:
 """
 
 from enum import Enum
-from typing import Any
+from typing import Any, Literal
 
 from pydantic import BaseModel, Field, field_validator
 
@@ -58,10 +58,15 @@ class OcrBackendConfig(BaseModel):
         name: Backend identifier (e.g., "nemotron-openrouter")
         model: Model identifier for the provider
         base_url: Base HTTP endpoint URL
+        replica_urls: Further endpoints serving the same model (vLLM only)
         api_key: Authentication token (optional, often from env var)
         extra_headers: Additional HTTP headers (e.g., HTTP-Referer)
         temperature: Generation temperature (0.0 = deterministic)
         max_tokens: Maximum tokens in response
+        vision_max_side: Longest side in pixels of page images sent to the
+            model (None = render at full DPI)
+        image_format: Encoding of page images sent to the model
+        quantize_bits: Weight precision for in-process models (MLX only)
     
     Example:
         >>> config = OcrBackendConfig(
@@ -81,6 +86,13 @@ class OcrBackendConfig(BaseModel):
     base_url: str = Field(
         description="Base HTTP endpoint URL"
     )
+    replica_urls: list[str] = Field(
+        default_factory=list,
+        description=(
+            "Further endpoints serving the same model; each request goes to "
+            "the endpoint (base_url included) with the fewest in flight"
+        )
+    )
     api_key: str | None = Field(
         default=None,
         description="Authentication token (often loaded from environment)"
@@ -101,6 +113,28 @@ class OcrBackendConfig(BaseModel):
         le=128000,
         description="Maximum tokens in response"
     )
+    # Page image settings
+    vision_max_side: int | None = Field(
+        default=1024,
+        ge=256,
+        le=8192,
+        description=(
+            "Longest side in pixels of page images sent to the model; the "
+            "vision encoder downsamples anything larger (None = full DPI)"
+        )
+    )
+    image_format: Literal["jpeg", "png"] = Field(
+        default="jpeg",
+        description="Encoding of page images sent to the model"
+    )
+    # In-process model settings (MLX backend)
+    quantize_bits: Literal[4, 8] | None = Field(
+        default=4,
+        description=(
+            "Quantize weights of models loaded in full precision to this many "
+            "bits; pre-quantized models are used as is (None = keep as loaded)"
+        )
+    )
     # Retry configuration
     max_retries: int = Field(
         default=3,
@@ -135,6 +169,15 @@ class OcrBackendConfig(BaseModel):
             raise ValueError("base_url must start with http:// or https://")
         return v.rstrip("/")  # Remove trailing slash for consistency
 
+    @field_validator("replica_urls")
+    @classmethod
+    def validate_replica_urls(cls, v: list[str]) -> list[str]:
+        """Ensure replica URLs are valid HTTP(S) URLs."""
+        for url in v:
+            if not url.startswith(("http://", "https://")):
+                raise ValueError("replica_urls must start with http:// or https://")
+        return [url.rstrip("/") for url in v]
+
 
 class BackendCandidate(BaseModel):
     """Output from a single backend for a block or page.
@@ -4,10 +4,12 @@ This module provides utilities for retrying async operations with configurable
 exponential backoff, particularly useful for HTTP requests to external APIs.
 
 Features:
-- Exponential backoff with configurable base and max delay
-- Selective exception filtering
+- Exponential backoff with configurable base and max delay, optionally
+  jittered so that requests failing together do not retry together
+- Selective exception filtering, by type and by a per-exception predicate
 - Retry count limiting
 - Detailed logging of retry attempts
+- A rate limit gate shared by all concurrent requests to one backend
 
 Example:
     >>> async def fetch_data():
@@ -22,6 +24,8 @@ Example:
 """
 
 import asyncio
+import random
+import time
 from typing import Any, Awaitable, Callable, Type, TypeVar
 
 from docling_hybrid.common.logging import get_logger
@@ -155,6 +159,8 @@ async def retry_with_rate_limit(
     retryable_exceptions: tuple[Type[Exception], ...] = (Exception,),
     rate_limit_exception_type: Type[Exception] | None = None,
     extract_retry_after: Callable[[Exception], float | None] | None = None,
+    is_retryable: Callable[[Exception], bool] | None = None,
+    jitter: bool = False,
     context: dict[str, Any] | None = None,
 ) -> T:
     """Retry an async function with rate limit awareness.
@@ -171,6 +177,11 @@ async def retry_with_rate_limit(
         retryable_exceptions: Tuple of exception types to retry on
         rate_limit_exception_type: Exception type that indicates rate limiting (e.g., custom 429 error)
         extract_retry_after: Function to extract retry-after delay from exception
+        is_retryable: Predicate that can reject an exception of a retryable
+            type (e.g. a 4xx response error), which is then raised at once
+        jitter: Wait a random delay between half and all of the backoff
+            delay, so concurrent callers that failed together spread out;
+            Retry-After hints are used as given
         context: Optional context dict for logging
 
     Returns:
@@ -211,6 +222,16 @@ async def retry_with_rate_limit(
             return result
 
         except retryable_exceptions as e:
+            if is_retryable is not None and not is_retryable(e):
+                logger.error(
+                    "non_retryable_exception",
+                    attempt=attempt + 1,
+                    error=str(e),
+                    error_type=type(e).__name__,
+                    **context,
+                )
+                raise
+
             last_exception = e
 
             # If this is the last attempt, don't wait
@@ -227,6 +248,8 @@ async def retry_with_rate_limit(
 
             # Check if this is a rate limit error with Retry-After hint
             actual_delay = delay
+            if jitter:
+                actual_delay = random.uniform(delay / 2, delay)
             is_rate_limit = (
                 rate_limit_exception_type is not None
                 and isinstance(e, rate_limit_exception_type)
@@ -289,15 +312,210 @@ async def retry_with_rate_limit(
     raise RuntimeError("retry_with_rate_limit: unexpected state")
 
 
+class SharedRateLimiter:
+    """Backoff gate shared by every request to one backend.
+
+    With per-request retries alone, a 429 or 503 seen by one page does not
+    slow down the other pages (or files, in a batch) in flight: each backs
+    off on its own schedule and they retry into the same saturated endpoint.
+    A request that is throttled trips the limiter instead, which holds every
+    new request at `wait()` until one backoff window has passed.
+
+    The window is the server's Retry-After hint when there is one, otherwise
+    an exponential backoff that grows with each trip after the gate has
+    reopened and resets on the next successful request. Trips from requests
+    that were already in flight when the gate closed only extend the window;
+    they do not escalate the backoff again.
+
+    With `max_in_flight` set, the limiter also bounds the number of requests
+    in flight (AIMD): each escalating trip halves the limit, and every
+    `increase_every` successes raise it by one again, up to `max_in_flight`.
+    A fixed page concurrency above what the server can batch only turns into
+    429s and queueing; this way the effective concurrency settles at the
+    server's real capacity. Requests then use `acquire()`/`release()`
+    instead of `wait()`.
+
+    With `min_interval` set, `acquire()` also spaces request starts at least
+    that many seconds apart, for providers with a fixed requests-per-second
+    quota (where bursts would only be answered with 429s).
+
+    Attributes:
+        initial_delay: Window in seconds for the first trip without a hint
+        exponential_base: Growth factor between consecutive windows
+        max_delay: Longest window in seconds
+        max_in_flight: Upper bound for concurrent requests (None = unbounded)
+        increase_every: Successes needed to raise the in-flight limit by one
+        min_interval: Minimum seconds between request starts
+
+    Example:
+        >>> limiter = SharedRateLimiter(initial_delay=1.0, max_in_flight=8)
+        >>> await limiter.acquire()     # before each request
+        >>> limiter.trip(retry_after)   # on 429 / 503
+        >>> limiter.record_success()    # on 2xx
+        >>> limiter.release()           # after each request
+    """
+
+    def __init__(
+        self,
+        initial_delay: float = 1.0,
+        exponential_base: float = 2.0,
+        max_delay: float = 60.0,
+        max_in_flight: int | None = None,
+        increase_every: int = 10,
+        min_interval: float = 0.0,
+    ) -> None:
+        """Initialize an open gate.
+
+        Args:
+            initial_delay: Window in seconds for the first trip (default: 1.0)
+            exponential_base: Growth factor between windows (default: 2.0)
+            max_delay: Longest window in seconds (default: 60.0)
+            max_in_flight: Upper bound for concurrent requests; the limit
+                starts here (default: None, unbounded)
+            increase_every: Successes per additive increase (default: 10)
+            min_interval: Minimum seconds between request starts
+                (default: 0.0, no pacing)
+        """
+        self.initial_delay = initial_delay
+        self.exponential_base = exponential_base
+        self.max_delay = max_delay
+        self.max_in_flight = max_in_flight
+        self.increase_every = increase_every
+        self.min_interval = min_interval
+        self._delay = min(initial_delay, max_delay)
+        self._resume_at = 0.0
+
+        # In-flight limit state (unused when max_in_flight is None)
+        self._limit = max_in_flight or 0
+        self._in_flight = 0
+        self._successes = 0
+        self._slot_waiters: list[asyncio.Future[None]] = []
+
+        # Earliest start of the next request when pacing
+        self._next_start = 0.0
+
+    @property
+    def is_open(self) -> bool:
+        """Whether requests may currently proceed."""
+        return time.monotonic() >= self._resume_at
+
+    @property
+    def in_flight_limit(self) -> int | None:
+        """Current bound on concurrent requests, or None if unbounded."""
+        return self._limit if self.max_in_flight is not None else None
+
+    async def wait(self) -> None:
+        """Wait until the gate is open."""
+        while (remaining := self._resume_at - time.monotonic()) > 0:
+            await asyncio.sleep(remaining)
+
+    async def acquire(self) -> None:
+        """Wait until the gate is open, a slot is free and pacing allows.
+
+        Every successful `acquire()` must be paired with a `release()`.
+        """
+        # A slot is usually freed by a request that just failed, possibly
+        # after tripping the gate, so the gate is checked again after every
+        # wake-up rather than only once up front
+        while True:
+            await self.wait()
+            if self.max_in_flight is None or self._in_flight < self._limit:
+                break
+            waiter = asyncio.get_running_loop().create_future()
+            self._slot_waiters.append(waiter)
+            try:
+                await waiter
+            finally:
+                if waiter in self._slot_waiters:
+                    self._slot_waiters.remove(waiter)
+        if self.max_in_flight is not None:
+            self._in_flight += 1
+
+        if self.min_interval > 0:
+            # Reserve the next start time before sleeping, so concurrent
+            # callers queue up one interval apart
+            now = time.monotonic()
+            start = max(now, self._next_start)
+            self._next_start = start + self.min_interval
+            if start > now:
+                try:
+                    await asyncio.sleep(start - now)
+                except BaseException:
+                    self.release()
+                    raise
+
+    def release(self) -> None:
+        """Free the slot taken by `acquire()`."""
+        if self.max_in_flight is None:
+            return
+        self._in_flight -= 1
+        self._wake_slot_waiters()
+
+    def _wake_slot_waiters(self) -> None:
+        """Let waiters re-check for a free slot."""
+        if self._in_flight >= self._limit:
+            return
+        for waiter in self._slot_waiters:
+            if not waiter.done():
+                waiter.set_result(None)
+        self._slot_waiters.clear()
+
+    def trip(self, retry_after: float | None = None) -> float:
+        """Close the gate for one backoff window.
+
+        Args:
+            retry_after: Server-provided delay in seconds, if any
+
+        Returns:
+            Seconds until the gate reopens
+        """
+        now = time.monotonic()
+        escalate = now >= self._resume_at
+
+        if retry_after is not None:
+            window = min(retry_after, self.max_delay)
+        else:
+            window = self._delay
+            if escalate:
+                self._delay = min(self._delay * self.exponential_base, self.max_delay)
+
+        self._resume_at = max(self._resume_at, now + window)
+        remaining = self._resume_at - now
+        if escalate:
+            # Requests already in flight drain normally; new ones see the
+            # smaller limit
+            if self.max_in_flight is not None:
+                self._limit = max(1, self._limit // 2)
+                self._successes = 0
+            logger.warning(
+                "rate_limit_gate_closed",
+                delay_seconds=remaining,
+                in_flight_limit=self.in_flight_limit,
+            )
+        return remaining
+
+    def record_success(self) -> None:
+        """Reset the backoff, and grow the in-flight limit, after a success."""
+        self._delay = min(self.initial_delay, self.max_delay)
+        if self.max_in_flight is None or self._limit >= self.max_in_flight:
+            return
+        self._successes += 1
+        if self._successes >= self.increase_every:
+            self._successes = 0
+            self._limit += 1
+            logger.debug("in_flight_limit_increased", in_flight_limit=self._limit)
+            self._wake_slot_waiters()
+
+
 # HTTP status codes that indicate retryable errors
-RETRYABLE_STATUS_CODES = {
+RETRYABLE_STATUS_CODES = frozenset({
     408,  # Request Timeout
     429,  # Too Many Requests
     500,  # Internal Server Error
     502,  # Bad Gateway
     503,  # Service Unavailable
     504,  # Gateway Timeout
-}
+})
 
 
 def should_retry_on_status(status_code: int) -> bool:
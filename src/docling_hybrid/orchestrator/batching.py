@@ -0,0 +1,163 @@
+"""Micro-batching of page OCR requests.
+
+Backends that accept several images per request (see
+`OcrVlmBackend.supports_document_processing`) amortize request overhead
+and prompt prefill across pages. Pages are still rendered and processed
+independently by the pipeline; `PageBatcher` collects the rendered images
+as they arrive and sends them to `backend.pages_to_markdown` in groups of
+up to `batch_size`, flushing a partial group after a short linger so the
+last pages of a document are not held back.
+
+Each caller awaits only its own page, so per-page error handling, progress
+callbacks and ordered output in the pipeline are unchanged. If a batch
+request fails, every page in it fails with the same error.
+
+Usage:
+    from docling_hybrid.orchestrator.batching import PageBatcher
+
+    batcher = PageBatcher(backend, doc_id, batch_size=4)
+    try:
+        markdown = await batcher.submit(image_bytes, page_num=3)
+    finally:
+        await batcher.aclose()
+"""
+
+import asyncio
+
+from docling_hybrid.backends.base import OcrVlmBackend
+from docling_hybrid.common.errors import BackendResponseError
+from docling_hybrid.common.logging import get_logger
+
+logger = get_logger(__name__)
+
+# How long a partial batch waits for more pages before it is sent
+DEFAULT_LINGER_S = 0.05
+
+
+class PageBatcher:
+    """Groups page OCR calls into multi-page backend requests.
+
+    Attributes:
+        backend: Backend whose `pages_to_markdown` receives the batches
+        doc_id: Document identifier passed to the backend
+        batch_size: Maximum pages per request
+        linger_s: Seconds a partial batch waits before being sent
+        slots: Optional semaphore bounding concurrent backend requests
+
+    Example:
+        >>> batcher = PageBatcher(backend, "doc-123", batch_size=4)
+        >>> pages = await asyncio.gather(
+        ...     *(batcher.submit(image, n) for n, image in enumerate(images, 1))
+        ... )
+    """
+
+    def __init__(
+        self,
+        backend: OcrVlmBackend,
+        doc_id: str,
+        batch_size: int,
+        linger_s: float = DEFAULT_LINGER_S,
+        slots: asyncio.Semaphore | None = None,
+    ) -> None:
+        """Initialize the batcher.
+
+        Args:
+            backend: Backend to send batches to
+            doc_id: Document identifier
+            batch_size: Maximum pages per request
+            linger_s: Seconds a partial batch waits for more pages (default: 0.05)
+            slots: Optional semaphore held for the duration of each request
+        """
+        self.backend = backend
+        self.doc_id = doc_id
+        self.batch_size = batch_size
+        self.linger_s = linger_s
+        self.slots = slots
+        self._pending: list[tuple[bytes | memoryview, int, asyncio.Future[str]]] = []
+        self._timer: asyncio.TimerHandle | None = None
+        self._requests: set[asyncio.Task[None]] = set()
+
+    async def submit(self, image_bytes: bytes | memoryview, page_num: int) -> str:
+        """Queue a page and wait for its Markdown.
+
+        Args:
+            image_bytes: Image bytes of the rendered page
+            page_num: Page number (1-indexed)
+
+        Returns:
+            Markdown content of the page
+
+        Raises:
+            BackendError: If the batch request containing the page fails
+        """
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[str] = loop.create_future()
+        self._pending.append((image_bytes, page_num, future))
+
+        if len(self._pending) >= self.batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.linger_s, self._flush)
+
+        return await future
+
+    def _flush(self) -> None:
+        """Send all queued pages as one request."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._pending:
+            return
+
+        batch, self._pending = self._pending, []
+        request = asyncio.create_task(self._send(batch))
+        self._requests.add(request)
+        request.add_done_callback(self._requests.discard)
+
+    async def _send(
+        self,
+        batch: list[tuple[bytes | memoryview, int, asyncio.Future[str]]],
+    ) -> None:
+        """Run one backend request and resolve the waiting pages."""
+        images = [image for image, _, _ in batch]
+        page_nums = [page_num for _, page_num, _ in batch]
+
+        try:
+            if self.slots is not None:
+                async with self.slots:
+                    pages = await self.backend.pages_to_markdown(
+                        images, page_nums, self.doc_id
+                    )
+            else:
+                pages = await self.backend.pages_to_markdown(images, page_nums, self.doc_id)
+
+            if len(pages) != len(batch):
+                raise BackendResponseError(
+                    f"Backend returned {len(pages)} pages for a batch of {len(batch)}",
+                    backend_name=self.backend.name,
+                )
+        except Exception as e:
+            logger.debug("page_batch_failed", page_nums=page_nums, error=str(e))
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        logger.debug("page_batch_completed", page_nums=page_nums)
+        for (_, _, future), markdown in zip(batch, pages):
+            if not future.done():
+                future.set_result(markdown)
+
+    async def aclose(self) -> None:
+        """Cancel queued pages and any requests still in flight."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        for _, _, future in self._pending:
+            future.cancel()
+        self._pending = []
+
+        requests = list(self._requests)
+        for request in requests:
+            request.cancel()
+        await asyncio.gather(*requests, return_exceptions=True)
@@ -7,10 +7,13 @@ for the hybrid conversion pipeline.
 from pathlib import Path
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr, computed_field
 
 from docling_hybrid.common.models import PageResult
 
+# Characters of output kept in memory for ConversionResult.preview
+PREVIEW_CHARS = 500
+
 
 class ConversionOptions(BaseModel):
     """Options for PDF conversion.
@@ -22,6 +25,9 @@ class ConversionOptions(BaseModel):
         page_separator_format: Format string for page separators
         max_pages: Maximum pages to process (None for all)
         start_page: First page to process (1-indexed)
+        force_ocr: Send every page to the backend, even born-digital ones
+        text_layer_min_chars: Minimum text-layer characters for a page to
+            skip OCR
     """
     backend_name: str | None = Field(
         default=None,
@@ -51,17 +57,34 @@ class ConversionOptions(BaseModel):
         ge=1,
         description="First page to process (1-indexed)"
     )
+    force_ocr: bool = Field(
+        default=False,
+        description="OCR every page instead of using extractable text layers"
+    )
+    text_layer_min_chars: int = Field(
+        default=200,
+        ge=1,
+        description="Minimum text-layer characters for a page to skip OCR"
+    )
 
 
 class ConversionResult(BaseModel):
     """Result of PDF conversion.
     
+    The pipeline streams Markdown to `output_path` page by page and only
+    keeps a short `preview` in memory. `markdown` reads the full content
+    back from the output file on first access (and keeps it), unless it
+    was passed explicitly. Page results keep their metadata but not their
+    content, which lives in the output file.
+    
     Attributes:
         doc_id: Document identifier
         source_path: Path to source PDF
         output_path: Path to output file (if written)
-        markdown: Full Markdown content
-        page_results: Per-page results
+        markdown: Full Markdown content (read lazily from output_path)
+        preview: First characters of the Markdown content
+        page_results: Per-page results, with `content` emptied once written
+            (its length is kept in `metadata["markdown_chars"]`)
         total_pages: Total pages in PDF
         processed_pages: Number of pages processed
         backend_name: Backend used for conversion
@@ -77,12 +100,13 @@ class ConversionResult(BaseModel):
         default=None,
         description="Path to output file (if written)"
     )
-    markdown: str = Field(
-        description="Full Markdown content"
+    preview: str = Field(
+        default="",
+        description="First characters of the Markdown content"
     )
     page_results: list[PageResult] = Field(
         default_factory=list,
-        description="Per-page conversion results"
+        description="Per-page conversion results (content is in the output file)"
     )
     total_pages: int = Field(
         ge=1,
@@ -100,5 +124,37 @@ class ConversionResult(BaseModel):
         description="Additional metadata (timing, errors, etc.)"
     )
     
+    _markdown: str | None = PrivateAttr(default=None)
+    
     class Config:
         arbitrary_types_allowed = True
+    
+    def __init__(self, markdown: str | None = None, **data: Any) -> None:
+        """Initialize the result.
+        
+        Args:
+            markdown: Full Markdown content to hold in memory (optional).
+                When omitted, `markdown` is read from `output_path`.
+            **data: Model fields
+        """
+        super().__init__(**data)
+        self._markdown = markdown
+        if markdown is not None and not self.preview:
+            self.preview = markdown[:PREVIEW_CHARS]
+    
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def markdown(self) -> str:
+        """Full Markdown content.
+        
+        Returns:
+            The in-memory content if given, otherwise the contents of
+            `output_path`, read once and cached (empty if there is no
+            output file)
+        """
+        if self._markdown is None:
+            if self.output_path is not None and self.output_path.exists():
+                self._markdown = self.output_path.read_text(encoding="utf-8")
+            else:
+                return ""
+        return self._markdown
@@ -6,10 +6,9 @@ using Docling for structure and VLM backends for OCR.
 The pipeline follows these steps:
 1. Generate document ID
 2. Load PDF via pypdfium2 (or Docling for extended features)
-3. Render each page to PNG
-4. Send to VLM backend for OCR
-5. Concatenate results
-6. Write output file
+3. Use the text layer of born-digital pages directly
+4. Render remaining pages to PNG and send to VLM backend for OCR
+5. Stream results to the output file in page order
 
 Usage:
     from pathlib import Path
@@ -24,20 +23,39 @@ Usage:
 """
 
 import asyncio
+import functools
+import heapq
 import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
-from docling_hybrid.backends import make_backend
+from docling_hybrid.backends import make_backend, resolve_backend_name
 from docling_hybrid.backends.base import OcrVlmBackend
+from docling_hybrid.backends.cache import CachingBackend
+from docling_hybrid.common.bufpool import BufferPool
 from docling_hybrid.common.config import Config
 from docling_hybrid.common.errors import ValidationError
 from docling_hybrid.common.ids import generate_doc_id
 from docling_hybrid.common.logging import bind_context, clear_context, get_logger
 from docling_hybrid.common.models import OcrBackendConfig, PageResult
-from docling_hybrid.orchestrator.models import ConversionOptions, ConversionResult
+from docling_hybrid.common.retry import SharedRateLimiter
+from docling_hybrid.orchestrator.batching import PageBatcher
+from docling_hybrid.orchestrator.models import (
+    PREVIEW_CHARS,
+    ConversionOptions,
+    ConversionResult,
+)
 from docling_hybrid.orchestrator.progress import ProgressCallback
-from docling_hybrid.renderer import get_page_count, render_page_to_png_bytes
+from docling_hybrid.renderer import (
+    PdfHandle,
+    RenderedPages,
+    extract_text_layer,
+    get_page_count,
+    render_page_to_png_bytes,
+    render_page_worker,
+    text_layer_to_markdown,
+)
 
 logger = get_logger(__name__)
 
@@ -54,25 +72,61 @@ class HybridPipeline:
     Attributes:
         config: Application configuration
         backend: OCR/VLM backend instance (lazily created)
+        rate_limiter: 429/503 backoff gate shared by every backend request
+            made through this pipeline, across pages and files
     
     Example:
         >>> pipeline = HybridPipeline(config)
         >>> result = await pipeline.convert_pdf(Path("document.pdf"))
-        >>> print(result.markdown[:100])
+        >>> print(result.preview[:100])
         # Title
         
         First paragraph of the document...
     """
     
-    def __init__(self, config: Config) -> None:
+    def __init__(
+        self,
+        config: Config,
+        backend: OcrVlmBackend | None = None,
+        rate_limiter: SharedRateLimiter | None = None,
+        concurrent_documents: int = 1,
+    ) -> None:
         """Initialize the pipeline.
         
         Args:
             config: Application configuration
+            backend: Pre-built backend to use instead of creating one from
+                config (e.g. a CachingBackend wrapper). Used whenever no
+                other backend name is requested.
+            rate_limiter: Backoff gate to share with other pipelines
+                (default: a new one for this pipeline, adapting the number
+                of requests in flight up to the page concurrency of all
+                concurrent documents and pacing them to
+                `max_requests_per_second`). Attached to backends that do
+                not already have one.
+            concurrent_documents: Documents converted at the same time with
+                this pipeline, e.g. the parallelism of a batch (default: 1)
         """
         self.config = config
-        self._backend: OcrVlmBackend | None = None
-        self._backend_name: str | None = None
+        max_rps = config.resources.max_requests_per_second
+        self.rate_limiter = rate_limiter or SharedRateLimiter(
+            max_in_flight=concurrent_documents * config.resources.page_concurrency,
+            min_interval=1.0 / max_rps if max_rps else 0.0,
+        )
+        if backend is not None and getattr(backend, "rate_limiter", None) is None:
+            backend.rate_limiter = self.rate_limiter
+        self._backend: OcrVlmBackend | None = backend
+        self._backend_name: str | None = backend.name if backend else None
+        # Rendered page images are encoded into pooled buffers and returned
+        # here once the backend is done with them
+        self._buffer_pool = BufferPool(
+            max_per_bucket=2 * config.resources.page_concurrency
+        )
+        # pdfium work runs off the event loop: in a process pool when
+        # render_processes > 0, otherwise on one thread (pdfium is not
+        # thread-safe). Both are created on first use.
+        self._render_pool: ProcessPoolExecutor | None = None
+        self._pdfium_thread: ThreadPoolExecutor | None = None
         
         logger.info(
             "pipeline_initialized",
@@ -85,12 +139,15 @@ class HybridPipeline:
         """Get or create backend instance.
         
         Args:
-            backend_name: Backend name (None = use default)
+            backend_name: Backend name (None = use default); "auto" uses the
+                deepseek-mlx or deepseek-vllm configuration for this machine
             
         Returns:
             Backend instance
         """
-        name = backend_name or self.config.backends.default
+        name = resolve_backend_name(
+            backend_name or self._backend_name or self.config.backends.default
+        )
         
         # Reuse existing backend if same name
         if self._backend is not None and self._backend_name == name:
@@ -99,13 +156,170 @@ class HybridPipeline:
         # Get backend config and create instance
         backend_config = self.config.backends.get_backend_config(name)
         self._backend = make_backend(backend_config)
+        self._backend.rate_limiter = self.rate_limiter
         self._backend_name = name
         
         return self._backend
 
+    def _get_pdfium_thread(self) -> Executor:
+        """Get or create the single thread used for in-process pdfium calls."""
+        if self._pdfium_thread is None:
+            self._pdfium_thread = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="pdfium"
+            )
+        return self._pdfium_thread
+
+    async def _page_count(self, pdf_path: Path | PdfHandle) -> int:
+        """Get the page count on the pdfium thread.
+
+        Args:
+            pdf_path: Path to PDF file, or an open PdfHandle
+
+        Returns:
+            Number of pages
+        """
+        return await asyncio.get_running_loop().run_in_executor(
+            self._get_pdfium_thread(), get_page_count, pdf_path
+        )
+
+    async def _drain_pdfium_thread(self) -> None:
+        """Wait for pdfium calls already running on the pdfium thread.
+
+        Cancelling a task does not stop the executor call it was waiting
+        for, so a render of a cancelled page may still be using a
+        caller-owned PdfHandle. The thread runs calls in order, so once a
+        no-op queued behind them has run, they are all done.
+        """
+        if self._pdfium_thread is not None:
+            await asyncio.get_running_loop().run_in_executor(
+                self._pdfium_thread, lambda: None
+            )
+
+    def _get_render_pool(self) -> ProcessPoolExecutor | None:
+        """Get or create the render process pool, if configured."""
+        processes = self.config.resources.render_processes
+        if processes > 0 and self._render_pool is None:
+            self._render_pool = ProcessPoolExecutor(max_workers=processes)
+        return self._render_pool
+
+    @staticmethod
+    def _image_settings(
+        backend_config: OcrBackendConfig | None,
+    ) -> tuple[int | None, str]:
+        """Image size cap and format to render for a backend.
+
+        Args:
+            backend_config: Config of the backend the image is for
+
+        Returns:
+            (max_side, image_format); no cap and PNG without a config
+        """
+        if isinstance(backend_config, OcrBackendConfig):
+            return backend_config.vision_max_side, backend_config.image_format
+        return None, "png"
+
+    async def _render_page(
+        self,
+        pdf_path: Path | PdfHandle,
+        page_idx: int,
+        dpi: int,
+        backend_config: OcrBackendConfig | None = None,
+    ) -> bytes | memoryview:
+        """Render a page without blocking the event loop.
+
+        Args:
+            pdf_path: Path to PDF file, or an open PdfHandle
+            page_idx: Zero-indexed page index
+            dpi: Rendering DPI
+            backend_config: Config of the backend the image is for; its
+                vision_max_side and image_format shape the image. Without
+                one, a full-DPI PNG is rendered.
+
+        Returns:
+            Encoded image bytes, or a memoryview over a pooled buffer when
+            rendered in-process
+        """
+        loop = asyncio.get_running_loop()
+        max_side, image_format = self._image_settings(backend_config)
+
+        render_pool = self._get_render_pool()
+        if render_pool is not None:
+            # Worker processes return plain bytes and open the file
+            # themselves; the buffer pool and handles only apply in-process
+            path = pdf_path.path if isinstance(pdf_path, PdfHandle) else pdf_path
+            return await loop.run_in_executor(
+                render_pool,
+                render_page_worker,
+                str(path),
+                path.stat().st_mtime,
+                page_idx,
+                dpi,
+                max_side,
+                image_format,
+            )
+
+        return await loop.run_in_executor(
+            self._get_pdfium_thread(),
+            functools.partial(
+                render_page_to_png_bytes,
+                pdf_path=pdf_path,
+                page_index=page_idx,
+                dpi=dpi,
+                pool=self._buffer_pool,
+                max_side=max_side,
+                image_format=image_format,
+            ),
+        )
+
+    async def _text_layer_page_result(
+        self,
+        pdf_path: Path | PdfHandle,
+        page_idx: int,
+        doc_id: str,
+        min_chars: int,
+    ) -> PageResult | None:
+        """Build a page result from the PDF text layer, if it is usable.
+
+        Args:
+            pdf_path: Path to PDF file, or an open PdfHandle
+            page_idx: Zero-indexed page index
+            doc_id: Document ID
+            min_chars: Minimum text-layer characters required
+
+        Returns:
+            PageResult for a born-digital page, None if the page needs OCR
+        """
+        try:
+            layer = await asyncio.get_running_loop().run_in_executor(
+                self._get_pdfium_thread(),
+                extract_text_layer,
+                pdf_path,
+                page_idx,
+                min_chars,
+            )
+        except Exception as e:
+            # Unreadable text layer is not an error; the page is OCR'd instead
+            logger.debug("text_layer_unavailable", page_num=page_idx + 1, error=str(e))
+            return None
+
+        if not layer.is_usable(min_chars=min_chars):
+            return None
+
+        return PageResult(
+            page_num=page_idx + 1,
+            doc_id=doc_id,
+            content=text_layer_to_markdown(layer.text),
+            backend_name="text_layer",
+            metadata={
+                "source": "text_layer",
+                "text_chars": layer.char_count,
+                "image_coverage": round(layer.image_coverage, 3),
+            },
+        )
+
     async def _process_single_page(
         self,
-        pdf_path: Path,
+        pdf_path: Path | PdfHandle,
         page_idx: int,
         dpi: int,
         backend: OcrVlmBackend,
@@ -113,11 +327,19 @@ class HybridPipeline:
         doc_id: str,
         total_pages: int,
         progress_callback: ProgressCallback | None = None,
+        force_ocr: bool = False,
+        text_layer_min_chars: int = 200,
+        ocr_slots: asyncio.Semaphore | None = None,
+        batcher: PageBatcher | None = None,
+        rendered_pages: RenderedPages | None = None,
     ) -> PageResult | None:
         """Process a single page: render and OCR.
 
+        Born-digital pages with a usable text layer skip rendering and OCR
+        entirely unless `force_ocr` is set.
+
         Args:
-            pdf_path: Path to PDF file
+            pdf_path: Path to PDF file, or an open PdfHandle
             page_idx: Zero-indexed page index
             dpi: Rendering DPI
             backend: OCR backend instance
@@ -125,6 +347,13 @@ class HybridPipeline:
             doc_id: Document ID
             total_pages: Total pages in document
             progress_callback: Optional progress callback
+            force_ocr: Always OCR, ignoring any text layer
+            text_layer_min_chars: Minimum text-layer characters to skip OCR
+            ocr_slots: Optional semaphore bounding concurrent backend calls
+            batcher: Optional batcher that sends this page to the backend
+                together with other pages (it holds `ocr_slots` itself)
+            rendered_pages: Optional images rendered earlier; the page is
+                only rendered if it is not among them
 
         Returns:
             PageResult if successful, None if error
@@ -143,19 +372,67 @@ class HybridPipeline:
                         error=str(cb_error),
                     )
 
-            # Render page
-            image_bytes = render_page_to_png_bytes(
-                pdf_path=pdf_path,
-                page_index=page_idx,
-                dpi=dpi,
-            )
-
-            # OCR
-            markdown = await backend.page_to_markdown(
-                image_bytes=image_bytes,
-                page_num=page_num,
-                doc_id=doc_id,
-            )
+            # Fast path: born-digital pages already carry their text
+            if not force_ocr:
+                page_result = await self._text_layer_page_result(
+                    pdf_path=pdf_path,
+                    page_idx=page_idx,
+                    doc_id=doc_id,
+                    min_chars=text_layer_min_chars,
+                )
+                if page_result is not None:
+                    logger.info(
+                        "page_completed",
+                        page_num=page_num,
+                        total=total_pages,
+                        markdown_chars=len(page_result.content),
+                        source="text_layer",
+                    )
+                    if progress_callback:
+                        try:
+                            progress_callback.on_page_complete(
+                                page_num, total_pages, page_result
+                            )
+                        except Exception as cb_error:
+                            logger.error(
+                                "progress_callback_error",
+                                callback_event="on_page_complete",
+                                error=str(cb_error),
+                            )
+                    return page_result
+
+            # Render page off the event loop, unless it was rendered earlier
+            pre_rendered = False
+            image_bytes: bytes | memoryview
+            if rendered_pages is not None and page_idx < len(rendered_pages):
+                pre_rendered = True
+                image_bytes = rendered_pages[page_idx]
+            else:
+                image_bytes = await self._render_page(
+                    pdf_path, page_idx, dpi, backend_config=backend.config
+                )
+            image_size = len(image_bytes)
+
+            # OCR (the buffer goes back to the pool even if the backend fails)
+            try:
+                if batcher is not None:
+                    markdown = await batcher.submit(image_bytes, page_num)
+                elif ocr_slots is not None:
+                    async with ocr_slots:
+                        markdown = await backend.page_to_markdown(
+                            image_bytes=image_bytes,
+                            page_num=page_num,
+                            doc_id=doc_id,
+                        )
+                else:
+                    markdown = await backend.page_to_markdown(
+                        image_bytes=image_bytes,
+                        page_num=page_num,
+                        doc_id=doc_id,
+                    )
+            finally:
+                if not pre_rendered:
+                    self._buffer_pool.release(image_bytes)
 
             # Create page result
             page_result = PageResult(
@@ -164,7 +441,8 @@ class HybridPipeline:
                 content=markdown,
                 backend_name=backend_name,
                 metadata={
-                    "image_size_kb": len(image_bytes) // 1024,
+                    "source": "ocr",
+                    "image_size_kb": image_size // 1024,
                     "dpi": dpi,
                 },
             )
@@ -209,12 +487,69 @@ class HybridPipeline:
 
             return None
 
+    async def render_pages(
+        self,
+        pdf_path: Path | PdfHandle,
+        options: ConversionOptions | None = None,
+    ) -> RenderedPages:
+        """Render every page of a PDF once, for reuse across conversions.
+
+        Images are rendered for the backend that `convert_pdf` would use
+        with the same options, so they can be passed straight to it.
+
+        Args:
+            pdf_path: Path to the PDF file, or an open PdfHandle
+            options: Conversion options; `dpi` and `backend_name` apply
+
+        Returns:
+            RenderedPages holding all page images
+
+        Raises:
+            ValidationError: If PDF file doesn't exist
+            RenderingError: If the PDF cannot be rendered
+
+        Example:
+            >>> pages = await pipeline.render_pages(Path("document.pdf"))
+            >>> result = await pipeline.convert_pdf(
+            ...     Path("document.pdf"), rendered_pages=pages
+            ... )
+        """
+        options = options or ConversionOptions()
+        backend = self._get_backend(options.backend_name)
+        dpi = options.dpi or self.config.resources.page_render_dpi
+
+        total_pages = await self._page_count(pdf_path)
+        max_side, image_format = self._image_settings(backend.config)
+        pages = RenderedPages(
+            dpi=dpi,
+            source=pdf_path.path if isinstance(pdf_path, PdfHandle) else pdf_path,
+            max_side=max_side,
+            image_format=image_format,
+        )
+        for page_idx in range(total_pages):
+            image_bytes = await self._render_page(
+                pdf_path, page_idx, dpi, backend_config=backend.config
+            )
+            try:
+                pages.append(image_bytes)
+            finally:
+                self._buffer_pool.release(image_bytes)
+
+        logger.info(
+            "pages_rendered",
+            total_pages=total_pages,
+            dpi=dpi,
+            total_bytes=pages.nbytes,
+        )
+        return pages
+
     async def convert_pdf(
         self,
-        pdf_path: Path,
+        pdf_path: Path | PdfHandle,
         output_path: Path | None = None,
         options: ConversionOptions | None = None,
         progress_callback: ProgressCallback | None = None,
+        rendered_pages: RenderedPages | None = None,
     ) -> ConversionResult:
         """Convert a PDF to Markdown.
 
@@ -222,18 +557,25 @@ class HybridPipeline:
         1. Validates the input PDF
         2. Generates a document ID
         3. Renders and processes each page
-        4. Concatenates results
-        5. Optionally writes to output file
+        4. Writes each page to the output file, in page order, as soon as
+           it completes (the full Markdown is never held in memory)
 
         Args:
-            pdf_path: Path to the PDF file
+            pdf_path: Path to the PDF file, or a PdfHandle from `open_pdf()`
+                to reuse a document the caller already has open
             output_path: Path for output Markdown (optional)
                 If not provided, defaults to <pdf_name>.nemotron.md
             options: Conversion options (optional)
             progress_callback: Optional progress callback for real-time updates
+            rendered_pages: Page images from `render_pages()` for this PDF,
+                used instead of rendering again. Ignored if they were
+                rendered from another file, at a different DPI, or for a
+                backend with a different image size or format.
 
         Returns:
-            ConversionResult with full Markdown and per-page results
+            ConversionResult with a Markdown preview and per-page results;
+            the full Markdown is in `output_path` (see
+            `ConversionResult.markdown`)
 
         Raises:
             ValidationError: If PDF file doesn't exist or is invalid
@@ -250,6 +592,12 @@ class HybridPipeline:
         options = options or ConversionOptions()
         start_time = time.time()
 
+        # An open handle is used for page count, text layer and rendering;
+        # everything else (IDs, output naming, metadata) uses its path
+        source = pdf_path
+        if isinstance(pdf_path, PdfHandle):
+            pdf_path = pdf_path.path
+
         # Generate document ID (do this before validation so we have it for callbacks)
         doc_id = generate_doc_id(pdf_path.name)
 
@@ -266,7 +614,7 @@ class HybridPipeline:
             logger.info("conversion_started", pdf=str(pdf_path))
 
             # Get page count
-            total_pages = get_page_count(pdf_path)
+            total_pages = await self._page_count(source)
             logger.info("pdf_loaded", total_pages=total_pages)
 
             # Notify conversion start
@@ -294,100 +642,180 @@ class HybridPipeline:
             # Get DPI
             dpi = options.dpi or self.config.resources.page_render_dpi
 
-            # Create semaphore for concurrency control
-            semaphore = asyncio.Semaphore(self.config.resources.max_workers)
+            max_side, image_format = self._image_settings(backend.config)
+            if rendered_pages is not None and not rendered_pages.matches(
+                pdf_path, dpi, max_side, image_format
+            ):
+                logger.warning(
+                    "rendered_pages_ignored",
+                    rendered_source=str(rendered_pages.source),
+                    rendered_dpi=rendered_pages.dpi,
+                    rendered_max_side=rendered_pages.max_side,
+                    rendered_image_format=rendered_pages.image_format,
+                    dpi=dpi,
+                    max_side=max_side,
+                    image_format=image_format,
+                )
+                rendered_pages = None
+
+            # Backend calls are bounded by the page concurrency; rendering may
+            # run up to one extra batch ahead so the backend never waits on
+            # pdfium, while in-flight images stay bounded
+            page_concurrency = self.config.resources.page_concurrency
+            ocr_slots = asyncio.Semaphore(page_concurrency)
+
+            # Backends that take several images per request get pages in
+            # batches; the slots then bound requests rather than pages, so
+            # enough pages are kept in flight to fill every request
+            pages_per_request = self.config.resources.pages_per_request
+            batcher = None
+            if pages_per_request > 1 and getattr(
+                backend, "supports_document_processing", False
+            ):
+                batcher = PageBatcher(
+                    backend, doc_id, pages_per_request, slots=ocr_slots
+                )
+            else:
+                pages_per_request = 1
+            semaphore = asyncio.Semaphore(2 * page_concurrency * pages_per_request)
 
             logger.info(
                 "starting_concurrent_processing",
                 num_pages=end_idx - start_idx,
-                max_workers=self.config.resources.max_workers,
+                page_concurrency=page_concurrency,
+                pages_per_request=pages_per_request,
             )
 
             # Process pages concurrently with semaphore
-            async def process_with_semaphore(page_idx: int):
+            async def process_with_semaphore(
+                page_idx: int,
+            ) -> tuple[int, PageResult | None]:
                 """Process a single page with semaphore control."""
                 async with semaphore:
-                    return await self._process_single_page(
-                        pdf_path=pdf_path,
-                        page_idx=page_idx,
-                        dpi=dpi,
-                        backend=backend,
-                        backend_name=backend_name,
-                        doc_id=doc_id,
-                        total_pages=total_pages,
-                        progress_callback=progress_callback,
-                    )
+                    try:
+                        page_result = await self._process_single_page(
+                            pdf_path=source,
+                            page_idx=page_idx,
+                            dpi=dpi,
+                            backend=backend,
+                            backend_name=backend_name,
+                            doc_id=doc_id,
+                            total_pages=total_pages,
+                            progress_callback=progress_callback,
+                            force_ocr=options.force_ocr,
+                            text_layer_min_chars=options.text_layer_min_chars,
+                            ocr_slots=ocr_slots,
+                            batcher=batcher,
+                            rendered_pages=rendered_pages,
+                        )
+                    except Exception as e:
+                        # Exception raised during processing; skip the page
+                        logger.error(
+                            "page_processing_exception",
+                            error=str(e),
+                            error_type=type(e).__name__,
+                        )
+                        page_result = None
+                    return page_idx, page_result
+
+            # Determine output path
+            if output_path is None:
+                output_path = pdf_path.with_suffix(f".{backend_name.split('-')[0]}.md")
 
             # Create tasks for all pages
             tasks = [
-                process_with_semaphore(page_idx)
+                asyncio.create_task(process_with_semaphore(page_idx))
                 for page_idx in range(start_idx, end_idx)
             ]
 
-            # Execute concurrently and gather results
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-
-            # Separate successful results from errors, maintaining page order
+            # Write each page as soon as it and all earlier pages are done.
+            # Pages finish out of order, so completed pages wait in a heap
+            # keyed by page index until the next page to write arrives.
             page_results: list[PageResult] = []
-            page_markdowns: list[str] = []
+            preview = ""
+            completed: list[tuple[int, PageResult | None]] = []
+            next_idx = start_idx
+
+            try:
+                with output_path.open("w", encoding="utf-8", buffering=1 << 20) as out:
+                    for next_done in asyncio.as_completed(tasks):
+                        heapq.heappush(completed, await next_done)
+
+                        while completed and completed[0][0] == next_idx:
+                            _, page_result = heapq.heappop(completed)
+                            next_idx += 1
+                            if page_result is None:
+                                # Page processing failed (error already logged)
+                                continue
+
+                            part = page_result.content
+                            if options.add_page_separators:
+                                part = options.page_separator_format.format(
+                                    page_num=page_result.page_num
+                                ) + part
+                            if page_results:
+                                part = "\n\n" + part
+
+                            out.write(part)
+                            if len(preview) < PREVIEW_CHARS:
+                                preview = (preview + part)[:PREVIEW_CHARS]
+                            # Keep the metadata only; the content is on
+                            # disk, so record its length for reporting
+                            page_results.append(
+                                page_result.model_copy(
+                                    update={
+                                        "content": "",
+                                        "metadata": {
+                                            **page_result.metadata,
+                                            "markdown_chars": len(page_result.content),
+                                        },
+                                    }
+                                )
+                            )
+            finally:
+                for task in tasks:
+                    task.cancel()
+                if batcher is not None:
+                    await batcher.aclose()
+                if isinstance(source, PdfHandle):
+                    # The caller may close the handle as soon as we return
+                    await asyncio.gather(*tasks, return_exceptions=True)
+                    await self._drain_pdfium_thread()
+                # Counted per document, so concurrent conversions don't mix
+                cache_counts = (
+                    backend.pop_doc_counts(doc_id)
+                    if isinstance(backend, CachingBackend)
+                    else None
+                )
 
-            for result in results:
-                if isinstance(result, Exception):
-                    # Exception raised during processing
-                    logger.error(
-                        "page_processing_exception",
-                        error=str(result),
-                        error_type=type(result).__name__,
-                    )
-                    # Continue with other pages, skip failed ones
-                    continue
-                elif result is None:
-                    # Page processing returned None (error already logged)
-                    continue
-                else:
-                    # Successful result
-                    page_results.append(result)
-                    page_markdowns.append(result.content)
-            
-            # Concatenate results
-            if options.add_page_separators:
-                parts = []
-                for page_result in page_results:
-                    separator = options.page_separator_format.format(
-                        page_num=page_result.page_num
-                    )
-                    parts.append(separator + page_result.content)
-                full_markdown = "\n\n".join(parts)
-            else:
-                full_markdown = "\n\n".join(page_markdowns)
-            
-            # Determine output path
-            if output_path is None:
-                output_path = pdf_path.with_suffix(f".{backend_name.split('-')[0]}.md")
-            
-            # Write output
-            output_path.write_text(full_markdown, encoding="utf-8")
             logger.info("output_written", path=str(output_path))
-            
+
             # Calculate timing
             elapsed = time.time() - start_time
+
+            metadata: dict[str, Any] = {
+                "elapsed_seconds": round(elapsed, 2),
+                "dpi": dpi,
+                "start_page": options.start_page,
+                "pages_requested": end_idx - start_idx,
+            }
+            metadata["text_layer_pages"] = sum(
+                1 for r in page_results if r.metadata.get("source") == "text_layer"
+            )
+            if cache_counts is not None:
+                metadata["cache_hits"], metadata["cache_misses"] = cache_counts
             
             # Build result
             result = ConversionResult(
                 doc_id=doc_id,
                 source_path=pdf_path,
                 output_path=output_path,
-                markdown=full_markdown,
+                preview=preview,
                 page_results=page_results,
                 total_pages=total_pages,
                 processed_pages=len(page_results),
                 backend_name=backend_name,
-                metadata={
-                    "elapsed_seconds": round(elapsed, 2),
-                    "dpi": dpi,
-                    "start_page": options.start_page,
-                    "pages_requested": end_idx - start_idx,
-                },
+                metadata=metadata,
             )
             
             logger.info(
@@ -427,11 +855,17 @@ class HybridPipeline:
             clear_context()
     
     async def close(self) -> None:
-        """Close backend connections."""
+        """Close backend connections and shut down render workers."""
         if self._backend is not None:
             await self._backend.close()
             self._backend = None
             self._backend_name = None
+        if self._render_pool is not None:
+            self._render_pool.shutdown(wait=False, cancel_futures=True)
+            self._render_pool = None
+        if self._pdfium_thread is not None:
+            self._pdfium_thread.shutdown(wait=False, cancel_futures=True)
+            self._pdfium_thread = None
     
     async def __aenter__(self) -> "HybridPipeline":
         """Async context manager entry."""
@@ -21,14 +21,29 @@ from docling_hybrid.renderer.core import (
     get_page_count,
     PdfRenderer,
     render_page_to_png_bytes,
+    render_page_worker,
     render_pdf_pages,
     render_region_to_png_bytes,
 )
+from docling_hybrid.renderer.handle import PdfHandle, open_pdf
+from docling_hybrid.renderer.pages import RenderedPages
+from docling_hybrid.renderer.textlayer import (
+    TextLayer,
+    extract_text_layer,
+    text_layer_to_markdown,
+)
 
 __all__ = [
     "render_page_to_png_bytes",
     "render_region_to_png_bytes",
+    "render_page_worker",
     "render_pdf_pages",
     "get_page_count",
     "PdfRenderer",
+    "PdfHandle",
+    "open_pdf",
+    "RenderedPages",
+    "TextLayer",
+    "extract_text_layer",
+    "text_layer_to_markdown",
 ]
@@ -22,22 +22,97 @@ Usage:
 
 import io
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import List, Optional, Tuple, overload
 
 import pypdfium2 as pdfium
 from PIL import Image
 
+from docling_hybrid.common.bufpool import BufferPool, PooledBufferWriter
 from docling_hybrid.common.errors import RenderingError, ValidationError
 from docling_hybrid.common.logging import get_logger
+from docling_hybrid.renderer.handle import PdfHandle
 
 logger = get_logger(__name__)
 
+# JPEG quality for page images; text stays legible to VLMs well below this
+JPEG_QUALITY = 85
 
-def get_page_count(pdf_path: Path) -> int:
+
+@overload
+def _encode_page(
+    page: pdfium.PdfPage,
+    dpi: int,
+    max_side: int | None = ...,
+    image_format: str = ...,
+    pool: None = ...,
+) -> bytes: ...
+
+
+@overload
+def _encode_page(
+    page: pdfium.PdfPage,
+    dpi: int,
+    max_side: int | None = ...,
+    image_format: str = ...,
+    pool: BufferPool | None = ...,
+) -> bytes | memoryview: ...
+
+
+def _encode_page(
+    page: pdfium.PdfPage,
+    dpi: int,
+    max_side: int | None = None,
+    image_format: str = "png",
+    pool: BufferPool | None = None,
+) -> bytes | memoryview:
+    """Rasterize a page and encode it as PNG or JPEG.
+
+    When `max_side` is given the page is rendered directly at the size the
+    vision encoder will use, rather than rendered at full DPI and resized.
+
+    Args:
+        page: Open pdfium page
+        dpi: Resolution in dots per inch
+        max_side: Optional cap on the longest side in pixels
+        image_format: "png" or "jpeg"
+        pool: Optional buffer pool to encode into
+
+    Returns:
+        Encoded image as bytes (or a memoryview over a pooled buffer)
+    """
+    # Calculate scale factor for DPI (pypdfium2 default is 72 DPI)
+    scale = dpi / 72.0
+    if max_side is not None:
+        width, height = page.get_size()
+        scale = min(scale, max_side / max(width, height))
+
+    # Render to bitmap and convert to an RGB PIL image (pdfium composites
+    # onto white, so there is no alpha channel to preserve)
+    bitmap = page.render(scale=scale, rotation=0)
+    pil_image = bitmap.to_pil()
+    if pil_image.mode != "RGB":
+        pil_image = pil_image.convert("RGB")
+
+    if image_format == "jpeg":
+        save_kwargs = {"format": "JPEG", "quality": JPEG_QUALITY}
+    else:
+        save_kwargs = {"format": "PNG", "optimize": True}
+
+    if pool is not None:
+        writer = PooledBufferWriter(pool)
+        pil_image.save(writer, **save_kwargs)
+        return writer.getbuffer()
+
+    buffer = io.BytesIO()
+    pil_image.save(buffer, **save_kwargs)
+    return buffer.getvalue()
+
+
+def get_page_count(pdf_path: Path | PdfHandle) -> int:
     """Get the number of pages in a PDF.
     
     Args:
-        pdf_path: Path to the PDF file
+        pdf_path: Path to the PDF file, or an already open PdfHandle
         
     Returns:
         Number of pages in the PDF
@@ -50,6 +125,9 @@ def get_page_count(pdf_path: Path) -> int:
         >>> count = get_page_count(Path("document.pdf"))
         >>> print(f"Document has {count} pages")
     """
+    if isinstance(pdf_path, PdfHandle):
+        return len(pdf_path)
+    
     if not pdf_path.exists():
         raise ValidationError(
             f"PDF file not found: {pdf_path}",
@@ -69,26 +147,37 @@ def get_page_count(pdf_path: Path) -> int:
 
 
 def render_page_to_png_bytes(
-    pdf_path: Path,
+    pdf_path: Path | PdfHandle,
     page_index: int,
     dpi: int = 200,
-) -> bytes:
+    pool: BufferPool | None = None,
+    max_side: int | None = None,
+    image_format: str = "png",
+) -> bytes | memoryview:
     """Render a PDF page to PNG bytes.
     
     Converts a single PDF page to a PNG image suitable for VLM inference.
-    The output is RGB format, optimized for model input.
+    The output is RGB format, optimized for model input. Pass `max_side`
+    and `image_format="jpeg"` to get a smaller image sized for the model's
+    vision encoder instead.
     
     Args:
-        pdf_path: Path to the PDF file
+        pdf_path: Path to the PDF file, or an already open PdfHandle
         page_index: Page index (0-based)
         dpi: Resolution in dots per inch (default: 200)
             - 72 DPI: Low quality, fast, ~100KB per page
             - 150 DPI: Medium quality, ~300KB per page
             - 200 DPI: Good quality (recommended), ~500KB per page
             - 300 DPI: High quality, slower, ~1MB per page
+        pool: Optional buffer pool. When given, the PNG is encoded into a
+            pooled buffer and a memoryview over it is returned; pass the view
+            to `pool.release()` once the image has been consumed.
+        max_side: Optional cap on the longest side in pixels; the page is
+            rendered at the lower of `dpi` and this size
+        image_format: "png" (default) or "jpeg"
     
     Returns:
-        PNG image as bytes
+        Encoded image as bytes (or a memoryview over a pooled buffer)
         
     Raises:
         ValidationError: If PDF file doesn't exist or page index is invalid
@@ -111,11 +200,11 @@ def render_page_to_png_bytes(
         ... )
     
     Note:
-        The function opens and closes the PDF for each call. For batch
-        processing, consider using render_document_pages() instead.
+        Given a path, the function opens and closes the PDF for each call.
+        Pass a PdfHandle from `open_pdf()` to reuse one open document.
     """
     # Validate inputs
-    if not pdf_path.exists():
+    if not isinstance(pdf_path, PdfHandle) and not pdf_path.exists():
         raise ValidationError(
             f"PDF file not found: {pdf_path}",
             details={"path": str(pdf_path)}
@@ -133,45 +222,32 @@ def render_page_to_png_bytes(
             details={"dpi": dpi, "hint": "Use 150-200 for local dev, 200-300 for production"}
         )
     
+    # Open PDF (unless the caller already has it open)
+    owns_pdf = not isinstance(pdf_path, PdfHandle)
+    pdf = None
     try:
-        # Open PDF
-        pdf = pdfium.PdfDocument(str(pdf_path))
+        pdf = (
+            pdf_path.document
+            if isinstance(pdf_path, PdfHandle)
+            else pdfium.PdfDocument(str(pdf_path))
+        )
         
         # Validate page index
         if page_index >= len(pdf):
-            pdf.close()
             raise ValidationError(
                 f"Page index {page_index} out of range (PDF has {len(pdf)} pages)",
                 details={"page_index": page_index, "total_pages": len(pdf)}
             )
         
-        # Get page
-        page = pdf[page_index]
-        
-        # Calculate scale factor for DPI (pypdfium2 default is 72 DPI)
-        scale = dpi / 72.0
-        
-        # Render to bitmap
-        bitmap = page.render(
-            scale=scale,
-            rotation=0,
+        # Render and encode
+        png_bytes = _encode_page(
+            pdf[page_index],
+            dpi=dpi,
+            max_side=max_side,
+            image_format=image_format,
+            pool=pool,
         )
         
-        # Convert to PIL Image
-        pil_image = bitmap.to_pil()
-        
-        # Ensure RGB mode
-        if pil_image.mode != "RGB":
-            pil_image = pil_image.convert("RGB")
-        
-        # Export to PNG bytes
-        buffer = io.BytesIO()
-        pil_image.save(buffer, format="PNG", optimize=True)
-        png_bytes = buffer.getvalue()
-        
-        # Cleanup
-        pdf.close()
-        
         logger.debug(
             "page_rendered",
             pdf=str(pdf_path),
@@ -194,6 +270,9 @@ def render_page_to_png_bytes(
                 "error": str(e),
             }
         ) from e
+    finally:
+        if owns_pdf and pdf is not None:
+            pdf.close()
 
 
 def render_region_to_png_bytes(
@@ -421,15 +500,19 @@ class PdfRenderer:
         self,
         page_index: int,
         dpi: int = 200,
+        max_side: int | None = None,
+        image_format: str = "png",
     ) -> bytes:
         """Render a single page to PNG bytes.
 
         Args:
             page_index: Page index (0-based)
             dpi: Resolution in dots per inch (default: 200)
+            max_side: Optional cap on the longest side in pixels
+            image_format: "png" (default) or "jpeg"
 
         Returns:
-            PNG image as bytes
+            Encoded image as bytes
 
         Raises:
             RuntimeError: If called before entering context
@@ -462,26 +545,13 @@ class PdfRenderer:
             )
 
         try:
-            # Get page
-            page = self._pdf[page_index]
-
-            # Calculate scale factor
-            scale = dpi / 72.0
-
-            # Render to bitmap
-            bitmap = page.render(scale=scale, rotation=0)
-
-            # Convert to PIL Image
-            pil_image = bitmap.to_pil()
-
-            # Ensure RGB mode
-            if pil_image.mode != "RGB":
-                pil_image = pil_image.convert("RGB")
-
-            # Export to PNG bytes
-            buffer = io.BytesIO()
-            pil_image.save(buffer, format="PNG", optimize=True)
-            png_bytes = buffer.getvalue()
+            # Render and encode
+            png_bytes = _encode_page(
+                self._pdf[page_index],
+                dpi=dpi,
+                max_side=max_side,
+                image_format=image_format,
+            )
 
             logger.debug(
                 "page_rendered_batch",
@@ -607,3 +677,62 @@ def render_pdf_pages(
     """
     with PdfRenderer(pdf_path) as renderer:
         return renderer.render_pages(page_indices=page_indices, dpi=dpi)
+
+
+# ============================================================================
+# Process Pool Rendering
+# ============================================================================
+
+# Open renderer in the current worker process, keyed by (path, mtime) so a
+# file rewritten between conversions is reopened rather than served stale
+_worker_renderer: tuple[tuple[str, float], PdfRenderer] | None = None
+
+
+def render_page_worker(
+    pdf_path: str,
+    mtime: float,
+    page_index: int,
+    dpi: int = 200,
+    max_side: int | None = None,
+    image_format: str = "png",
+) -> bytes:
+    """Render a page to PNG bytes inside a process pool worker.
+
+    Module-level so it can be pickled for `ProcessPoolExecutor`. Each worker
+    keeps the most recently used document open across calls, so consecutive
+    pages of the same PDF skip reopening it.
+
+    Args:
+        pdf_path: Path to the PDF file (as a string, for pickling)
+        mtime: Modification time of the file, used to detect rewrites
+        page_index: Page index (0-based)
+        dpi: Resolution in dots per inch (default: 200)
+        max_side: Optional cap on the longest side in pixels
+        image_format: "png" (default) or "jpeg"
+
+    Returns:
+        Encoded image as bytes
+
+    Raises:
+        ValidationError: If PDF file doesn't exist or page index is invalid
+        RenderingError: If page cannot be rendered
+
+    Example:
+        >>> with ProcessPoolExecutor() as executor:
+        ...     png = await loop.run_in_executor(
+        ...         executor, render_page_worker, str(path), path.stat().st_mtime, 0, 200
+        ...     )
+    """
+    global _worker_renderer
+
+    key = (pdf_path, mtime)
+    if _worker_renderer is None or _worker_renderer[0] != key:
+        if _worker_renderer is not None:
+            _worker_renderer[1].__exit__(None, None, None)
+            _worker_renderer = None
+        renderer = PdfRenderer(Path(pdf_path)).__enter__()
+        _worker_renderer = (key, renderer)
+
+    return _worker_renderer[1].render_page(
+        page_index, dpi=dpi, max_side=max_side, image_format=image_format
+    )
@@ -0,0 +1,86 @@
+"""Open PDF handles shared across rendering calls.
+
+Each rendering helper opens and parses the PDF on its own when handed a
+path. For large or graphics-heavy documents that parse is expensive, so
+callers that touch the same PDF several times (page count, text layer,
+rendering) can open it once with `open_pdf` and pass the handle instead.
+
+Handles are not shared with render worker processes; those open the file
+themselves from `PdfHandle.path`.
+
+Usage:
+    from docling_hybrid.renderer.handle import open_pdf
+
+    with open_pdf(Path("document.pdf")) as pdf:
+        total_pages = len(pdf)
+        result = await pipeline.convert_pdf(pdf)
+"""
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+
+import pypdfium2 as pdfium
+
+from docling_hybrid.common.errors import RenderingError, ValidationError
+
+
+@dataclass
+class PdfHandle:
+    """An open PDF document and the path it was opened from.
+
+    Attributes:
+        path: Path to the PDF file
+        document: Open pypdfium2 document
+    """
+
+    path: Path
+    document: pdfium.PdfDocument
+
+    def __len__(self) -> int:
+        """Number of pages in the document."""
+        return len(self.document)
+
+    @property
+    def name(self) -> str:
+        """File name of the PDF."""
+        return self.path.name
+
+
+@contextmanager
+def open_pdf(pdf_path: Path) -> Iterator[PdfHandle]:
+    """Open a PDF once for use across several rendering calls.
+
+    Args:
+        pdf_path: Path to the PDF file
+
+    Yields:
+        PdfHandle, closed when the context exits
+
+    Raises:
+        ValidationError: If PDF file doesn't exist
+        RenderingError: If PDF cannot be opened
+
+    Example:
+        >>> with open_pdf(Path("document.pdf")) as pdf:
+        ...     print(f"Document has {len(pdf)} pages")
+    """
+    if not pdf_path.exists():
+        raise ValidationError(
+            f"PDF file not found: {pdf_path}",
+            details={"path": str(pdf_path)}
+        )
+
+    try:
+        document = pdfium.PdfDocument(str(pdf_path))
+    except Exception as e:
+        raise RenderingError(
+            f"Failed to open PDF: {e}",
+            details={"path": str(pdf_path), "error": str(e)}
+        ) from e
+
+    try:
+        yield PdfHandle(path=pdf_path, document=document)
+    finally:
+        document.close()
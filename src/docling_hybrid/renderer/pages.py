@@ -0,0 +1,127 @@
+"""Rendered page images kept in memory for reuse.
+
+Rendering is the memory- and CPU-heavy step of a conversion. When the same
+PDF is converted several times in one process (for example with different
+options or callbacks), the images can be rendered once and passed to each
+`convert_pdf` call instead of being re-rendered every time.
+
+`RenderedPages` stores all images back to back in one `bytearray` with an
+offsets array, rather than as one `bytes` object per page, and hands out
+zero-copy memoryviews. It also records what the images were rendered from
+and with which settings, so `convert_pdf` can reject images that do not
+match the conversion.
+
+Usage:
+    from docling_hybrid.renderer.pages import RenderedPages
+
+    pages = await pipeline.render_pages(Path("document.pdf"))
+    first = await pipeline.convert_pdf(pdf_path, rendered_pages=pages)
+    second = await pipeline.convert_pdf(pdf_path, rendered_pages=pages, options=...)
+"""
+
+from array import array
+from pathlib import Path
+
+
+class RenderedPages:
+    """Encoded page images of one PDF, stored contiguously.
+
+    Pages are appended in page order while rendering and read by zero-based
+    page index afterwards. Appending is not possible while views returned
+    by indexing are still alive.
+
+    Attributes:
+        dpi: Resolution the pages were rendered at
+        source: Resolved path of the PDF the pages were rendered from
+        max_side: Cap on the longest image side in pixels, if any
+        image_format: Encoding of the images ("png" or "jpeg")
+
+    Example:
+        >>> pages = RenderedPages(dpi=200, source=Path("document.pdf"))
+        >>> pages.append(png_bytes)
+        >>> len(pages), bytes(pages[0]) == png_bytes
+        (1, True)
+    """
+
+    def __init__(
+        self,
+        dpi: int,
+        source: Path | None = None,
+        max_side: int | None = None,
+        image_format: str = "png",
+    ) -> None:
+        """Create an empty store.
+
+        Args:
+            dpi: Resolution the pages are rendered at
+            source: PDF the pages are rendered from
+            max_side: Cap on the longest image side in pixels, if any
+            image_format: Encoding of the images (default: "png")
+        """
+        self.dpi = dpi
+        self.source = source.resolve() if source is not None else None
+        self.max_side = max_side
+        self.image_format = image_format
+        self._data = bytearray()
+        self._offsets = array("Q", [0])
+
+    def append(self, image_bytes: bytes | memoryview) -> None:
+        """Add the image of the next page.
+
+        Args:
+            image_bytes: Encoded image bytes
+        """
+        self._data += image_bytes
+        self._offsets.append(len(self._data))
+
+    def __len__(self) -> int:
+        """Number of pages stored."""
+        return len(self._offsets) - 1
+
+    def __getitem__(self, page_index: int) -> memoryview:
+        """Get a read-only view of a page image.
+
+        Args:
+            page_index: Zero-based page index
+
+        Returns:
+            Memoryview over the stored image bytes
+
+        Raises:
+            IndexError: If no image is stored for the page
+        """
+        if not 0 <= page_index < len(self):
+            raise IndexError(f"page index {page_index} out of range")
+        start, end = self._offsets[page_index], self._offsets[page_index + 1]
+        return memoryview(self._data).toreadonly()[start:end]
+
+    def matches(
+        self,
+        source: Path,
+        dpi: int,
+        max_side: int | None,
+        image_format: str,
+    ) -> bool:
+        """Check whether the images fit a conversion.
+
+        Args:
+            source: PDF being converted
+            dpi: Rendering DPI of the conversion
+            max_side: Longest image side the backend expects, if capped
+            image_format: Image encoding the backend expects
+
+        Returns:
+            True if the pages were rendered from `source` with the same
+            settings
+        """
+        return (
+            self.source == source.resolve()
+            and self.dpi == dpi
+            and self.max_side == max_side
+            and self.image_format == image_format
+        )
+
+    @property
+    def nbytes(self) -> int:
+        """Total size of the stored images in bytes."""
+        return len(self._data)
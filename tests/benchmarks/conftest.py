@@ -200,11 +200,12 @@ def sample_pdf_10_pages(tmp_path: Path) -> Path:
         c.drawString(100, 650, "Lorem ipsum dolor sit amet, consectetur adipiscing elit.")
         c.drawString(100, 600, "Used for performance benchmarking.")
 
-        # Add more text to make the page more realistic
-        y = 550
-        for i in range(10):
-            c.drawString(100, y, f"Line {i+1}: Additional content for testing.")
-            y -= 20
+        # Add more text to make the page more realistic (one text object,
+        # 20pt between lines)
+        text = c.beginText(100, 550)
+        text.setLeading(20)
+        text.textLines([f"Line {i+1}: Additional content for testing." for i in range(10)])
+        c.drawText(text)
 
         c.showPage()
 
@@ -227,10 +228,10 @@ def sample_pdf_50_pages(tmp_path: Path) -> Path:
         c.drawString(100, 650, "Lorem ipsum dolor sit amet, consectetur adipiscing elit.")
 
         # Add varying content
-        y = 600
-        for i in range(15):
-            c.drawString(100, y, f"Line {i+1}: Content for page {page_num}.")
-            y -= 20
+        text = c.beginText(100, 600)
+        text.setLeading(20)
+        text.textLines([f"Line {i+1}: Content for page {page_num}." for i in range(15)])
+        c.drawText(text)
 
         c.showPage()
 
@@ -252,10 +253,10 @@ def sample_pdf_100_pages(tmp_path: Path) -> Path:
         c.drawString(100, 700, f"This is page {page_num} of 100.")
 
         # Minimal content to keep PDF size manageable
-        y = 650
-        for i in range(10):
-            c.drawString(100, y, f"Line {i+1}: Test content.")
-            y -= 30
+        text = c.beginText(100, 650)
+        text.setLeading(30)
+        text.textLines([f"Line {i+1}: Test content." for i in range(10)])
+        c.drawText(text)
 
         c.showPage()
 
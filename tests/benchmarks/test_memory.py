@@ -21,6 +21,10 @@ import pytest
 from docling_hybrid.orchestrator import HybridPipeline
 from docling_hybrid.orchestrator.models import ConversionOptions
 
+# The fixture PDFs carry a text layer; OCR every page so the benchmarks
+# still exercise rendering and the backend.
+OCR_OPTIONS = ConversionOptions(force_ocr=True)
+
 
 @pytest.mark.benchmark
 class TestMemoryUsage:
@@ -40,7 +44,7 @@ class TestMemoryUsage:
         with patch.object(
             benchmark_pipeline, "_get_backend", return_value=fast_mock_backend
         ):
-            result = await benchmark_pipeline.convert_pdf(sample_pdf_10_pages)
+            result = await benchmark_pipeline.convert_pdf(sample_pdf_10_pages, options=OCR_OPTIONS)
 
         stats = resource_monitor.stop()
 
@@ -70,7 +74,7 @@ class TestMemoryUsage:
         with patch.object(
             benchmark_pipeline, "_get_backend", return_value=fast_mock_backend
         ):
-            result = await benchmark_pipeline.convert_pdf(sample_pdf_50_pages)
+            result = await benchmark_pipeline.convert_pdf(sample_pdf_50_pages, options=OCR_OPTIONS)
 
         stats = resource_monitor.stop()
 
@@ -102,7 +106,7 @@ class TestMemoryUsage:
         with patch.object(
             benchmark_pipeline, "_get_backend", return_value=fast_mock_backend
         ):
-            result = await benchmark_pipeline.convert_pdf(sample_pdf_100_pages)
+            result = await benchmark_pipeline.convert_pdf(sample_pdf_100_pages, options=OCR_OPTIONS)
 
         stats = resource_monitor.stop()
 
@@ -152,7 +156,7 @@ class TestMemoryScaling:
             with patch.object(
                 benchmark_pipeline, "_get_backend", return_value=fast_mock_backend
             ):
-                result = await benchmark_pipeline.convert_pdf(pdf_path)
+                result = await benchmark_pipeline.convert_pdf(pdf_path, options=OCR_OPTIONS)
 
             stats = resource_monitor.stop()
 
@@ -195,7 +199,7 @@ class TestMemoryScaling:
             gc.collect()
             await asyncio.sleep(0.1)
 
-            options = ConversionOptions(dpi=dpi)
+            options = ConversionOptions(force_ocr=True, dpi=dpi)
             resource_monitor.start()
 
             with patch.object(
@@ -247,7 +251,9 @@ class TestMemoryLeaks:
             with patch.object(
                 benchmark_pipeline, "_get_backend", return_value=fast_mock_backend
             ):
-                result = await benchmark_pipeline.convert_pdf(sample_pdf_10_pages)
+                result = await benchmark_pipeline.convert_pdf(
+                    sample_pdf_10_pages, options=OCR_OPTIONS
+                )
 
             gc.collect()  # Force cleanup
 
@@ -291,7 +297,7 @@ class TestMemoryLeaks:
         pipeline = HybridPipeline(benchmark_config)
 
         with patch.object(pipeline, "_get_backend", return_value=fast_mock_backend):
-            result = await pipeline.convert_pdf(sample_pdf_10_pages)
+            result = await pipeline.convert_pdf(sample_pdf_10_pages, options=OCR_OPTIONS)
 
         # Clean up
         if pipeline._backend:
@@ -332,7 +338,7 @@ class TestResourceConstraints:
         resource_monitor.start()
 
         with patch.object(pipeline, "_get_backend", return_value=fast_mock_backend):
-            result = await pipeline.convert_pdf(sample_pdf_50_pages)
+            result = await pipeline.convert_pdf(sample_pdf_50_pages, options=OCR_OPTIONS)
 
         stats = resource_monitor.stop()
 
@@ -356,7 +362,7 @@ class TestResourceConstraints:
         resource_monitor,
     ):
         """Test that max_pages helps control memory usage."""
-        options = ConversionOptions(max_pages=10)
+        options = ConversionOptions(force_ocr=True, max_pages=10)
 
         resource_monitor.start()
 
@@ -408,7 +414,7 @@ class TestConcurrentMemory:
             resource_monitor.start()
 
             with patch.object(pipeline, "_get_backend", return_value=fast_mock_backend):
-                result = await pipeline.convert_pdf(sample_pdf_50_pages)
+                result = await pipeline.convert_pdf(sample_pdf_50_pages, options=OCR_OPTIONS)
 
             stats = resource_monitor.stop()
 
@@ -448,7 +454,9 @@ class TestConcurrentMemory:
             with patch.object(
                 benchmark_pipeline, "_get_backend", return_value=fast_mock_backend
             ):
-                return await benchmark_pipeline.convert_pdf(sample_pdf_10_pages)
+                return await benchmark_pipeline.convert_pdf(
+                    sample_pdf_10_pages, options=OCR_OPTIONS
+                )
 
         resource_monitor.start()
 
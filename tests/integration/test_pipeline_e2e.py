@@ -23,6 +23,10 @@ from docling_hybrid.orchestrator import HybridPipeline
 from docling_hybrid.orchestrator.models import ConversionOptions, ConversionResult
 from tests.mocks import mock_openrouter_success
 
+# The fixture PDFs carry a text layer; OCR every page so these tests
+# still exercise rendering and the backend.
+OCR_OPTIONS = ConversionOptions(force_ocr=True)
+
 
 @pytest.fixture
 def e2e_config(tmp_path: Path) -> Path:
@@ -133,7 +137,7 @@ class TestEndToEndConversion:
                 )
 
             result = await pipeline.convert_pdf(
-                sample_pdf_for_e2e, output_path=output_path
+                sample_pdf_for_e2e, output_path=output_path, options=OCR_OPTIONS
             )
 
         # Verify result
@@ -168,6 +172,7 @@ class TestEndToEndConversion:
         pipeline = HybridPipeline(config)
 
         options = ConversionOptions(
+            force_ocr=True,
             max_pages=3,
             start_page=2,
             dpi=100,
@@ -222,7 +227,7 @@ class TestEndToEndConversion:
                     repeat=True,
                 )
 
-            result = await pipeline.convert_pdf(sample_pdf_for_e2e)
+            result = await pipeline.convert_pdf(sample_pdf_for_e2e, options=OCR_OPTIONS)
 
         assert result.output_path is None
         assert len(result.markdown) > 0
@@ -287,7 +292,7 @@ class TestErrorHandling:
                     payload=mock_openrouter_success(content),
                 )
 
-            result = await pipeline.convert_pdf(sample_pdf_for_e2e)
+            result = await pipeline.convert_pdf(sample_pdf_for_e2e, options=OCR_OPTIONS)
 
         # Should have processed 4 successful pages despite 1 failure
         assert result.total_pages == 5
@@ -331,7 +336,7 @@ class TestConcurrentProcessing:
                 repeat=True,
             )
 
-            result = await pipeline.convert_pdf(sample_pdf_for_e2e)
+            result = await pipeline.convert_pdf(sample_pdf_for_e2e, options=OCR_OPTIONS)
 
         assert result.processed_pages == 5
         assert len(call_times) == 5
@@ -387,7 +392,7 @@ class TestBatchScenarios:
                 )
 
             for pdf_path in pdf_paths:
-                result = await pipeline.convert_pdf(pdf_path)
+                result = await pipeline.convert_pdf(pdf_path, options=OCR_OPTIONS)
                 results.append(result)
 
         assert len(results) == 3
@@ -439,7 +444,7 @@ class TestBatchScenarios:
                 )
 
             for i, pdf_path in enumerate(pdf_paths):
-                await pipeline.convert_pdf(pdf_path)
+                await pipeline.convert_pdf(pdf_path, options=OCR_OPTIONS)
 
                 # Sample memory every 3 documents
                 if i % 3 == 0:
@@ -506,7 +511,7 @@ class TestPipelineResourceManagement:
                     repeat=True,
                 )
 
-            await pipeline.convert_pdf(sample_pdf_for_e2e)
+            await pipeline.convert_pdf(sample_pdf_for_e2e, options=OCR_OPTIONS)
 
             # Close pipeline backend
             if pipeline._backend:
@@ -541,10 +546,10 @@ class TestPipelineResourceManagement:
                     )
 
             # First conversion
-            result1 = await pipeline.convert_pdf(sample_pdf_for_e2e)
+            result1 = await pipeline.convert_pdf(sample_pdf_for_e2e, options=OCR_OPTIONS)
 
             # Second conversion
-            result2 = await pipeline.convert_pdf(sample_pdf_for_e2e)
+            result2 = await pipeline.convert_pdf(sample_pdf_for_e2e, options=OCR_OPTIONS)
 
         assert result1.processed_pages == 5
         assert result2.processed_pages == 5
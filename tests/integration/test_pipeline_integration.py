@@ -32,6 +32,10 @@ from docling_hybrid.orchestrator.models import ConversionOptions, ConversionResu
 from docling_hybrid.orchestrator.progress import ProgressCallback
 from tests.mocks import mock_openrouter_success
 
+# The fixture PDFs carry a text layer; OCR every page so these tests
+# still exercise rendering and the backend.
+OCR_OPTIONS = ConversionOptions(force_ocr=True)
+
 
 # ============================================================================
 # Fixtures
@@ -142,7 +146,7 @@ class TestPipelineWithMockedOpenRouter:
                     repeat=True,
                 )
 
-            result = await pipeline.convert_pdf(sample_pdf_3_pages)
+            result = await pipeline.convert_pdf(sample_pdf_3_pages, options=OCR_OPTIONS)
 
         assert isinstance(result, ConversionResult)
         assert result.total_pages == 3
@@ -202,7 +206,7 @@ class TestPipelineWithMockedOpenRouter:
                 )
 
             result = await pipeline.convert_pdf(
-                sample_pdf_3_pages, progress_callback=callback
+                sample_pdf_3_pages, progress_callback=callback, options=OCR_OPTIONS
             )
 
         # Verify all expected events occurred
@@ -274,7 +278,7 @@ class TestPipelineWithMockedOpenRouter:
             )
 
             result = await pipeline.convert_pdf(
-                sample_pdf_3_pages, progress_callback=callback
+                sample_pdf_3_pages, progress_callback=callback, options=OCR_OPTIONS
             )
 
         # Should process 2 pages successfully despite 1 error
@@ -311,7 +315,7 @@ class TestPipelineWithMockedOpenRouter:
                 )
 
             start_time = time.time()
-            result = await pipeline.convert_pdf(sample_pdf_3_pages)
+            result = await pipeline.convert_pdf(sample_pdf_3_pages, options=OCR_OPTIONS)
             elapsed = time.time() - start_time
 
         assert result.processed_pages == 3
@@ -344,7 +348,7 @@ class TestPipelineWithMockedOpenRouter:
                     payload=mock_openrouter_success(content),
                 )
 
-            result = await pipeline.convert_pdf(sample_pdf_3_pages)
+            result = await pipeline.convert_pdf(sample_pdf_3_pages, options=OCR_OPTIONS)
 
         assert result.processed_pages == 3
 
@@ -366,6 +370,7 @@ class TestPipelineWithMockedOpenRouter:
         pipeline = HybridPipeline(config)
 
         options = ConversionOptions(
+            force_ocr=True,
             max_pages=2,
             start_page=2,
             dpi=100,
@@ -419,6 +424,7 @@ class TestPipelineWithLiveOpenRouter:
         output_path = tmp_path / "output_single.md"
 
         options = ConversionOptions(
+            force_ocr=True,
             max_pages=1,
             dpi=150,
         )
@@ -478,7 +484,7 @@ class TestPipelineWithLiveOpenRouter:
 
         callback = TrackingCallback()
 
-        options = ConversionOptions(max_pages=2)
+        options = ConversionOptions(force_ocr=True, max_pages=2)
 
         result = await pipeline.convert_pdf(
             first_test_pdf, options=options, progress_callback=callback
@@ -510,7 +516,7 @@ class TestPipelineWithLiveOpenRouter:
         config.resources.max_workers = 1
         pipeline_sequential = HybridPipeline(config)
 
-        options = ConversionOptions(max_pages=3, dpi=100)
+        options = ConversionOptions(force_ocr=True, max_pages=3, dpi=100)
 
         start_time = time.time()
         result_sequential = await pipeline_sequential.convert_pdf(
@@ -576,7 +582,7 @@ class TestPipelineBackendIntegration:
                 repeat=True,
             )
 
-            await pipeline.convert_pdf(sample_pdf_3_pages)
+            await pipeline.convert_pdf(sample_pdf_3_pages, options=OCR_OPTIONS)
 
         # Backend should be created
         assert pipeline._backend is not None
@@ -623,8 +629,8 @@ class TestPipelineBackendIntegration:
             )
 
             # Convert twice
-            await pipeline.convert_pdf(sample_pdf_3_pages)
-            await pipeline.convert_pdf(sample_pdf_3_pages)
+            await pipeline.convert_pdf(sample_pdf_3_pages, options=OCR_OPTIONS)
+            await pipeline.convert_pdf(sample_pdf_3_pages, options=OCR_OPTIONS)
 
         # Should reuse the same backend instance
         assert len(backend_instances) == 2
@@ -652,7 +658,7 @@ class TestPipelineBackendIntegration:
             )
 
             async with HybridPipeline(config) as pipeline:
-                result = await pipeline.convert_pdf(sample_pdf_3_pages)
+                result = await pipeline.convert_pdf(sample_pdf_3_pages, options=OCR_OPTIONS)
                 assert result.processed_pages == 3
 
             # After exiting context, backend should be closed
@@ -694,7 +700,7 @@ class TestPipelineRetryBehavior:
             # Second call succeeds
             return mock_openrouter_success("# Test\n\nContent.\n")
 
-        options = ConversionOptions(max_pages=1)
+        options = ConversionOptions(force_ocr=True, max_pages=1)
 
         with aioresponses() as mock_http:
             # First attempt: error
@@ -730,7 +736,7 @@ class TestPipelineRetryBehavior:
         config.resources.http_retry_attempts = 2
         pipeline = HybridPipeline(config)
 
-        options = ConversionOptions(max_pages=1)
+        options = ConversionOptions(force_ocr=True, max_pages=1)
 
         with aioresponses() as mock_http:
             # All attempts fail
@@ -0,0 +1,262 @@
+"""Unit tests for the page result cache.
+
+Tests cover:
+- Cache hits and misses
+- Key sensitivity to generation settings, backend and prompts
+- Per-document hit/miss counts
+- Persistence across wrapper instances
+- Sharing of concurrent calls for the same image
+- Caching of table and formula crops
+- Delegation of uncached methods
+"""
+
+import asyncio
+import sys
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from docling_hybrid.backends.base import OcrVlmBackend
+from docling_hybrid.backends.cache import CachingBackend
+from docling_hybrid.common.models import OcrBackendConfig
+
+
+class CountingBackend(OcrVlmBackend):
+    """Backend that counts page calls."""
+
+    def __init__(self, temperature: float = 0.0):
+        """Initialize counting backend."""
+        super().__init__(
+            OcrBackendConfig(
+                name="counting",
+                model="test-model",
+                base_url="http://localhost:8000",
+                temperature=temperature,
+            )
+        )
+        self.calls = 0
+
+    async def page_to_markdown(self, image_bytes, page_num, doc_id) -> str:
+        """Return markdown derived from the call count."""
+        self.calls += 1
+        return f"# Page {page_num} call {self.calls}"
+
+    async def table_to_markdown(self, image_bytes, meta) -> str:
+        """Return a fixed table."""
+        return "| A |"
+
+    async def formula_to_latex(self, image_bytes, meta) -> str:
+        """Return a fixed formula."""
+        return "x^2"
+
+
+@pytest.mark.asyncio
+async def test_repeated_image_hits_cache(tmp_path):
+    """Second request for the same image is served from cache."""
+    inner = CountingBackend()
+    backend = CachingBackend(inner, cache_dir=tmp_path)
+
+    first = await backend.page_to_markdown(b"image", 1, "doc-1")
+    second = await backend.page_to_markdown(b"image", 3, "doc-2")
+
+    assert first == second
+    assert inner.calls == 1
+    assert (backend.hits, backend.misses) == (1, 1)
+
+
+@pytest.mark.asyncio
+async def test_different_images_miss(tmp_path):
+    """Distinct images are cached separately."""
+    inner = CountingBackend()
+    backend = CachingBackend(inner, cache_dir=tmp_path)
+
+    await backend.page_to_markdown(b"image-a", 1, "doc-1")
+    await backend.page_to_markdown(b"image-b", 1, "doc-1")
+
+    assert inner.calls == 2
+    assert backend.misses == 2
+
+
+@pytest.mark.asyncio
+async def test_memoryview_matches_bytes_key(tmp_path):
+    """A pooled memoryview hashes the same as equivalent bytes."""
+    backend = CachingBackend(CountingBackend(), cache_dir=tmp_path)
+
+    assert backend.cache_key(memoryview(b"image")) == backend.cache_key(b"image")
+
+
+@pytest.mark.asyncio
+async def test_settings_change_key(tmp_path):
+    """Changing generation settings misses the cache."""
+    await CachingBackend(CountingBackend(0.0), cache_dir=tmp_path).page_to_markdown(
+        b"image", 1, "doc-1"
+    )
+    inner = CountingBackend(0.5)
+    backend = CachingBackend(inner, cache_dir=tmp_path)
+
+    await backend.page_to_markdown(b"image", 1, "doc-1")
+
+    assert inner.calls == 1
+    assert backend.misses == 1
+
+
+def test_backend_and_prompts_change_key(tmp_path, monkeypatch):
+    """Another backend, or an edited prompt, gets a different key."""
+    key = CachingBackend(CountingBackend(), cache_dir=tmp_path).cache_key(b"image")
+
+    other = CountingBackend()
+    other.name = "other-backend"
+    assert CachingBackend(other, cache_dir=tmp_path).cache_key(b"image") != key
+
+    monkeypatch.setattr(
+        sys.modules[CountingBackend.__module__], "PAGE_PROMPT", "edited", raising=False
+    )
+    assert CachingBackend(CountingBackend(), cache_dir=tmp_path).cache_key(b"image") != key
+
+
+@pytest.mark.asyncio
+async def test_cache_persists_across_instances(tmp_path):
+    """Entries written by one wrapper are read by another."""
+    await CachingBackend(CountingBackend(), cache_dir=tmp_path).page_to_markdown(
+        b"image", 1, "doc-1"
+    )
+    inner = CountingBackend()
+    backend = CachingBackend(inner, cache_dir=tmp_path)
+
+    result = await backend.page_to_markdown(b"image", 1, "doc-1")
+
+    assert result == "# Page 1 call 1"
+    assert inner.calls == 0
+    assert backend.hits == 1
+
+
+@pytest.mark.asyncio
+async def test_errors_are_not_cached(tmp_path):
+    """Inner failures propagate and leave no entry behind."""
+    inner = CountingBackend()
+    inner.page_to_markdown = AsyncMock(side_effect=RuntimeError("boom"))
+    backend = CachingBackend(inner, cache_dir=tmp_path)
+
+    with pytest.raises(RuntimeError):
+        await backend.page_to_markdown(b"image", 1, "doc-1")
+
+    assert not list(tmp_path.rglob("*.md"))
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_pages_share_one_call(tmp_path):
+    """Identical images requested at the same time reach the inner backend once."""
+    inner = CountingBackend()
+    convert = inner.page_to_markdown
+
+    async def slow_page_to_markdown(image_bytes, page_num, doc_id):
+        await asyncio.sleep(0.01)
+        return await convert(image_bytes, page_num, doc_id)
+
+    inner.page_to_markdown = slow_page_to_markdown
+    backend = CachingBackend(inner, cache_dir=tmp_path)
+
+    pages = await asyncio.gather(
+        *(backend.page_to_markdown(b"footer", n, "doc-1") for n in range(1, 4)),
+        backend.page_to_markdown(b"other", 4, "doc-1"),
+    )
+
+    assert pages[0] == pages[1] == pages[2]
+    assert inner.calls == 2
+    assert (backend.hits, backend.misses) == (2, 2)
+    assert backend.pop_doc_counts("doc-1") == (2, 2)
+    assert backend.pop_doc_counts("doc-1") == (0, 0)
+
+
+@pytest.mark.asyncio
+async def test_disk_io_runs_off_the_event_loop(tmp_path):
+    """Cache files are read and written through worker threads."""
+    backend = CachingBackend(CountingBackend(), cache_dir=tmp_path)
+
+    with patch(
+        "docling_hybrid.backends.cache.asyncio.to_thread",
+        side_effect=asyncio.to_thread,
+    ) as to_thread:
+        await backend.page_to_markdown(b"image", 1, "doc-1")
+        await backend.page_to_markdown(b"image", 1, "doc-1")
+
+    calls = [call.args[0].__name__ for call in to_thread.call_args_list]
+    assert calls == ["_read", "_write", "_read"]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_pages_share_errors(tmp_path):
+    """Pages waiting on a failed call get its error and nothing is cached."""
+    inner = CountingBackend()
+
+    async def failing_page_to_markdown(image_bytes, page_num, doc_id):
+        await asyncio.sleep(0.01)
+        raise RuntimeError("boom")
+
+    inner.page_to_markdown = AsyncMock(side_effect=failing_page_to_markdown)
+    backend = CachingBackend(inner, cache_dir=tmp_path)
+
+    results = await asyncio.gather(
+        backend.page_to_markdown(b"image", 1, "doc-1"),
+        backend.page_to_markdown(b"image", 2, "doc-1"),
+        return_exceptions=True,
+    )
+
+    assert all(isinstance(r, RuntimeError) for r in results)
+    assert inner.page_to_markdown.await_count == 1
+    assert not backend._inflight
+
+
+@pytest.mark.asyncio
+async def test_delegates_other_methods(tmp_path):
+    """Table, formula, health and close go to the inner backend."""
+    inner = CountingBackend()
+    inner.close = AsyncMock()
+    backend = CachingBackend(inner, cache_dir=tmp_path)
+
+    assert backend.name == "counting"
+    assert await backend.table_to_markdown(b"t", {}) == "| A |"
+    assert await backend.formula_to_latex(b"f", {}) == "x^2"
+    assert await backend.health_check() is True
+    await backend.close()
+    inner.close.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_table_and_formula_results_cached_per_task(tmp_path):
+    """Crops are cached separately from pages and from each other."""
+    inner = CountingBackend()
+    inner.table_to_markdown = AsyncMock(return_value="| A |")
+    inner.formula_to_latex = AsyncMock(return_value="x^2")
+    backend = CachingBackend(inner, cache_dir=tmp_path)
+    meta = {"doc_id": "doc-1", "page_num": 1}
+
+    for _ in range(2):
+        assert await backend.table_to_markdown(b"crop", meta) == "| A |"
+        assert await backend.formula_to_latex(b"crop", meta) == "x^2"
+    await backend.page_to_markdown(b"crop", 1, "doc-1")
+
+    assert inner.table_to_markdown.await_count == 1
+    assert inner.formula_to_latex.await_count == 1
+    assert inner.calls == 1
+    assert (backend.hits, backend.misses) == (2, 3)
+
+
+@pytest.mark.asyncio
+async def test_pages_to_markdown_forwards_only_misses(tmp_path):
+    """Multi-page calls serve cached pages and forward the rest together."""
+    inner = CountingBackend()
+    backend = CachingBackend(inner, cache_dir=tmp_path)
+    await backend.page_to_markdown(b"image-b", 2, "doc-1")
+
+    inner.pages_to_markdown = AsyncMock(return_value=["# A", "# C"])
+    pages = await backend.pages_to_markdown(
+        [b"image-a", b"image-b", b"image-c"], [1, 2, 3], "doc-1"
+    )
+
+    assert pages == ["# A", "# Page 2 call 1", "# C"]
+    inner.pages_to_markdown.assert_awaited_once_with(
+        [b"image-a", b"image-c"], [1, 3], "doc-1"
+    )
+    assert (backend.hits, backend.misses) == (1, 3)
+    assert await backend.page_to_markdown(b"image-c", 3, "doc-2") == "# C"
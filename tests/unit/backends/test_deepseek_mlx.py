@@ -0,0 +1,189 @@
+"""Unit tests for the DeepSeek MLX backend.
+
+mlx and mlx-vlm only install on macOS, so the tests replace the module's
+references to them with mocks.
+"""
+
+import io
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+from PIL import Image
+
+from docling_hybrid.backends import deepseek_mlx
+from docling_hybrid.backends.deepseek_mlx import DeepSeekMLXBackend
+from docling_hybrid.common.errors import BackendError, ConfigurationError
+from docling_hybrid.common.models import OcrBackendConfig
+
+
+@pytest.fixture
+def mlx_config():
+    """Create a test configuration for the MLX backend."""
+    return OcrBackendConfig(
+        name="deepseek-mlx",
+        model="mlx-community/deepseek-vl2-small-4bit",
+        base_url="http://localhost",
+        max_tokens=512,
+    )
+
+
+@pytest.fixture
+def png_bytes():
+    """Create a small valid PNG."""
+    buffer = io.BytesIO()
+    Image.new("RGB", (8, 8), "white").save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+@pytest.fixture
+def fake_mlx():
+    """Patch mlx, mlx_vlm and apply_chat_template with mocks."""
+    mlx_vlm = MagicMock()
+    model = MagicMock()
+    mlx_vlm.load.return_value = (model, MagicMock())
+    mlx_vlm.generate.return_value = "# Page"
+    mx = MagicMock()
+
+    with patch.object(deepseek_mlx, "mlx_vlm", mlx_vlm), patch.object(
+        deepseek_mlx, "mx", mx
+    ), patch.object(deepseek_mlx, "nn", MagicMock()), patch.object(
+        deepseek_mlx, "apply_chat_template", MagicMock(return_value="prompt")
+    ):
+        yield mlx_vlm, mx, model
+
+
+@pytest.mark.asyncio
+async def test_missing_mlx_raises_configuration_error(mlx_config, png_bytes):
+    """Test using the backend without mlx-vlm installed fails clearly."""
+    backend = DeepSeekMLXBackend(mlx_config)
+
+    with patch.object(deepseek_mlx, "mlx_vlm", None):
+        with pytest.raises(ConfigurationError):
+            await backend.page_to_markdown(png_bytes, 1, "doc-1")
+
+
+@pytest.mark.asyncio
+async def test_model_loaded_once_and_evaluated(mlx_config, png_bytes, fake_mlx):
+    """Test the model is loaded and materialized once, then reused."""
+    mlx_vlm, mx, model = fake_mlx
+
+    async with DeepSeekMLXBackend(mlx_config) as backend:
+        assert await backend.page_to_markdown(png_bytes, 1, "doc-1") == "# Page"
+        assert await backend.page_to_markdown(png_bytes, 2, "doc-1") == "# Page"
+
+    mlx_vlm.load.assert_called_once_with("mlx-community/deepseek-vl2-small-4bit")
+    mx.eval.assert_called_once_with(model.parameters())
+    assert mlx_vlm.generate.call_count == 2
+    assert mlx_vlm.generate.call_args.kwargs["max_tokens"] == 512
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("bits", [4, 8, None])
+async def test_weights_quantized_before_eval(mlx_config, png_bytes, fake_mlx, bits):
+    """Test weights are quantized as configured before being materialized."""
+    _, mx, model = fake_mlx
+    mlx_config.quantize_bits = bits
+
+    async with DeepSeekMLXBackend(mlx_config) as backend:
+        await backend.page_to_markdown(png_bytes, 1, "doc-1")
+
+    quantize = deepseek_mlx.nn.quantize
+    if bits is None:
+        quantize.assert_not_called()
+    else:
+        quantize.assert_called_once_with(
+            model,
+            group_size=64,
+            bits=bits,
+            class_predicate=deepseek_mlx._should_quantize,
+        )
+    mx.eval.assert_called_once()
+
+
+@pytest.mark.parametrize(
+    "path, in_dims, expected",
+    [
+        ("language.model.layers.0.mlp.gate_proj", 2048, True),
+        ("language.model.layers.0.mlp.gate_proj", 2050, False),
+        ("vision.blocks.0.attn.qkv", 1024, False),
+        ("projector.layers.0", 2048, False),
+    ],
+)
+def test_quantize_predicate_skips_vision_and_odd_shapes(path, in_dims, expected):
+    """Test only language layers with group-aligned inputs are quantized."""
+    layer = MagicMock()
+    layer.weight.shape = (512, in_dims)
+
+    assert deepseek_mlx._should_quantize(path, layer) is expected
+    assert deepseek_mlx._should_quantize(path, object()) is False
+
+
+@pytest.mark.asyncio
+async def test_generation_runs_off_the_event_loop(mlx_config, png_bytes, fake_mlx):
+    """Test image decoding and generation run in worker threads."""
+    mlx_vlm, _, _ = fake_mlx
+    threads = []
+
+    def generate(model, processor, prompt, image, **kwargs):
+        threads.append(threading.current_thread().name)
+        assert image[0].size == (8, 8)
+        assert image[0].mode == "RGB"
+        return MagicMock(text="# Page")
+
+    mlx_vlm.generate.side_effect = generate
+
+    async with DeepSeekMLXBackend(mlx_config) as backend:
+        result = await backend.page_to_markdown(memoryview(png_bytes), 1, "doc-1")
+
+    assert result == "# Page"
+    assert threads[0].startswith("mlx")
+
+
+@pytest.mark.asyncio
+async def test_invalid_image_raises_backend_error(mlx_config, fake_mlx):
+    """Test undecodable image bytes surface as BackendError."""
+    mlx_vlm, _, _ = fake_mlx
+
+    async with DeepSeekMLXBackend(mlx_config) as backend:
+        with pytest.raises(BackendError):
+            await backend.page_to_markdown(b"not an image", 1, "doc-1")
+
+    mlx_vlm.generate.assert_not_called()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "output", ["$$E = mc^2$$", " $E = mc^2$\n", "$$ E = mc^2 $$", "E = mc^2"]
+)
+async def test_formula_delimiters_stripped(mlx_config, png_bytes, fake_mlx, output):
+    """Test LaTeX delimiters around the formula are removed."""
+    mlx_vlm, _, _ = fake_mlx
+    mlx_vlm.generate.return_value = output
+
+    async with DeepSeekMLXBackend(mlx_config) as backend:
+        assert await backend.formula_to_latex(png_bytes, {"doc_id": "doc-1"}) == "E = mc^2"
+
+
+@pytest.mark.asyncio
+async def test_generation_error_wrapped(mlx_config, png_bytes, fake_mlx):
+    """Test failures during generation surface as BackendError."""
+    mlx_vlm, _, _ = fake_mlx
+    mlx_vlm.generate.side_effect = RuntimeError("out of memory")
+
+    async with DeepSeekMLXBackend(mlx_config) as backend:
+        with pytest.raises(BackendError, match="out of memory"):
+            await backend.table_to_markdown(png_bytes, {"doc_id": "doc-1"})
+
+
+@pytest.mark.parametrize("image_format", ["PNG", "JPEG"])
+def test_decode_image_caps_longest_side(image_format):
+    """Test images larger than max_side are shrunk while decoding."""
+    buffer = io.BytesIO()
+    Image.new("RGB", (2048, 1024), "white").save(buffer, format=image_format)
+
+    image = DeepSeekMLXBackend._decode_image(buffer.getvalue(), max_side=512)
+
+    assert image.size == (512, 256)
+    assert image.mode == "RGB"
+    assert DeepSeekMLXBackend._decode_image(buffer.getvalue()).size == (2048, 1024)
@@ -148,6 +148,13 @@ def test_encode_image(vllm_backend, sample_image_bytes):
     assert len(result) > len("data:image/png;base64,")
 
 
+def test_encode_image_jpeg(vllm_backend):
+    """Test JPEG images get a JPEG data URL."""
+    result = vllm_backend._encode_image(b"\xff\xd8\xff\xe0 jpeg data")
+
+    assert result.startswith("data:image/jpeg;base64,")
+
+
 def test_build_messages(vllm_backend, sample_image_bytes):
     """Test building OpenAI-style messages."""
     prompt = "Test prompt"
@@ -307,7 +314,7 @@ async def test_post_chat_server_error_retries(vllm_backend, sample_image_bytes,
     # Mock responses: first two fail with 500, third succeeds
     mock_error_response = AsyncMock()
     mock_error_response.status = 500
-    mock_error_response.text = AsyncMock(return_value="Internal Server Error")
+    mock_error_response.content.read = AsyncMock(return_value=b"Internal Server Error")
 
     mock_success_response = AsyncMock()
     mock_success_response.status = 200
@@ -346,7 +353,7 @@ async def test_post_chat_client_error_no_retry(vllm_backend, sample_image_bytes)
     # Mock 400 error response
     mock_response = AsyncMock()
     mock_response.status = 400
-    mock_response.text = AsyncMock(return_value="Bad Request")
+    mock_response.content.read = AsyncMock(return_value=b"Bad Request")
 
     mock_session = AsyncMock()
     mock_session.post = MagicMock()
@@ -371,7 +378,7 @@ async def test_post_chat_rate_limit(vllm_backend, sample_image_bytes):
     mock_response = AsyncMock()
     mock_response.status = 429
     mock_response.headers = {"Retry-After": "5"}
-    mock_response.text = AsyncMock(return_value="Rate Limited")
+    mock_response.content.read = AsyncMock(return_value=b"Rate Limited")
 
     mock_session = AsyncMock()
     mock_session.post = MagicMock()
@@ -477,8 +484,9 @@ async def test_health_check_success(vllm_backend):
     mock_response.status = 200
 
     mock_session = AsyncMock()
+    mock_session.get = MagicMock()
+    mock_session.get.return_value.__aenter__.return_value = mock_response
     mock_session.post = MagicMock()
-    mock_session.post.return_value.__aenter__.return_value = mock_response
     mock_session.closed = False
 
     vllm_backend._session = mock_session
@@ -486,6 +494,29 @@ async def test_health_check_success(vllm_backend):
     result = await vllm_backend.health_check()
 
     assert result is True
+    assert mock_session.get.call_args.args[0] == "http://localhost:8000/v1/models"
+    mock_session.post.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_health_check_falls_back_to_chat_probe(vllm_backend):
+    """Test servers without /v1/models are probed with a chat completion."""
+    not_found = AsyncMock()
+    not_found.status = 404
+    ok = AsyncMock()
+    ok.status = 200
+
+    mock_session = AsyncMock()
+    mock_session.get = MagicMock()
+    mock_session.get.return_value.__aenter__.return_value = not_found
+    mock_session.post = MagicMock()
+    mock_session.post.return_value.__aenter__.return_value = ok
+    mock_session.closed = False
+
+    vllm_backend._session = mock_session
+
+    assert await vllm_backend.health_check() is True
+    assert mock_session.post.call_args.args[0] == vllm_backend.config.base_url
 
 
 @pytest.mark.asyncio
@@ -495,8 +526,8 @@ async def test_health_check_server_error(vllm_backend):
     mock_response.status = 500
 
     mock_session = AsyncMock()
-    mock_session.post = MagicMock()
-    mock_session.post.return_value.__aenter__.return_value = mock_response
+    mock_session.get = MagicMock()
+    mock_session.get.return_value.__aenter__.return_value = mock_response
     mock_session.closed = False
 
     vllm_backend._session = mock_session
@@ -510,7 +541,7 @@ async def test_health_check_server_error(vllm_backend):
 async def test_health_check_connection_error(vllm_backend):
     """Test health check with connection error."""
     mock_session = AsyncMock()
-    mock_session.post = MagicMock(side_effect=aiohttp.ClientConnectorError(
+    mock_session.get = MagicMock(side_effect=aiohttp.ClientConnectorError(
         connection_key=None, os_error=None
     ))
     mock_session.closed = False
@@ -526,7 +557,7 @@ async def test_health_check_connection_error(vllm_backend):
 async def test_health_check_timeout(vllm_backend):
     """Test health check with timeout."""
     mock_session = AsyncMock()
-    mock_session.post = MagicMock(side_effect=asyncio.TimeoutError())
+    mock_session.get = MagicMock(side_effect=asyncio.TimeoutError())
     mock_session.closed = False
 
     vllm_backend._session = mock_session
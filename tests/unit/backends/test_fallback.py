@@ -9,10 +9,16 @@ Tests cover:
 - All OcrVlmBackend interface methods
 """
 
+import asyncio
+
 import pytest
 from unittest.mock import AsyncMock, MagicMock
 
-from docling_hybrid.backends.fallback import FallbackChain
+from docling_hybrid.backends.fallback import (
+    RETRY_BASE_DELAY_S,
+    RETRY_MAX_DELAY_S,
+    FallbackChain,
+)
 from docling_hybrid.backends.base import OcrVlmBackend
 from docling_hybrid.common.errors import (
     BackendConnectionError,
@@ -217,6 +223,35 @@ def test_should_not_fallback_non_backend_error(simple_chain):
     assert simple_chain._should_fallback(error) is False
 
 
+@pytest.mark.parametrize("attempt", [0, 1, 2, 10])
+def test_retry_delay_is_jittered_exponential_backoff(attempt):
+    """Test retry delays stay within the capped exponential window."""
+    error = BackendConnectionError("Connection failed", backend_name="test")
+    window = min(RETRY_MAX_DELAY_S, RETRY_BASE_DELAY_S * 2**attempt)
+
+    delays = [FallbackChain._retry_delay(error, attempt) for _ in range(50)]
+
+    assert all(0 <= delay <= window for delay in delays)
+    assert len(set(delays)) > 1
+
+
+def test_retry_delay_honors_retry_after():
+    """Test a rate limit error's Retry-After replaces the backoff, capped."""
+    error = BackendResponseError("Rate limited", backend_name="test", status_code=429)
+    error.retry_after = 2.0
+
+    assert FallbackChain._retry_delay(error, 0) == 2.0
+
+    error.retry_after = 3600
+    assert FallbackChain._retry_delay(error, 0) == RETRY_MAX_DELAY_S
+
+
+def test_should_fallback_response_error_without_status(simple_chain):
+    """Test fallback on malformed responses, which carry no status code."""
+    error = BackendResponseError("Invalid JSON response", backend_name="test")
+    assert simple_chain._should_fallback(error) is True
+
+
 # ============================================================================
 # Page to Markdown Tests
 # ============================================================================
@@ -395,6 +430,53 @@ async def test_get_healthy_backend_all_unhealthy():
     assert result is None
 
 
+@pytest.mark.asyncio
+async def test_context_not_passed_to_backends(sample_image):
+    """Test backends with the exact interface signature work in a chain."""
+    class StrictBackend(OcrVlmBackend):
+        async def page_to_markdown(self, image_bytes, page_num, doc_id):
+            return f"# Page {page_num}"
+        async def table_to_markdown(self, image_bytes, meta):
+            return "| Table |"
+        async def formula_to_latex(self, image_bytes, meta):
+            return "x"
+
+    config = OcrBackendConfig(
+        name="strict",
+        model="test",
+        base_url="http://localhost:8000",
+    )
+    chain = FallbackChain(primary=StrictBackend(config))
+
+    assert await chain.page_to_markdown(sample_image, 1, "doc-123") == "# Page 1"
+    assert await chain.table_to_markdown(sample_image, {"doc_id": "doc-123"}) == "| Table |"
+    assert await chain.formula_to_latex(sample_image, {"doc_id": "doc-123"}) == "x"
+
+
+@pytest.mark.asyncio
+async def test_get_healthy_backend_checks_concurrently_in_chain_order(
+    primary_backend, fallback_backend
+):
+    """Test health checks overlap but the primary still wins."""
+    fallback_checked = asyncio.Event()
+
+    async def primary_health_check():
+        await fallback_checked.wait()
+        return True
+
+    async def fallback_health_check():
+        fallback_checked.set()
+        return True
+
+    primary_backend.health_check = primary_health_check
+    fallback_backend.health_check = fallback_health_check
+    chain = FallbackChain(primary=primary_backend, fallbacks=[fallback_backend])
+
+    result = await asyncio.wait_for(chain.get_healthy_backend(), timeout=1)
+
+    assert result == primary_backend
+
+
 @pytest.mark.asyncio
 async def test_get_healthy_backend_no_health_check():
     """Test with backend that doesn't have health_check method."""
@@ -422,6 +504,20 @@ async def test_get_healthy_backend_no_health_check():
     assert result == minimal
 
 
+@pytest.mark.asyncio
+async def test_get_healthy_backend_skips_unreachable_checks(fallback_backend):
+    """Test backends behind one without health_check are not probed."""
+    # Duck-typed backend; OcrVlmBackend subclasses inherit a health_check
+    minimal = MagicMock(spec=["name", "close"])
+    minimal.name = "minimal"
+    fallback_backend.health_check = AsyncMock(return_value=True)
+
+    chain = FallbackChain(primary=minimal, fallbacks=[fallback_backend])
+
+    assert await chain.get_healthy_backend() == minimal
+    fallback_backend.health_check.assert_not_called()
+
+
 # ============================================================================
 # Context Manager Tests
 # ============================================================================
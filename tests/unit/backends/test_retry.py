@@ -16,6 +16,7 @@ from docling_hybrid.common.errors import (
     BackendTimeoutError,
 )
 from docling_hybrid.common.models import OcrBackendConfig
+from docling_hybrid.common.retry import SharedRateLimiter
 from tests.utils import (
     create_mock_aiohttp_response,
     create_mock_aiohttp_session,
@@ -353,6 +354,25 @@ class TestRateLimitErrorCreation:
 
         await backend.close()
 
+    async def test_rate_limit_trips_shared_limiter(self, retry_config):
+        """A 429 closes the shared gate for the Retry-After window."""
+        backend = OpenRouterNemotronBackend(retry_config)
+        backend.rate_limiter = SharedRateLimiter()
+
+        mock_response = create_mock_rate_limit_response(
+            retry_after=5.0,
+            error_message="Rate limited"
+        )
+        mock_session = create_mock_aiohttp_session(default_response=mock_response)
+
+        with patch.object(backend, "_get_session", return_value=mock_session):
+            with pytest.raises(RateLimitError):
+                await backend._post_chat_inner([{"role": "user", "content": "test"}], {})
+
+        assert not backend.rate_limiter.is_open
+
+        await backend.close()
+
     async def test_rate_limit_error_without_retry_after(self, retry_config):
         """Should create RateLimitError without Retry-After header."""
         backend = OpenRouterNemotronBackend(retry_config)
@@ -18,10 +18,13 @@ from docling_hybrid.cli.batch import (
     BatchResult,
     convert_batch,
     convert_single_file,
+    file_fingerprint,
     find_pdf_files,
     format_batch_summary,
+    group_duplicates,
 )
 from docling_hybrid.common.errors import BackendError, ValidationError
+from docling_hybrid.common.models import OcrBackendConfig
 from docling_hybrid.orchestrator import ConversionOptions, ConversionResult
 
 
@@ -93,6 +96,13 @@ def mock_config():
     """Create a mock Config."""
     config = MagicMock()
     config.resources.max_workers = 2
+    config.resources.page_render_dpi = 200
+    config.backends.default = "test-backend"
+    config.backends.get_backend_config.return_value = OcrBackendConfig(
+        name="test-backend",
+        model="test-model",
+        base_url="http://localhost:8000/v1/chat/completions",
+    )
     return config
 
 
@@ -136,6 +146,17 @@ class TestFindPdfFiles:
         assert len(found) == 3
         assert set(found) == set(expected_files)
 
+    def test_recursive_skips_dirs_and_symlink_loops(self, tmp_path: Path):
+        """Test directories named like PDFs and symlinked dirs are not returned."""
+        (tmp_path / "a.pdf").write_bytes(b"%PDF-1.4\n%")
+        (tmp_path / "folder.pdf").mkdir()
+        (tmp_path / "folder.pdf" / "b.pdf").write_bytes(b"%PDF-1.4\n%")
+        (tmp_path / "folder.pdf" / "loop").symlink_to(tmp_path, target_is_directory=True)
+
+        found = find_pdf_files(tmp_path, recursive=True)
+
+        assert found == [tmp_path / "a.pdf", tmp_path / "folder.pdf" / "b.pdf"]
+
     def test_sorts_results(self, tmp_path: Path):
         """Test that results are sorted by name."""
         # Create files in random order
@@ -475,6 +496,172 @@ class TestConvertBatch:
             assert output_dir.exists()
 
 
+# ============================================================================
+# Deduplication Tests
+# ============================================================================
+
+class TestDeduplication:
+    """Tests for content-hash deduplication."""
+
+    def test_fingerprint_matches_identical_content(self, tmp_path: Path):
+        """Test identical files share a fingerprint and different ones do not."""
+        data = b"%PDF-1.4\n" + bytes(range(256)) * 1024
+        (tmp_path / "a.pdf").write_bytes(data)
+        (tmp_path / "b.pdf").write_bytes(data)
+        (tmp_path / "c.pdf").write_bytes(data[:-1] + b"x")
+
+        assert file_fingerprint(tmp_path / "a.pdf") == file_fingerprint(tmp_path / "b.pdf")
+        assert file_fingerprint(tmp_path / "a.pdf") != file_fingerprint(tmp_path / "c.pdf")
+
+    def test_group_duplicates_keeps_input_order(self, tmp_path: Path):
+        """Test groups list the first-seen file first."""
+        paths = []
+        for name, data in [("b", b"same"), ("a", b"other"), ("c", b"same")]:
+            path = tmp_path / f"{name}.pdf"
+            path.write_bytes(data)
+            paths.append(path)
+
+        groups, unreadable = group_duplicates(paths)
+
+        assert list(groups.values()) == [[paths[0], paths[2]], [paths[1]]]
+        assert unreadable == {}
+
+    @pytest.mark.asyncio
+    async def test_batch_reports_unreadable_files(
+        self,
+        sample_pdfs: list[Path],
+        tmp_path: Path,
+        mock_config,
+    ):
+        """Test a file that vanished fails alone instead of aborting the batch."""
+        output_dir = tmp_path / "output"
+        missing = tmp_path / "missing.pdf"
+
+        async def fake_convert(pdf_path, output_path, options):
+            output_path.write_text(f"# {pdf_path.name}", encoding="utf-8")
+            mock_result = MagicMock(spec=ConversionResult)
+            mock_result.processed_pages = 1
+            return mock_result
+
+        with patch("docling_hybrid.cli.batch.HybridPipeline") as MockPipeline:
+            mock_pipeline = MagicMock()
+            mock_pipeline.__aenter__ = AsyncMock(return_value=mock_pipeline)
+            mock_pipeline.__aexit__ = AsyncMock()
+            mock_pipeline.convert_pdf = AsyncMock(side_effect=fake_convert)
+            MockPipeline.return_value = mock_pipeline
+
+            result = await convert_batch(
+                input_paths=[sample_pdfs[0], missing],
+                output_dir=output_dir,
+                config=mock_config,
+                deduplicate=True,
+            )
+
+        assert result.successful == 1
+        assert result.failed == 1
+        assert result.file_results[1].source_path == missing
+        assert "FileNotFoundError" in result.file_results[1].error
+
+    @pytest.mark.asyncio
+    async def test_batch_converts_duplicates_once(
+        self,
+        sample_pdfs: list[Path],
+        tmp_path: Path,
+        mock_config,
+    ):
+        """Test identical PDFs are converted once and the output copied."""
+        output_dir = tmp_path / "output"
+
+        async def fake_convert(pdf_path, output_path, options):
+            output_path.write_text(f"# {pdf_path.name}", encoding="utf-8")
+            mock_result = MagicMock(spec=ConversionResult)
+            mock_result.processed_pages = 1
+            return mock_result
+
+        with patch("docling_hybrid.cli.batch.HybridPipeline") as MockPipeline:
+            mock_pipeline = MagicMock()
+            mock_pipeline.__aenter__ = AsyncMock(return_value=mock_pipeline)
+            mock_pipeline.__aexit__ = AsyncMock()
+            mock_pipeline.convert_pdf = AsyncMock(side_effect=fake_convert)
+            MockPipeline.return_value = mock_pipeline
+
+            result = await convert_batch(
+                input_paths=sample_pdfs,
+                output_dir=output_dir,
+                config=mock_config,
+                deduplicate=True,
+            )
+            assert mock_pipeline.convert_pdf.call_count == 1
+            assert result.successful == 3
+            assert [r.duplicate_of for r in result.file_results] == [
+                None,
+                output_dir / "test_0.md",
+                output_dir / "test_0.md",
+            ]
+            for i in range(3):
+                assert (output_dir / f"test_{i}.md").read_text() == "# test_0.pdf"
+
+            # A later run reuses the recorded output without converting
+            mock_pipeline.convert_pdf.reset_mock()
+            copy = tmp_path / "copy.pdf"
+            copy.write_bytes(sample_pdfs[0].read_bytes())
+
+            result = await convert_batch(
+                input_paths=[copy],
+                output_dir=output_dir,
+                config=mock_config,
+                deduplicate=True,
+            )
+            mock_pipeline.convert_pdf.assert_not_called()
+            assert result.successful == 1
+            assert (output_dir / "copy.md").read_text() == "# test_0.pdf"
+
+            # Different options or a changed output mean converting again
+            await convert_batch(
+                input_paths=[copy],
+                output_dir=output_dir,
+                config=mock_config,
+                options=ConversionOptions(max_pages=1),
+                deduplicate=True,
+            )
+            assert mock_pipeline.convert_pdf.call_count == 1
+
+            # So does a different model or page image size
+            backend_config = mock_config.backends.get_backend_config.return_value
+            for update in ({"model": "other-model"}, {"vision_max_side": 1536}):
+                mock_pipeline.convert_pdf.reset_mock()
+                mock_config.backends.get_backend_config.return_value = (
+                    backend_config.model_copy(update=update)
+                )
+                await convert_batch(
+                    input_paths=[copy],
+                    output_dir=output_dir,
+                    config=mock_config,
+                    deduplicate=True,
+                )
+                assert mock_pipeline.convert_pdf.call_count == 1
+            mock_config.backends.get_backend_config.return_value = backend_config
+
+            mock_pipeline.convert_pdf.reset_mock()
+            (output_dir / "test_0.md").write_text("# another.pdf", encoding="utf-8")
+            await convert_batch(
+                input_paths=[copy],
+                output_dir=output_dir,
+                config=mock_config,
+                deduplicate=True,
+            )
+            assert mock_pipeline.convert_pdf.call_count == 1
+
+    def test_fingerprint_covers_the_middle_of_the_file(self, tmp_path: Path):
+        """Test same-size files differing only in the middle are told apart."""
+        data = bytearray(b"%PDF-1.4\n" + bytes(1024 * 1024))
+        (tmp_path / "a.pdf").write_bytes(data)
+        data[len(data) // 2] = 1
+        (tmp_path / "b.pdf").write_bytes(data)
+
+        assert file_fingerprint(tmp_path / "a.pdf") != file_fingerprint(tmp_path / "b.pdf")
+
+
 # ============================================================================
 # Batch Result Tests
 # ============================================================================
@@ -0,0 +1,50 @@
+"""Unit tests for CLI progress display helpers."""
+
+from unittest.mock import MagicMock, patch
+
+from docling_hybrid.cli.progress_display import CoalescedProgress
+
+
+class TestCoalescedProgress:
+    """Tests for CoalescedProgress."""
+
+    def test_first_advance_is_forwarded(self):
+        """Test the first update goes through immediately."""
+        progress = MagicMock()
+        updates = CoalescedProgress(progress, task_id=1)
+
+        updates.advance()
+
+        progress.update.assert_called_once_with(1, advance=1)
+
+    def test_advances_within_interval_are_coalesced(self):
+        """Test updates inside the interval are accumulated, then flushed."""
+        progress = MagicMock()
+        updates = CoalescedProgress(progress, task_id=1, interval_s=0.05)
+
+        with patch("docling_hybrid.cli.progress_display.time.monotonic") as clock:
+            clock.return_value = 100.0
+            updates.advance()
+            for _ in range(9):
+                clock.return_value += 0.001
+                updates.advance()
+            assert progress.update.call_count == 1
+
+            clock.return_value += 0.05
+            updates.advance()
+
+        assert progress.update.call_count == 2
+        assert progress.update.call_args.kwargs["advance"] == 10
+
+    def test_flush_forwards_remainder_once(self):
+        """Test flush forwards pending progress and is a no-op when empty."""
+        progress = MagicMock()
+        updates = CoalescedProgress(progress, task_id=1, interval_s=60)
+
+        updates.advance()
+        updates.advance(2)
+        updates.flush()
+        updates.flush()
+
+        assert progress.update.call_count == 2
+        assert progress.update.call_args.kwargs["advance"] == 2
@@ -0,0 +1,85 @@
+"""Unit tests for the render buffer pool."""
+
+import io
+
+from PIL import Image
+
+from docling_hybrid.common.bufpool import (
+    BUCKET_SIZES,
+    BufferPool,
+    PooledBufferWriter,
+)
+
+
+class TestBufferPool:
+    """Tests for BufferPool."""
+
+    def test_acquire_rounds_up_to_bucket(self):
+        """Acquired buffers are sized to the smallest fitting bucket."""
+        pool = BufferPool()
+        assert len(pool.acquire(10)) == BUCKET_SIZES[0]
+        assert len(pool.acquire(BUCKET_SIZES[0] + 1)) == BUCKET_SIZES[1]
+
+    def test_oversized_request_gets_exact_size(self):
+        """Requests above the largest bucket are allocated exactly."""
+        pool = BufferPool()
+        size = BUCKET_SIZES[-1] + 1
+        assert len(pool.acquire(size)) == size
+
+    def test_release_reuses_buffer(self):
+        """Released buffers are handed out again."""
+        pool = BufferPool()
+        buf = pool.acquire(100)
+        pool.release(buf)
+        assert pool.acquire(100) is buf
+
+    def test_release_view_reuses_underlying_buffer(self):
+        """Releasing a view returns its underlying buffer."""
+        pool = BufferPool()
+        buf = pool.acquire(100)
+        pool.release(memoryview(buf)[:10])
+        assert pool.acquire(100) is buf
+
+    def test_release_ignores_bytes(self):
+        """Plain bytes are accepted and ignored."""
+        pool = BufferPool()
+        pool.release(b"not pooled")
+        assert len(pool.acquire(10)) == BUCKET_SIZES[0]
+
+    def test_max_per_bucket(self):
+        """Idle buffers beyond max_per_bucket are dropped."""
+        pool = BufferPool(max_per_bucket=1)
+        first = pool.acquire(10)
+        second = pool.acquire(10)
+        pool.release(first)
+        pool.release(second)
+        assert pool.acquire(10) is first
+        assert pool.acquire(10) is not second
+
+
+class TestPooledBufferWriter:
+    """Tests for PooledBufferWriter."""
+
+    def test_write_and_getbuffer(self):
+        """Written bytes are exposed via a read-only view."""
+        writer = PooledBufferWriter(BufferPool())
+        writer.write(b"abc")
+        writer.write(b"def")
+        view = writer.getbuffer()
+        assert bytes(view) == b"abcdef"
+        assert view.readonly
+
+    def test_write_grows_buffer(self):
+        """Writer moves to a larger bucket when output outgrows the buffer."""
+        pool = BufferPool()
+        writer = PooledBufferWriter(pool)
+        data = b"x" * (BUCKET_SIZES[0] + 10)
+        writer.write(data)
+        assert bytes(writer.getbuffer()) == data
+
+    def test_pil_png_roundtrip(self):
+        """PIL can save a PNG directly into the writer."""
+        writer = PooledBufferWriter(BufferPool())
+        Image.new("RGB", (32, 32), "white").save(writer, format="PNG")
+        img = Image.open(io.BytesIO(writer.getbuffer()))
+        assert img.size == (32, 32)
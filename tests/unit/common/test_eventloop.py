@@ -0,0 +1,41 @@
+"""Unit tests for event loop selection."""
+
+import asyncio
+from unittest.mock import MagicMock, patch
+
+from docling_hybrid.common import eventloop
+from docling_hybrid.common.eventloop import install_uvloop
+
+
+def test_install_uvloop_without_uvloop():
+    """Without uvloop the default policy is kept."""
+    policy = asyncio.get_event_loop_policy()
+
+    with patch.object(eventloop, "uvloop", None):
+        assert install_uvloop() is False
+
+    assert asyncio.get_event_loop_policy() is policy
+
+
+def test_install_uvloop_sets_policy():
+    """With uvloop its event loop policy is installed."""
+    fake_uvloop = MagicMock()
+
+    with patch.object(eventloop, "uvloop", fake_uvloop), patch(
+        "docling_hybrid.common.eventloop.asyncio.set_event_loop_policy"
+    ) as set_policy:
+        assert install_uvloop() is True
+
+    set_policy.assert_called_once_with(fake_uvloop.EventLoopPolicy.return_value)
+
+
+def test_install_uvloop_disabled_by_env(monkeypatch):
+    """DOCLING_HYBRID_DISABLE_UVLOOP=1 keeps the default loop."""
+    monkeypatch.setenv("DOCLING_HYBRID_DISABLE_UVLOOP", "1")
+
+    with patch.object(eventloop, "uvloop", MagicMock()), patch(
+        "docling_hybrid.common.eventloop.asyncio.set_event_loop_policy"
+    ) as set_policy:
+        assert install_uvloop() is False
+
+    set_policy.assert_not_called()
@@ -0,0 +1,155 @@
+"""Unit tests for shared HTTP client settings."""
+
+import base64
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from docling_hybrid.common import http
+from docling_hybrid.common.http import (
+    DEFAULT_MAX_CONNECTIONS,
+    DEFAULT_MAX_CONNECTIONS_PER_HOST,
+    create_client_session,
+    image_data_url,
+    image_url_slot,
+    json_dumps_with_images,
+    json_dumps_with_images_async,
+    json_dumps,
+    json_loads,
+    read_error_body,
+)
+
+
+@pytest.mark.asyncio
+async def test_create_client_session_defaults():
+    """Session uses pooled connector limits and split timeouts."""
+    session = create_client_session(total_timeout_s=180)
+    try:
+        assert session.connector.limit == DEFAULT_MAX_CONNECTIONS
+        assert session.connector.limit_per_host == DEFAULT_MAX_CONNECTIONS_PER_HOST
+        assert session.timeout.total == 180
+        assert session.timeout.sock_connect == 10.0
+    finally:
+        await session.close()
+
+
+@pytest.mark.asyncio
+async def test_create_client_session_custom_limits():
+    """Connection limits can be overridden."""
+    session = create_client_session(
+        total_timeout_s=60,
+        connect_timeout_s=5,
+        max_connections=8,
+        max_connections_per_host=4,
+    )
+    try:
+        assert session.connector.limit == 8
+        assert session.connector.limit_per_host == 4
+        assert session.timeout.sock_connect == 5
+    finally:
+        await session.close()
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_json_round_trip(use_orjson):
+    """Request bodies are compact UTF-8 JSON bytes with or without orjson."""
+    payload = {"model": "m", "messages": [{"text": "Größe", "url": "data:image/png;base64,AAAA"}]}
+
+    if not use_orjson:
+        with patch.object(http, "orjson", None):
+            body = json_dumps(payload)
+            parsed = json_loads(body)
+    else:
+        if http.orjson is None:
+            pytest.skip("orjson not installed")
+        body = json_dumps(payload)
+        parsed = json_loads(body.decode("utf-8"))
+
+    assert isinstance(body, bytes)
+    assert json.loads(body) == payload
+    assert parsed == payload
+
+
+
+@pytest.mark.parametrize(
+    "image_bytes, mime",
+    [
+        (b"\x89PNG\r\n\x1a\n" + bytes(range(256)), "image/png"),
+        (b"\xff\xd8\xff\xe0" + bytes(range(255)), "image/jpeg"),
+        (b"", "image/png"),
+    ],
+)
+def test_image_data_url_matches_base64(image_bytes, mime):
+    """Data URLs match plain base64 encoding for bytes and memoryviews."""
+    expected = f"data:{mime};base64,{base64.b64encode(image_bytes).decode()}"
+
+    assert image_data_url(image_bytes) == expected
+    assert image_data_url(memoryview(image_bytes)) == expected
+
+
+@pytest.mark.parametrize("use_pybase64", [True, False])
+def test_image_data_url_with_and_without_pybase64(use_pybase64):
+    """Both base64 encoders produce the same data URL."""
+    image_bytes = b"\x89PNG\r\n\x1a\n" + bytes(range(256)) * 64
+    expected = f"data:image/png;base64,{base64.b64encode(image_bytes).decode()}"
+
+    if not use_pybase64:
+        with patch.object(http, "pybase64", None):
+            assert image_data_url(memoryview(image_bytes)) == expected
+    else:
+        if http.pybase64 is None:
+            pytest.skip("pybase64 not installed")
+        assert image_data_url(memoryview(image_bytes)) == expected
+
+
+
+def test_json_dumps_with_images_matches_inline_urls():
+    """Spliced bodies equal serializing the payload with the URLs in place."""
+    png = b"\x89PNG\r\n\x1a\n" + bytes(range(256))
+    jpeg = b"\xff\xd8\xff\xe0" + bytes(range(100))
+
+    def payload(first, second):
+        return {
+            "messages": [
+                {"type": "text", "text": "Größe"},
+                {"type": "image_url", "image_url": {"url": first}},
+                {"type": "image_url", "image_url": {"url": second}},
+            ],
+        }
+
+    body = json_dumps_with_images(
+        payload(image_url_slot(0), image_url_slot(1)), [png, memoryview(jpeg)]
+    )
+
+    assert bytes(body) == json_dumps(payload(image_data_url(png), image_data_url(jpeg)))
+
+
+def test_json_dumps_with_images_missing_slot():
+    """A payload without the slot for an image is rejected."""
+    with pytest.raises(ValueError):
+        json_dumps_with_images({"url": "none"}, [b"\x89PNG"])
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("size", [16, http.OFFLOAD_ENCODE_BYTES])
+async def test_json_dumps_with_images_async_matches_sync(size):
+    """Small and offloaded large bodies are built the same."""
+    image_bytes = b"\x89PNG" + bytes(range(256)) * (size // 256 + 1)
+    payload = {"url": image_url_slot(0)}
+
+    body = await json_dumps_with_images_async(payload, [memoryview(image_bytes)])
+
+    assert body == json_dumps_with_images(payload, [image_bytes])
+
+
+@pytest.mark.asyncio
+async def test_read_error_body_reads_bounded_prefix():
+    """Only the first bytes of an error body are read and decoded."""
+    response = MagicMock()
+    response.content.read = AsyncMock(return_value="é".encode("utf-8")[:1])
+
+    body = await read_error_body(response, limit=1)
+
+    response.content.read.assert_awaited_once_with(1)
+    assert body == "\ufffd"
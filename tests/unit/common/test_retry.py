@@ -5,7 +5,11 @@ from typing import Any
 
 import pytest
 
-from docling_hybrid.common.retry import retry_async, retry_with_rate_limit
+from docling_hybrid.common.retry import (
+    SharedRateLimiter,
+    retry_async,
+    retry_with_rate_limit,
+)
 
 
 class RetryTestError(Exception):
@@ -338,3 +342,178 @@ class TestRetryWithRateLimit:
             )
 
         assert call_count == 3  # Initial + 2 retries
+
+    async def test_is_retryable_rejects_immediately(self):
+        """Should raise at once when the predicate rejects the exception."""
+        call_count = 0
+
+        async def fail_permanently():
+            nonlocal call_count
+            call_count += 1
+            raise RetryTestError("Bad request")
+
+        with pytest.raises(RetryTestError, match="Bad request"):
+            await retry_with_rate_limit(
+                fail_permanently,
+                max_retries=3,
+                initial_delay=0.01,
+                retryable_exceptions=(RetryTestError,),
+                is_retryable=lambda exc: "Bad request" not in str(exc),
+            )
+
+        assert call_count == 1
+
+    async def test_jitter_keeps_delay_within_half_to_full(self, monkeypatch):
+        """Should sleep between half and all of each backoff delay."""
+        delays = []
+
+        async def record_sleep(delay):
+            delays.append(delay)
+
+        async def always_fail():
+            raise RetryTestError("Server error")
+
+        monkeypatch.setattr(asyncio, "sleep", record_sleep)
+        with pytest.raises(RetryTestError):
+            await retry_with_rate_limit(
+                always_fail,
+                max_retries=3,
+                initial_delay=1.0,
+                exponential_base=2.0,
+                retryable_exceptions=(RetryTestError,),
+                jitter=True,
+            )
+
+        assert len(delays) == 3
+        for delay, backoff in zip(delays, [1.0, 2.0, 4.0]):
+            assert backoff / 2 <= delay <= backoff
+
+
+@pytest.mark.asyncio
+class TestSharedRateLimiter:
+    """Tests for SharedRateLimiter."""
+
+    async def test_open_gate_does_not_wait(self):
+        """Test wait returns immediately when nothing has tripped."""
+        limiter = SharedRateLimiter()
+
+        await asyncio.wait_for(limiter.wait(), timeout=0.01)
+
+        assert limiter.is_open
+
+    async def test_trip_holds_every_waiter(self):
+        """Test all waiters are released together after the window."""
+        limiter = SharedRateLimiter()
+        loop = asyncio.get_running_loop()
+
+        start = loop.time()
+        limiter.trip(retry_after=0.05)
+        await asyncio.gather(*(limiter.wait() for _ in range(5)))
+
+        assert loop.time() - start >= 0.04
+        assert limiter.is_open
+
+    async def test_backoff_grows_and_resets(self):
+        """Test windows grow between trips and reset after a success."""
+        limiter = SharedRateLimiter(initial_delay=1.0, exponential_base=2.0, max_delay=3.0)
+
+        assert limiter.trip() == pytest.approx(1.0, abs=0.01)
+        limiter._resume_at = 0.0  # Window elapsed
+        assert limiter.trip() == pytest.approx(2.0, abs=0.01)
+        limiter._resume_at = 0.0
+        assert limiter.trip() == pytest.approx(3.0, abs=0.01)
+
+        limiter.record_success()
+        limiter._resume_at = 0.0
+        assert limiter.trip() == pytest.approx(1.0, abs=0.01)
+
+    async def test_concurrent_trips_do_not_escalate(self):
+        """Test trips while the gate is closed do not grow the backoff."""
+        limiter = SharedRateLimiter(initial_delay=1.0)
+
+        limiter.trip()
+        for _ in range(10):
+            limiter.trip()
+        limiter._resume_at = 0.0
+
+        assert limiter.trip() == pytest.approx(2.0, abs=0.01)
+
+    async def test_in_flight_limit_bounds_acquire(self):
+        """Test acquire blocks once max_in_flight requests hold a slot."""
+        limiter = SharedRateLimiter(max_in_flight=2)
+
+        await limiter.acquire()
+        await limiter.acquire()
+        blocked = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+        assert not blocked.done()
+
+        limiter.release()
+        await asyncio.wait_for(blocked, timeout=0.1)
+
+    async def test_queued_acquire_waits_for_gate_tripped_by_releaser(self):
+        """Test a waiter woken by a throttled request's release still waits."""
+        limiter = SharedRateLimiter(max_in_flight=1)
+        loop = asyncio.get_running_loop()
+
+        await limiter.acquire()
+        queued = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+
+        start = loop.time()
+        limiter.trip(retry_after=0.05)
+        limiter.release()
+        await asyncio.wait_for(queued, timeout=1)
+
+        assert loop.time() - start >= 0.04
+
+    async def test_in_flight_limit_halves_and_recovers(self):
+        """Test escalating trips halve the limit and successes grow it back."""
+        limiter = SharedRateLimiter(max_in_flight=8, increase_every=2)
+
+        limiter.trip(retry_after=0.0)
+        limiter.trip(retry_after=0.0)
+        assert limiter.in_flight_limit == 2
+
+        for _ in range(3):
+            limiter.record_success()
+        assert limiter.in_flight_limit == 3
+
+        for _ in range(20):
+            limiter.record_success()
+        assert limiter.in_flight_limit == 8
+
+    async def test_in_flight_limit_never_below_one(self):
+        """Test the limit stays at one request under repeated throttling."""
+        limiter = SharedRateLimiter(max_in_flight=2)
+
+        for _ in range(5):
+            limiter.trip(retry_after=0.0)
+
+        assert limiter.in_flight_limit == 1
+        await asyncio.wait_for(limiter.acquire(), timeout=0.01)
+
+    async def test_unbounded_by_default(self):
+        """Test acquire and release are plain gate waits without a limit."""
+        limiter = SharedRateLimiter()
+
+        await asyncio.gather(*(limiter.acquire() for _ in range(50)))
+        limiter.release()
+
+        assert limiter.in_flight_limit is None
+
+    async def test_min_interval_spaces_request_starts(self):
+        """Test concurrent acquires start one interval apart."""
+        limiter = SharedRateLimiter(min_interval=0.02)
+        loop = asyncio.get_running_loop()
+        starts = []
+
+        async def request():
+            await limiter.acquire()
+            starts.append(loop.time())
+            limiter.release()
+
+        await asyncio.gather(*(request() for _ in range(4)))
+
+        gaps = [b - a for a, b in zip(starts, starts[1:])]
+        assert all(gap >= 0.015 for gap in gaps)
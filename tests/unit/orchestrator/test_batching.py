@@ -0,0 +1,89 @@
+"""Unit tests for page request batching."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from docling_hybrid.common.errors import BackendError
+from docling_hybrid.orchestrator.batching import PageBatcher
+
+
+@pytest.fixture
+def batch_backend():
+    """Backend whose pages_to_markdown echoes the page numbers."""
+    backend = MagicMock()
+    backend.name = "batch-backend"
+
+    async def pages_to_markdown(images, page_nums, doc_id):
+        return [f"# Page {n}" for n in page_nums]
+
+    backend.pages_to_markdown = AsyncMock(side_effect=pages_to_markdown)
+    return backend
+
+
+@pytest.mark.asyncio
+async def test_full_batches_are_sent_together(batch_backend):
+    """Test pages are grouped into requests of batch_size."""
+    batcher = PageBatcher(batch_backend, "doc-1", batch_size=2, linger_s=10)
+
+    pages = await asyncio.gather(*(batcher.submit(b"img", n) for n in range(1, 5)))
+
+    assert pages == ["# Page 1", "# Page 2", "# Page 3", "# Page 4"]
+    assert [c.args[1] for c in batch_backend.pages_to_markdown.call_args_list] == [
+        [1, 2],
+        [3, 4],
+    ]
+
+
+@pytest.mark.asyncio
+async def test_partial_batch_flushes_after_linger(batch_backend):
+    """Test a batch that never fills is still sent."""
+    batcher = PageBatcher(batch_backend, "doc-1", batch_size=8, linger_s=0.01)
+
+    pages = await asyncio.wait_for(
+        asyncio.gather(batcher.submit(b"img", 1), batcher.submit(b"img", 2)),
+        timeout=1,
+    )
+
+    assert pages == ["# Page 1", "# Page 2"]
+    batch_backend.pages_to_markdown.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_batch_failure_fails_every_page(batch_backend):
+    """Test a failed request raises for each page in the batch."""
+    batch_backend.pages_to_markdown.side_effect = BackendError("boom")
+    batcher = PageBatcher(batch_backend, "doc-1", batch_size=2)
+
+    results = await asyncio.gather(
+        batcher.submit(b"img", 1), batcher.submit(b"img", 2), return_exceptions=True
+    )
+
+    assert all(isinstance(r, BackendError) for r in results)
+
+
+@pytest.mark.asyncio
+async def test_slots_bound_requests_not_pages(batch_backend):
+    """Test the semaphore is held once per request."""
+    slots = asyncio.Semaphore(1)
+    batcher = PageBatcher(batch_backend, "doc-1", batch_size=3, slots=slots)
+
+    pages = await asyncio.gather(*(batcher.submit(b"img", n) for n in range(1, 4)))
+
+    assert len(pages) == 3
+    assert batch_backend.pages_to_markdown.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_aclose_cancels_queued_pages(batch_backend):
+    """Test closing the batcher cancels pages still waiting for a batch."""
+    batcher = PageBatcher(batch_backend, "doc-1", batch_size=4, linger_s=10)
+    waiter = asyncio.create_task(batcher.submit(b"img", 1))
+    await asyncio.sleep(0)
+
+    await batcher.aclose()
+
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+    batch_backend.pages_to_markdown.assert_not_called()
@@ -1,18 +1,26 @@
 """Unit tests for the backends module."""
 
+import asyncio
+import json
+import subprocess
+import sys
+
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 
 from docling_hybrid.backends import (
     make_backend,
     list_backends,
+    resolve_backend_name,
     OcrVlmBackend,
     OpenRouterNemotronBackend,
     DeepseekOcrVllmBackend,
     DeepseekOcrMlxBackend,
 )
+from docling_hybrid.backends.deepseek_mlx import DeepSeekMLXBackend
+from docling_hybrid.backends.deepseek_vllm import DeepSeekVLLMBackend
 from docling_hybrid.backends.factory import register_backend
-from docling_hybrid.common.errors import ConfigurationError
+from docling_hybrid.common.errors import BackendError, ConfigurationError
 from docling_hybrid.common.models import OcrBackendConfig
 
 
@@ -45,12 +53,50 @@ class TestBackendFactory:
         assert isinstance(backend, DeepseekOcrVllmBackend)
     
     def test_make_backend_deepseek_mlx(self, backend_config):
-        """Test creating DeepSeek MLX backend (stub)."""
+        """Test creating DeepSeek MLX backend."""
         backend_config.name = "deepseek-mlx"
         
         backend = make_backend(backend_config)
         
-        assert isinstance(backend, DeepseekOcrMlxBackend)
+        assert isinstance(backend, DeepSeekMLXBackend)
+    
+    def test_backend_modules_imported_on_first_use(self):
+        """Test importing the factory does not load the MLX backend module."""
+        code = (
+            "import sys, docling_hybrid.backends.factory as f; "
+            "assert 'docling_hybrid.backends.deepseek_mlx' not in sys.modules; "
+            "assert f._backend_class('deepseek-mlx').__name__ == 'DeepSeekMLXBackend'; "
+            "assert isinstance(f.BACKEND_REGISTRY['deepseek-mlx'], type)"
+        )
+
+        subprocess.run([sys.executable, "-c", code], check=True)
+    
+    @pytest.mark.parametrize(
+        "mlx_available, expected",
+        [(True, "deepseek-mlx"), (False, "deepseek-vllm")],
+    )
+    def test_resolve_auto_backend(self, mlx_available, expected):
+        """Test "auto" picks MLX only where it can run."""
+        with patch(
+            "docling_hybrid.backends.factory._mlx_available",
+            return_value=mlx_available,
+        ):
+            assert resolve_backend_name("auto") == expected
+            assert resolve_backend_name("AUTO") == expected
+        assert resolve_backend_name("nemotron-openrouter") == "nemotron-openrouter"
+    
+    def test_make_backend_auto(self, backend_config):
+        """Test "auto" creates the resolved backend under its own name."""
+        backend_config.name = "auto"
+        
+        with patch(
+            "docling_hybrid.backends.factory._mlx_available", return_value=True
+        ):
+            backend = make_backend(backend_config)
+        
+        assert isinstance(backend, DeepSeekMLXBackend)
+        assert backend.name == "deepseek-mlx"
+        assert backend_config.name == "auto"
     
     def test_make_backend_unknown(self, backend_config):
         """Test creating unknown backend raises error."""
@@ -113,6 +159,15 @@ class TestOpenRouterNemotronBackend:
         assert encoded.startswith("data:image/png;base64,")
         assert len(encoded) > 50
     
+    def test_encode_image_jpeg(self, with_api_key, backend_config):
+        """Test JPEG images get a JPEG data URL."""
+        backend_config.name = "nemotron-openrouter"
+        backend = OpenRouterNemotronBackend(backend_config)
+        
+        encoded = backend._encode_image(b"\xff\xd8\xff\xe0 jpeg data")
+        
+        assert encoded.startswith("data:image/jpeg;base64,")
+    
     def test_build_messages(self, with_api_key, backend_config, sample_image_bytes):
         """Test message building for API."""
         backend_config.name = "nemotron-openrouter"
@@ -126,6 +181,69 @@ class TestOpenRouterNemotronBackend:
         assert messages[0]["content"][0]["type"] == "text"
         assert messages[0]["content"][1]["type"] == "image_url"
     
+    def test_split_pages(self, with_api_key, backend_config):
+        """Test multi-page responses are split on their page markers."""
+        content = "## PAGE 3\n# Title\n\nText\n## PAGE 5\n\n## PAGE 4\nMore"
+
+        assert OpenRouterNemotronBackend._split_pages(content, [3, 4, 5]) == [
+            "# Title\n\nText",
+            "More",
+            "",
+        ]
+        assert OpenRouterNemotronBackend._split_pages(content, [3, 4]) is None
+        assert OpenRouterNemotronBackend._split_pages("# No markers", [1, 2]) is None
+
+    @pytest.mark.asyncio
+    async def test_pages_to_markdown_single_request(
+        self, with_api_key, backend_config, sample_image_bytes
+    ):
+        """Test several pages are sent as one message with one image each."""
+        backend = OpenRouterNemotronBackend(backend_config)
+        backend._post_chat = AsyncMock(return_value="## PAGE 1\nOne\n## PAGE 2\nTwo")
+
+        pages = await backend.pages_to_markdown(
+            [sample_image_bytes, sample_image_bytes], [1, 2], "doc-1"
+        )
+
+        assert pages == ["One", "Two"]
+        backend._post_chat.assert_awaited_once()
+        content = backend._post_chat.call_args.args[0][0]["content"]
+        assert [part["type"] for part in content] == ["text", "image_url", "image_url"]
+
+    @pytest.mark.asyncio
+    async def test_pages_to_markdown_falls_back_per_page(
+        self, with_api_key, backend_config, sample_image_bytes
+    ):
+        """Test a response without usable markers is redone page by page."""
+        backend = OpenRouterNemotronBackend(backend_config)
+        backend._post_chat = AsyncMock(side_effect=["no markers", "One", "Two"])
+
+        pages = await backend.pages_to_markdown(
+            [sample_image_bytes, sample_image_bytes], [1, 2], "doc-1"
+        )
+
+        assert pages == ["One", "Two"]
+        assert backend._post_chat.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_post_chat_splices_image_urls(
+        self, with_api_key, backend_config, sample_image_bytes
+    ):
+        """Test image data URLs are spliced into the serialized request body."""
+        backend = OpenRouterNemotronBackend(backend_config)
+        bodies = []
+
+        async def post_inner(body, context):
+            bodies.append(body)
+            return "# Page"
+
+        backend._post_chat_inner = post_inner
+        await backend.page_to_markdown(sample_image_bytes, 1, "doc-1")
+
+        payload = json.loads(bytes(bodies[0]))
+        url = payload["messages"][0]["content"][1]["image_url"]["url"]
+        assert url == backend._encode_image(sample_image_bytes)
+
     def test_extract_content_string(self, with_api_key, backend_config):
         """Test extracting string content from response."""
         backend_config.name = "nemotron-openrouter"
@@ -204,6 +322,124 @@ class TestDeepseekStubs:
             await backend.page_to_markdown(sample_image_bytes, 1, "doc-123")
 
 
+class TestDeepSeekVLLMReplicas:
+    """Tests for request dispatch across vLLM replicas."""
+
+    @pytest.mark.asyncio
+    async def test_requests_go_to_least_busy_endpoint(self, backend_config):
+        """Test in-flight requests are spread over base_url and replicas."""
+        backend_config.replica_urls = ["https://replica.test.com/v1/chat/completions"]
+        backend = DeepSeekVLLMBackend(backend_config)
+        release = asyncio.Event()
+        urls = []
+
+        class Response:
+            status = 200
+
+            async def __aenter__(self):
+                await release.wait()
+                return self
+
+            async def __aexit__(self, *exc_info):
+                return None
+
+            async def json(self, loads):
+                return {"choices": [{"message": {"content": "ok"}}]}
+
+        def post(url, **kwargs):
+            urls.append(url)
+            return Response()
+
+        session = MagicMock()
+        session.post = post
+        backend._get_session = AsyncMock(return_value=session)
+
+        tasks = [
+            asyncio.create_task(backend._post_chat_inner(b"{}", {})) for _ in range(4)
+        ]
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await asyncio.gather(*tasks) == ["ok"] * 4
+        assert urls == [
+            backend_config.base_url,
+            backend_config.replica_urls[0],
+        ] * 2
+        assert set(backend._in_flight.values()) == {0}
+
+    @pytest.mark.asyncio
+    async def test_failed_endpoint_cools_down_and_retry_moves_on(self, backend_config):
+        """Test a 5xx sends the retry, and later requests, to another endpoint."""
+        backend_config.replica_urls = ["https://replica.test.com/v1/chat/completions"]
+        backend_config.retry_initial_delay = 0.0
+        backend = DeepSeekVLLMBackend(backend_config)
+        urls = []
+
+        class Response:
+            def __init__(self, status):
+                self.status = status
+                self.content = MagicMock(read=AsyncMock(return_value=b"down"))
+
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, *exc_info):
+                return None
+
+            async def json(self, loads):
+                return {"choices": [{"message": {"content": "ok"}}]}
+
+        def post(url, **kwargs):
+            urls.append(url)
+            return Response(500 if url == backend_config.base_url else 200)
+
+        session = MagicMock()
+        session.post = post
+        backend._get_session = AsyncMock(return_value=session)
+
+        assert await backend._post_chat([{"role": "user", "content": "hi"}]) == "ok"
+        assert await backend._post_chat([{"role": "user", "content": "hi"}]) == "ok"
+        assert urls == [
+            backend_config.base_url,
+            backend_config.replica_urls[0],
+            backend_config.replica_urls[0],
+        ]
+
+    @pytest.mark.asyncio
+    async def test_health_check_probes_replicas(self, backend_config):
+        """Test health_check covers every endpoint and cools down failures."""
+        backend_config.replica_urls = ["https://replica.test.com/v1/chat/completions"]
+        backend = DeepSeekVLLMBackend(backend_config)
+        probed = []
+
+        class Response:
+            def __init__(self, status):
+                self.status = status
+
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, *exc_info):
+                return None
+
+        def get(url, **kwargs):
+            probed.append(url)
+            return Response(503 if "replica" in url else 200)
+
+        session = MagicMock()
+        session.get = get
+        backend._get_session = AsyncMock(return_value=session)
+
+        assert await backend.health_check() is True
+        assert probed == [
+            "https://api.test.com/v1/models",
+            "https://replica.test.com/v1/models",
+        ]
+        assert backend._pick_url() == backend_config.base_url
+        backend._in_flight[backend_config.base_url] = 5
+        assert backend._pick_url() == backend_config.base_url
+
+
 class TestBackendInterface:
     """Tests for backend interface contract."""
     
@@ -227,3 +463,41 @@ class TestBackendInterface:
         
         assert "OpenRouterNemotronBackend" in repr_str
         assert "nemotron-openrouter" in repr_str
+
+    @pytest.mark.asyncio
+    async def test_default_pages_to_markdown_runs_pages_concurrently(
+        self, backend_config, sample_image_bytes
+    ):
+        """Test the default bulk call overlaps pages and keeps their order."""
+        backend = DeepSeekVLLMBackend(backend_config)
+        started = []
+        all_started = asyncio.Event()
+
+        async def page_to_markdown(image_bytes, page_num, doc_id):
+            started.append(page_num)
+            if len(started) == 3:
+                all_started.set()
+            await all_started.wait()
+            return f"# Page {page_num}"
+
+        backend.page_to_markdown = page_to_markdown
+
+        pages = await asyncio.wait_for(
+            backend.pages_to_markdown([sample_image_bytes] * 3, [1, 2, 3], "doc-1"),
+            timeout=1,
+        )
+
+        assert pages == ["# Page 1", "# Page 2", "# Page 3"]
+
+    @pytest.mark.asyncio
+    async def test_default_pages_to_markdown_raises_page_error(
+        self, backend_config, sample_image_bytes
+    ):
+        """Test a failed page raises its own error, not an exception group."""
+        backend = DeepSeekVLLMBackend(backend_config)
+        backend.page_to_markdown = AsyncMock(
+            side_effect=["# Page 1", BackendError("boom", backend_name="test")]
+        )
+
+        with pytest.raises(BackendError, match="boom"):
+            await backend.pages_to_markdown([sample_image_bytes] * 2, [1, 2], "doc-1")
@@ -131,6 +131,24 @@ class TestModels:
         assert config.temperature == 0.0  # Default
         assert config.max_tokens == 8192  # Default
     
+    def test_ocr_backend_config_image_defaults(self):
+        """Test page images default to JPEG at the vision encoder size."""
+        config = OcrBackendConfig(
+            name="test",
+            model="test-model",
+            base_url="https://api.example.com",
+        )
+        assert config.vision_max_side == 1024
+        assert config.image_format == "jpeg"
+
+        with pytest.raises(ValueError):
+            OcrBackendConfig(
+                name="test",
+                model="test-model",
+                base_url="https://api.example.com",
+                image_format="gif",
+            )
+
     def test_ocr_backend_config_url_validation(self):
         """Test URL validation."""
         # Valid URLs
@@ -149,6 +167,24 @@ class TestModels:
                 model="test",
                 base_url="not-a-url",
             )
+
+    def test_ocr_backend_config_replica_urls_validation(self):
+        """Test replica URLs are validated like base_url."""
+        config = OcrBackendConfig(
+            name="test",
+            model="test",
+            base_url="http://gpu0:8000/v1/chat/completions",
+            replica_urls=["http://gpu1:8000/v1/chat/completions/"],
+        )
+        assert config.replica_urls == ["http://gpu1:8000/v1/chat/completions"]
+
+        with pytest.raises(ValueError):
+            OcrBackendConfig(
+                name="test",
+                model="test",
+                base_url="http://gpu0:8000",
+                replica_urls=["gpu1:8000"],
+            )
     
     def test_ocr_backend_config_temperature_range(self):
         """Test temperature validation."""
@@ -206,3 +242,66 @@ class TestModels:
                 content="test",
                 backend_name="test",
             )
+
+
+class TestLogging:
+    """Tests for logging configuration."""
+
+    def test_json_format_writes_one_json_object_per_event(self, capsys):
+        """Test JSON logs are valid JSON, including non-JSON values."""
+        import json
+        from pathlib import Path
+
+        from docling_hybrid.common.logging import get_logger, setup_logging
+
+        setup_logging(level="INFO", format="json")
+        try:
+            get_logger("test").info("page_ocr_completed", page_num=3, path=Path("a.pdf"))
+        finally:
+            setup_logging()
+
+        event = json.loads(capsys.readouterr().out.strip().splitlines()[-1])
+        assert event["event"] == "page_ocr_completed"
+        assert event["page_num"] == 3
+        assert "a.pdf" in event["path"]
+
+    def test_json_format_handles_non_string_keys(self, capsys):
+        """Test JSON logs render page-number keys and values orjson rejects."""
+        import json
+
+        from docling_hybrid.common.logging import get_logger, setup_logging
+
+        setup_logging(level="INFO", format="json")
+        try:
+            get_logger("test").info("pages_failed", errors={3: "timeout"})
+            get_logger("test").info("bytes_written", total=2**70)
+        finally:
+            setup_logging()
+
+        lines = capsys.readouterr().out.strip().splitlines()
+        assert json.loads(lines[-2])["errors"] == {"3": "timeout"}
+        assert json.loads(lines[-1])["total"] == 2**70
+
+    def test_events_below_level_are_dropped_before_rendering(self, capsys):
+        """Test disabled events never reach the processor chain."""
+        import structlog
+
+        from docling_hybrid.common.logging import get_logger, setup_logging
+
+        rendered = []
+
+        def spy(logger, method_name, event_dict):
+            rendered.append(event_dict["event"])
+            return event_dict
+
+        setup_logging(level="WARNING", format="json")
+        try:
+            processors = structlog.get_config()["processors"]
+            structlog.configure(processors=[processors[0], spy, *processors[1:]])
+            logger = get_logger("test")
+            logger.info("page_ocr_started")
+            logger.warning("page_ocr_slow")
+        finally:
+            setup_logging()
+
+        assert rendered == ["page_ocr_slow"]
@@ -1,6 +1,8 @@
 """Unit tests for the HybridPipeline orchestrator."""
 
 import asyncio
+import threading
+import time
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -77,6 +79,31 @@ class TestHybridPipelineInit:
 
         assert backend1 is backend2
 
+    def test_init_with_backend(self, test_config, mock_backend):
+        """Test a pre-built backend is used instead of the config default."""
+        pipeline = HybridPipeline(test_config, backend=mock_backend)
+
+        assert pipeline._get_backend() is mock_backend
+        assert pipeline._backend_name == "mock-backend"
+
+    def test_backends_share_rate_limiter(self, test_config, with_api_key):
+        """Test created backends get the pipeline's shared rate limiter."""
+        pipeline = HybridPipeline(test_config)
+
+        backend = pipeline._get_backend()
+
+        assert backend.rate_limiter is pipeline.rate_limiter
+
+    def test_in_flight_limit_covers_concurrent_documents(self, test_config):
+        """Test the default limiter allows page concurrency per document."""
+        page_concurrency = test_config.resources.page_concurrency
+
+        single = HybridPipeline(test_config)
+        batch = HybridPipeline(test_config, concurrent_documents=4)
+
+        assert single.rate_limiter.in_flight_limit == page_concurrency
+        assert batch.rate_limiter.in_flight_limit == 4 * page_concurrency
+
 
 class TestHybridPipelineProcessSinglePage:
     """Tests for _process_single_page method."""
@@ -199,9 +226,325 @@ class TestHybridPipelineConvertPdf:
         assert result.total_pages == 1
         assert result.processed_pages == 1
         assert len(result.page_results) == 1
+        assert result.page_results[0].content == ""
+        assert result.page_results[0].metadata["markdown_chars"] == len(
+            "# Mock Page\n\nContent here."
+        )
         assert result.markdown == "# Mock Page\n\nContent here."
         assert result.output_path.exists()
         mock_backend.page_to_markdown.assert_called_once()
+        assert "cache_hits" not in result.metadata
+
+        # The lazy read is cached and included in dumps
+        result.output_path.unlink()
+        assert result.model_dump()["markdown"] == "# Mock Page\n\nContent here."
+
+    @pytest.mark.asyncio
+    async def test_convert_pdf_reports_cache_counters(
+        self, test_config, sample_pdf_path, sample_image_bytes, mock_backend, tmp_path
+    ):
+        """Test cache hit/miss counts are reported for caching backends."""
+        from docling_hybrid.backends.cache import CachingBackend
+
+        backend = CachingBackend(mock_backend, cache_dir=tmp_path / "cache")
+        pipeline = HybridPipeline(test_config, backend=backend)
+
+        with patch(
+            "docling_hybrid.orchestrator.pipeline.get_page_count",
+            return_value=3,
+        ), patch(
+            "docling_hybrid.orchestrator.pipeline.render_page_to_png_bytes",
+            return_value=sample_image_bytes,
+        ):
+            result = await pipeline.convert_pdf(sample_pdf_path)
+
+        # All pages render identically, so they share one backend call
+        assert result.metadata["cache_hits"] == 2
+        assert result.metadata["cache_misses"] == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrent_conversions_report_their_own_cache_counters(
+        self, test_config, sample_pdf_path, sample_image_bytes, mock_backend, tmp_path
+    ):
+        """Test cache counts are not mixed between documents converted at once."""
+        from docling_hybrid.backends.cache import CachingBackend
+
+        backend = CachingBackend(mock_backend, cache_dir=tmp_path / "cache")
+        pipeline = HybridPipeline(test_config, backend=backend)
+        await backend.page_to_markdown(b"warm", 1, "doc-warm")
+        assert backend.pop_doc_counts("doc-warm") == (0, 1)
+
+        def render(pdf_path, page_index, **kwargs):
+            return b"warm" if "warm" in str(pdf_path) else sample_image_bytes
+
+        warm_pdf = tmp_path / "warm.pdf"
+        warm_pdf.write_bytes(sample_pdf_path.read_bytes())
+        with patch(
+            "docling_hybrid.orchestrator.pipeline.get_page_count",
+            return_value=3,
+        ), patch(
+            "docling_hybrid.orchestrator.pipeline.render_page_to_png_bytes",
+            side_effect=render,
+        ):
+            cold, warm = await asyncio.gather(
+                pipeline.convert_pdf(sample_pdf_path, output_path=tmp_path / "cold.md"),
+                pipeline.convert_pdf(warm_pdf, output_path=tmp_path / "warm.md"),
+            )
+
+        assert (cold.metadata["cache_hits"], cold.metadata["cache_misses"]) == (2, 1)
+        assert (warm.metadata["cache_hits"], warm.metadata["cache_misses"]) == (3, 0)
+        assert not backend._doc_counts
+
+    @pytest.mark.asyncio
+    async def test_convert_pdf_text_layer_skips_ocr(
+        self, test_config, sample_pdf_path, mock_backend
+    ):
+        """Test born-digital pages use the text layer instead of the backend."""
+        from docling_hybrid.renderer.textlayer import TextLayer
+
+        pipeline = HybridPipeline(test_config, backend=mock_backend)
+        layer = TextLayer(text="Born-digital text. " * 20, page_area=1.0, image_coverage=0.0)
+
+        with patch(
+            "docling_hybrid.orchestrator.pipeline.get_page_count",
+            return_value=2,
+        ), patch(
+            "docling_hybrid.orchestrator.pipeline.extract_text_layer",
+            return_value=layer,
+        ), patch(
+            "docling_hybrid.orchestrator.pipeline.render_page_to_png_bytes",
+        ) as mock_render:
+            result = await pipeline.convert_pdf(sample_pdf_path)
+
+        assert result.processed_pages == 2
+        assert result.metadata["text_layer_pages"] == 2
+        assert result.page_results[0].metadata["source"] == "text_layer"
+        assert "Born-digital text." in result.markdown
+        mock_render.assert_not_called()
+        mock_backend.page_to_markdown.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_convert_pdf_force_ocr(
+        self, test_config, sample_pdf_path, sample_image_bytes, mock_backend
+    ):
+        """Test force_ocr sends born-digital pages to the backend."""
+        pipeline = HybridPipeline(test_config, backend=mock_backend)
+
+        with patch(
+            "docling_hybrid.orchestrator.pipeline.get_page_count",
+            return_value=1,
+        ), patch(
+            "docling_hybrid.orchestrator.pipeline.extract_text_layer",
+        ) as mock_extract, patch(
+            "docling_hybrid.orchestrator.pipeline.render_page_to_png_bytes",
+            return_value=sample_image_bytes,
+        ):
+            result = await pipeline.convert_pdf(
+                sample_pdf_path, options=ConversionOptions(force_ocr=True)
+            )
+
+        assert result.metadata["text_layer_pages"] == 0
+        mock_extract.assert_not_called()
+        mock_backend.page_to_markdown.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_convert_pdf_render_process_pool(self, test_config, tmp_path, mock_backend):
+        """Test pages rendered in worker processes reach the backend as PNGs."""
+        try:
+            from reportlab.pdfgen import canvas
+        except ImportError:
+            pytest.skip("reportlab not available for PDF generation")
+
+        pdf_path = tmp_path / "scanned.pdf"
+        c = canvas.Canvas(str(pdf_path))
+        c.rect(100, 100, 200, 200, fill=1)
+        c.showPage()
+        c.rect(50, 50, 100, 100, fill=1)
+        c.showPage()
+        c.save()
+
+        test_config.resources.render_processes = 1
+        async with HybridPipeline(test_config, backend=mock_backend) as pipeline:
+            result = await pipeline.convert_pdf(pdf_path)
+            assert pipeline._render_pool is not None
+
+        assert result.processed_pages == 2
+        for call in mock_backend.page_to_markdown.call_args_list:
+            assert bytes(call.kwargs["image_bytes"]).startswith(b"\x89PNG")
+
+    @pytest.mark.asyncio
+    async def test_convert_pdf_accepts_open_handle(self, test_config, tmp_path, mock_backend):
+        """Test a PdfHandle is converted like its path and left open."""
+        try:
+            from reportlab.pdfgen import canvas
+        except ImportError:
+            pytest.skip("reportlab not available for PDF generation")
+
+        from docling_hybrid.renderer import open_pdf
+
+        pdf_path = tmp_path / "scanned.pdf"
+        c = canvas.Canvas(str(pdf_path))
+        c.rect(100, 100, 200, 200, fill=1)
+        c.showPage()
+        c.rect(50, 50, 100, 100, fill=1)
+        c.showPage()
+        c.save()
+
+        async with HybridPipeline(test_config, backend=mock_backend) as pipeline:
+            with open_pdf(pdf_path) as pdf:
+                result = await pipeline.convert_pdf(pdf)
+                assert len(pdf) == 2  # Still open
+
+        assert result.processed_pages == 2
+        assert result.source_path == pdf_path
+        assert result.output_path.parent == tmp_path
+        assert mock_backend.page_to_markdown.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_cancelled_conversion_waits_for_pdfium_calls(
+        self, test_config, sample_pdf_path, sample_image_bytes, mock_backend
+    ):
+        """Test renders still running are done before a handle is returned."""
+        from docling_hybrid.renderer import open_pdf
+
+        threads = []
+        finished = threading.Event()
+
+        def page_count(pdf):
+            threads.append(threading.current_thread().name)
+            return 1
+
+        def slow_render(**kwargs):
+            time.sleep(0.2)
+            finished.set()
+            return sample_image_bytes
+
+        async with HybridPipeline(test_config, backend=mock_backend) as pipeline:
+            with patch(
+                "docling_hybrid.orchestrator.pipeline.get_page_count",
+                side_effect=page_count,
+            ), patch(
+                "docling_hybrid.orchestrator.pipeline.render_page_to_png_bytes",
+                side_effect=slow_render,
+            ), open_pdf(sample_pdf_path) as pdf:
+                task = asyncio.create_task(
+                    pipeline.convert_pdf(pdf, options=ConversionOptions(force_ocr=True))
+                )
+                await asyncio.sleep(0.05)
+                task.cancel()
+                with pytest.raises(asyncio.CancelledError):
+                    await task
+
+                assert finished.is_set()
+
+        assert threads[0].startswith("pdfium")
+
+    @pytest.mark.asyncio
+    async def test_convert_pdf_reuses_rendered_pages(
+        self, test_config, sample_pdf_path, sample_image_bytes, mock_backend
+    ):
+        """Test pages from render_pages are not rendered again."""
+        pipeline = HybridPipeline(test_config, backend=mock_backend)
+
+        with patch(
+            "docling_hybrid.orchestrator.pipeline.get_page_count",
+            return_value=3,
+        ), patch(
+            "docling_hybrid.orchestrator.pipeline.render_page_to_png_bytes",
+            return_value=sample_image_bytes,
+        ) as render:
+            pages = await pipeline.render_pages(sample_pdf_path)
+            first = await pipeline.convert_pdf(sample_pdf_path, rendered_pages=pages)
+            second = await pipeline.convert_pdf(sample_pdf_path, rendered_pages=pages)
+
+        assert render.call_count == 3
+        assert first.processed_pages == second.processed_pages == 3
+        for call in mock_backend.page_to_markdown.call_args_list:
+            assert bytes(call.kwargs["image_bytes"]) == sample_image_bytes
+
+    @pytest.mark.asyncio
+    async def test_convert_pdf_ignores_rendered_pages_at_other_dpi(
+        self, test_config, sample_pdf_path, sample_image_bytes, mock_backend
+    ):
+        """Test pages rendered at a different DPI are rendered again."""
+        pipeline = HybridPipeline(test_config, backend=mock_backend)
+
+        with patch(
+            "docling_hybrid.orchestrator.pipeline.get_page_count",
+            return_value=2,
+        ), patch(
+            "docling_hybrid.orchestrator.pipeline.render_page_to_png_bytes",
+            return_value=sample_image_bytes,
+        ) as render:
+            pages = await pipeline.render_pages(
+                sample_pdf_path, options=ConversionOptions(dpi=72)
+            )
+            await pipeline.convert_pdf(
+                sample_pdf_path,
+                options=ConversionOptions(dpi=144),
+                rendered_pages=pages,
+            )
+
+        assert render.call_count == 4
+
+    @pytest.mark.asyncio
+    async def test_convert_pdf_ignores_rendered_pages_of_other_source_or_format(
+        self, test_config, sample_pdf_path, sample_image_bytes, mock_backend, tmp_path
+    ):
+        """Test pages of another file, or for another image format, are not reused."""
+        pipeline = HybridPipeline(test_config, backend=mock_backend)
+        other_pdf = tmp_path / "other.pdf"
+        other_pdf.write_bytes(sample_pdf_path.read_bytes())
+
+        with patch(
+            "docling_hybrid.orchestrator.pipeline.get_page_count",
+            return_value=2,
+        ), patch(
+            "docling_hybrid.orchestrator.pipeline.render_page_to_png_bytes",
+            return_value=sample_image_bytes,
+        ) as render:
+            pages = await pipeline.render_pages(other_pdf)
+            await pipeline.convert_pdf(sample_pdf_path, rendered_pages=pages)
+            assert render.call_count == 4
+
+            pages = await pipeline.render_pages(sample_pdf_path)
+            pages.image_format = "jpeg"
+            await pipeline.convert_pdf(sample_pdf_path, rendered_pages=pages)
+            assert render.call_count == 8
+
+        assert pages.matches(sample_pdf_path, pages.dpi, pages.max_side, "jpeg")
+
+    @pytest.mark.asyncio
+    async def test_convert_pdf_streams_pages_in_order(
+        self, test_config, sample_pdf_path, sample_image_bytes, mock_backend
+    ):
+        """Test pages finishing out of order are written in page order."""
+        test_config.resources.max_workers = 4
+        pipeline = HybridPipeline(test_config, backend=mock_backend)
+
+        async def reverse_delay(image_bytes, page_num, doc_id):
+            await asyncio.sleep(0.01 * (5 - page_num))
+            return f"# Page {page_num}"
+
+        mock_backend.page_to_markdown.side_effect = reverse_delay
+
+        with patch(
+            "docling_hybrid.orchestrator.pipeline.get_page_count",
+            return_value=4,
+        ), patch(
+            "docling_hybrid.orchestrator.pipeline.render_page_to_png_bytes",
+            return_value=sample_image_bytes,
+        ):
+            result = await pipeline.convert_pdf(
+                sample_pdf_path, options=ConversionOptions(add_page_separators=False)
+            )
+
+        expected = "# Page 1\n\n# Page 2\n\n# Page 3\n\n# Page 4"
+        assert result.output_path.read_text(encoding="utf-8") == expected
+        assert result.preview == expected
+        assert result._markdown is None  # Not held in memory
+        assert result.markdown == expected
+        assert [r.page_num for r in result.page_results] == [1, 2, 3, 4]
 
     @pytest.mark.asyncio
     async def test_convert_pdf_multiple_pages(
@@ -382,6 +725,72 @@ class TestHybridPipelineConvertPdf:
         # With max_workers=1, we should never have more than 1 concurrent execution
         assert max_concurrent <= 1, "Semaphore should limit concurrency"
 
+    @pytest.mark.asyncio
+    async def test_convert_pdf_max_page_concurrency(
+        self, test_config, sample_pdf_path, sample_image_bytes, mock_backend
+    ):
+        """Test max_page_concurrency overrides max_workers for backend calls."""
+        test_config.resources.max_workers = 1
+        test_config.resources.max_page_concurrency = 3
+        pipeline = HybridPipeline(test_config, backend=mock_backend)
+
+        concurrent_count = 0
+        max_concurrent = 0
+
+        async def track_concurrency(image_bytes, page_num, doc_id):
+            nonlocal concurrent_count, max_concurrent
+            concurrent_count += 1
+            max_concurrent = max(max_concurrent, concurrent_count)
+            await asyncio.sleep(0.02)
+            concurrent_count -= 1
+            return f"# Page {page_num}"
+
+        mock_backend.page_to_markdown.side_effect = track_concurrency
+
+        with patch(
+            "docling_hybrid.orchestrator.pipeline.get_page_count",
+            return_value=6,
+        ), patch(
+            "docling_hybrid.orchestrator.pipeline.render_page_to_png_bytes",
+            return_value=sample_image_bytes,
+        ):
+            result = await pipeline.convert_pdf(sample_pdf_path)
+
+        assert result.processed_pages == 6
+        assert max_concurrent == 3
+
+    @pytest.mark.asyncio
+    async def test_convert_pdf_batches_pages_per_request(
+        self, test_config, sample_pdf_path, sample_image_bytes, mock_backend
+    ):
+        """Test backends with multi-page support get pages in batches."""
+        test_config.resources.max_page_concurrency = 2
+        test_config.resources.pages_per_request = 2
+        mock_backend.supports_document_processing = True
+
+        async def pages_to_markdown(images, page_nums, doc_id):
+            return [f"# Page {n}" for n in page_nums]
+
+        mock_backend.pages_to_markdown = AsyncMock(side_effect=pages_to_markdown)
+        pipeline = HybridPipeline(test_config, backend=mock_backend)
+
+        with patch(
+            "docling_hybrid.orchestrator.pipeline.get_page_count",
+            return_value=4,
+        ), patch(
+            "docling_hybrid.orchestrator.pipeline.render_page_to_png_bytes",
+            return_value=sample_image_bytes,
+        ):
+            result = await pipeline.convert_pdf(
+                sample_pdf_path, options=ConversionOptions(add_page_separators=False)
+            )
+
+        assert result.markdown == "# Page 1\n\n# Page 2\n\n# Page 3\n\n# Page 4"
+        mock_backend.page_to_markdown.assert_not_called()
+        batches = [c.args[1] for c in mock_backend.pages_to_markdown.call_args_list]
+        assert sorted(n for batch in batches for n in batch) == [1, 2, 3, 4]
+        assert all(len(batch) == 2 for batch in batches)
+
     @pytest.mark.asyncio
     async def test_convert_pdf_custom_output_path(
         self, test_config, sample_pdf_path, tmp_path, sample_image_bytes, mock_backend
@@ -20,9 +20,12 @@ from docling_hybrid.renderer.core import (
     PdfRenderer,
     get_page_count,
     render_page_to_png_bytes,
+    render_page_worker,
     render_pdf_pages,
     render_region_to_png_bytes,
 )
+from docling_hybrid.renderer.handle import open_pdf
+from docling_hybrid.renderer.pages import RenderedPages
 
 
 # ============================================================================
@@ -131,6 +134,25 @@ def test_render_page_basic(sample_pdf_path):
     assert image.size[1] > 0
 
 
+def test_render_page_max_side_jpeg(sample_pdf_path):
+    """Test rendering capped to the vision encoder size as JPEG."""
+    image_bytes = render_page_to_png_bytes(
+        sample_pdf_path, 0, dpi=300, max_side=1024, image_format="jpeg"
+    )
+
+    image = Image.open(io.BytesIO(image_bytes))
+    assert image.format == "JPEG"
+    assert max(image.size) == 1024
+
+
+def test_render_page_max_side_does_not_upscale(sample_pdf_path):
+    """Test max_side never renders above the requested DPI."""
+    image_bytes = render_page_to_png_bytes(sample_pdf_path, 0, dpi=72, max_side=4096)
+
+    image = Image.open(io.BytesIO(image_bytes))
+    assert max(image.size) == 792  # Letter height at 72 DPI
+
+
 def test_render_page_different_dpi(sample_pdf_path):
     """Test rendering at different DPI values."""
     # Low DPI
@@ -331,6 +353,92 @@ def test_render_pdf_pages_auto_cleanup(multipage_pdf_path):
     assert len(images) == 1
 
 
+# ============================================================================
+# Tests: render_page_worker
+# ============================================================================
+
+
+def test_render_page_worker_matches_single_render(multipage_pdf_path):
+    """Test worker rendering produces the same PNG as single-page rendering."""
+    mtime = multipage_pdf_path.stat().st_mtime
+
+    for page_index in range(3):
+        worker_bytes = render_page_worker(str(multipage_pdf_path), mtime, page_index, dpi=72)
+        assert worker_bytes == render_page_to_png_bytes(multipage_pdf_path, page_index, dpi=72)
+
+
+def test_render_page_worker_reuses_document(multipage_pdf_path):
+    """Test the worker keeps the document open between calls."""
+    from docling_hybrid.renderer import core
+
+    mtime = multipage_pdf_path.stat().st_mtime
+    render_page_worker(str(multipage_pdf_path), mtime, 0, dpi=72)
+    renderer = core._worker_renderer[1]
+
+    render_page_worker(str(multipage_pdf_path), mtime, 1, dpi=72)
+    assert core._worker_renderer[1] is renderer
+
+    # A changed mtime reopens the file
+    render_page_worker(str(multipage_pdf_path), mtime + 1, 1, dpi=72)
+    assert core._worker_renderer[1] is not renderer
+
+
+# ============================================================================
+# Tests: open_pdf / PdfHandle
+# ============================================================================
+
+
+def test_open_pdf_handle_page_count(multipage_pdf_path):
+    """Test a handle reports the same page count as the path."""
+    with open_pdf(multipage_pdf_path) as pdf:
+        assert len(pdf) == 3
+        assert get_page_count(pdf) == 3
+        assert pdf.name == multipage_pdf_path.name
+
+
+def test_open_pdf_handle_renders_same_bytes(multipage_pdf_path):
+    """Test rendering from a handle matches rendering from the path."""
+    with open_pdf(multipage_pdf_path) as pdf:
+        for page_index in range(3):
+            assert render_page_to_png_bytes(pdf, page_index, dpi=72) == (
+                render_page_to_png_bytes(multipage_pdf_path, page_index, dpi=72)
+            )
+
+
+def test_open_pdf_handle_stays_open_after_render(sample_pdf_path):
+    """Test rendering from a handle does not close the caller's document."""
+    with open_pdf(sample_pdf_path) as pdf:
+        render_page_to_png_bytes(pdf, 0, dpi=72)
+        with pytest.raises(ValidationError):
+            render_page_to_png_bytes(pdf, 5, dpi=72)
+        # Still usable after both a successful and a failed call
+        assert render_page_to_png_bytes(pdf, 0, dpi=72)
+
+
+def test_open_pdf_nonexistent_file(nonexistent_pdf_path):
+    """Test opening a missing file raises ValidationError."""
+    with pytest.raises(ValidationError):
+        with open_pdf(nonexistent_pdf_path):
+            pass
+
+
+def test_rendered_pages_store_and_view(multipage_pdf_path):
+    """Test rendered pages are stored contiguously and read back exactly."""
+    images = render_pdf_pages(multipage_pdf_path, dpi=72)
+    pages = RenderedPages(dpi=72)
+    for image in images:
+        pages.append(image)
+
+    assert len(pages) == len(images)
+    assert pages.nbytes == sum(len(image) for image in images)
+    for page_idx, image in enumerate(images):
+        view = pages[page_idx]
+        assert view.readonly
+        assert bytes(view) == image
+    with pytest.raises(IndexError):
+        pages[len(images)]
+
+
 # ============================================================================
 # Tests: render_region_to_png_bytes
 # ============================================================================
@@ -0,0 +1,175 @@
+"""Unit tests for text layer extraction.
+
+Tests cover:
+- Text extraction from born-digital pages
+- Usability thresholds (text length, image coverage)
+- Markdown paragraph grouping
+- Error handling
+"""
+
+from pathlib import Path
+
+import pytest
+
+from docling_hybrid.common.errors import ValidationError
+from docling_hybrid.renderer.textlayer import (
+    TextLayer,
+    extract_text_layer,
+    text_layer_to_markdown,
+)
+
+
+# ============================================================================
+# Fixtures
+# ============================================================================
+
+
+@pytest.fixture
+def text_pdf_path(tmp_path: Path) -> Path:
+    """Create a PDF with a page of text and a blank page."""
+    try:
+        from reportlab.lib.pagesizes import letter
+        from reportlab.pdfgen import canvas
+    except ImportError:
+        pytest.skip("reportlab not available for PDF generation")
+
+    pdf_path = tmp_path / "text_document.pdf"
+    c = canvas.Canvas(str(pdf_path), pagesize=letter)
+
+    y = 750
+    for i in range(20):
+        c.drawString(72, y, f"Line {i} of a born-digital page with extractable text.")
+        y -= 14
+    c.showPage()
+
+    # Blank page (no text layer)
+    c.showPage()
+
+    c.save()
+    return pdf_path
+
+
+# ============================================================================
+# Extraction Tests
+# ============================================================================
+
+
+def test_extract_text_layer(text_pdf_path):
+    """Test text is extracted from a born-digital page."""
+    layer = extract_text_layer(text_pdf_path, 0)
+
+    assert "Line 0 of a born-digital page" in layer.text
+    assert layer.char_count > 200
+    assert layer.image_coverage == 0.0
+    assert layer.is_usable()
+
+
+def test_extract_text_layer_blank_page(text_pdf_path):
+    """Test a page without text is not usable."""
+    layer = extract_text_layer(text_pdf_path, 1)
+
+    assert layer.char_count == 0
+    assert not layer.is_usable()
+
+
+def test_extract_text_layer_invalid_page(text_pdf_path):
+    """Test out-of-range page index raises ValidationError."""
+    with pytest.raises(ValidationError):
+        extract_text_layer(text_pdf_path, 5)
+
+
+def test_extract_text_layer_nonexistent_file(tmp_path):
+    """Test missing file raises ValidationError."""
+    with pytest.raises(ValidationError):
+        extract_text_layer(tmp_path / "missing.pdf", 0)
+
+
+@pytest.fixture
+def image_pdf_path(tmp_path: Path) -> Path:
+    """Create a PDF whose page is covered by an image plus a text layer."""
+    try:
+        from reportlab.lib.pagesizes import letter
+        from reportlab.lib.utils import ImageReader
+        from reportlab.pdfgen import canvas
+    except ImportError:
+        pytest.skip("reportlab not available for PDF generation")
+    from PIL import Image
+
+    pdf_path = tmp_path / "scanned.pdf"
+    c = canvas.Canvas(str(pdf_path), pagesize=letter)
+    c.drawImage(ImageReader(Image.new("RGB", (50, 50), "white")), 0, 0, 612, 792)
+    y = 750
+    for i in range(20):
+        c.drawString(72, y, f"Line {i} of an OCR layer over a full-page scan.")
+        y -= 14
+    c.showPage()
+    c.save()
+    return pdf_path
+
+
+def test_extract_text_layer_measures_image_coverage(image_pdf_path):
+    """Test a full-page image is detected and makes the page unusable."""
+    layer = extract_text_layer(image_pdf_path, 0)
+
+    assert layer.image_coverage == pytest.approx(1.0)
+    assert not layer.is_usable()
+
+
+def test_extract_text_layer_skips_image_scan_below_min_chars(image_pdf_path):
+    """Test the image scan is skipped when the text cannot qualify anyway."""
+    layer = extract_text_layer(image_pdf_path, 0, min_chars=100_000)
+
+    assert layer.image_coverage == 0.0
+    assert not layer.is_usable(min_chars=100_000)
+
+
+def test_is_usable_rejects_graphics_heavy_page():
+    """Test pages with many drawables and little text go to the VLM."""
+    layer = TextLayer(text="x" * 500, page_area=100.0, image_coverage=0.0, object_count=50_000)
+
+    assert layer.graphics_heavy
+    assert not layer.is_usable()
+
+    layer = TextLayer(text="x" * 5000, page_area=100.0, image_coverage=0.0, object_count=50_000)
+    assert not layer.graphics_heavy
+
+
+def test_is_usable_rejects_full_page_image():
+    """Test scanned pages with a hidden OCR layer still go to the VLM."""
+    layer = TextLayer(text="x" * 500, page_area=100.0, image_coverage=0.9)
+
+    assert not layer.is_usable()
+    assert layer.is_usable(max_image_coverage=1.0)
+
+
+# ============================================================================
+# Markdown Tests
+# ============================================================================
+
+
+def test_text_layer_to_markdown_groups_paragraphs():
+    """Test wrapped lines are joined and short lines end paragraphs."""
+    text = (
+        "The first paragraph spans more than one\r\n"
+        "line of text.\r\n"
+        "A second paragraph follows right after.\r\n"
+    )
+
+    assert text_layer_to_markdown(text) == (
+        "The first paragraph spans more than one line of text."
+        "\n\nA second paragraph follows right after."
+    )
+
+
+def test_text_layer_to_markdown_rejoins_hyphenation():
+    """Test words hyphenated across lines are rejoined."""
+    text = "A sentence with a hyphen-\nated word in the middle of it."
+
+    assert text_layer_to_markdown(text) == (
+        "A sentence with a hyphenated word in the middle of it."
+    )
+
+
+def test_text_layer_to_markdown_empty():
+    """Test empty text yields empty Markdown."""
+    assert text_layer_to_markdown("") == ""
@@ -49,7 +49,8 @@ def create_mock_aiohttp_response(
     """Create a mock aiohttp response object.
 
     Creates a properly configured mock that can be used as an async context
-    manager, with json() and text() methods that return AsyncMocks.
+    manager, with json() and text() methods and a content stream whose
+    read() returns the text data.
 
     Args:
         status: HTTP status code (default: 200)
@@ -78,9 +79,11 @@ def create_mock_aiohttp_response(
     if json_data is not None:
         mock_response.json = AsyncMock(return_value=json_data)
 
-    # Add text() method
+    # Add text() method, and the content stream error paths read from
     if text_data is not None:
         mock_response.text = AsyncMock(return_value=text_data)
+        mock_response.content = MagicMock()
+        mock_response.content.read = AsyncMock(return_value=text_data.encode("utf-8"))
 
     return mock_response
 